@@ -381,7 +381,7 @@ async def get_available_modules(tier: TierLevel = Depends(get_current_tier)):
             pattern_count = 0
             if module_def.id in module_loader.loaded_modules:
                 loaded_module = module_loader.loaded_modules[module_def.id]
-                pattern_count = len(loaded_module.patterns)
+                pattern_count = loaded_module.pattern_count
             
             module_info.append(ModuleInfo(
                 id=module_def.id,
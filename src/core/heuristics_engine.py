@@ -84,7 +84,7 @@ class ProcessingResult:
     tier_level: TierLevel
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
-@dataclass
+@dataclass(slots=True)
 class PatternDefinition:
     """Pattern definition with metadata"""
     id: str
@@ -23,12 +23,48 @@ import subprocess
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field, asdict
 from enum import Enum
+from operator import itemgetter
+
+# Optional NumPy import for batch cost estimation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Bit index per compliance tag; profile/requirement overlap is a popcount of ANDed masks
+_COMPLIANCE_BITS: Dict[str, int] = {
+    tag: bit for bit, tag in enumerate([
+        'GDPR', 'CCPA', 'SOX', 'HIPAA', 'HITECH', 'PCI_DSS',
+        'BASEL_III', 'FISMA', 'FedRAMP', 'NIST', 'SOC2'
+    ])
+}
+
+def _compliance_mask(requirements: List[str], register: bool = False) -> int:
+    """Pack compliance tags into an integer bitmask"""
+    mask = 0
+    for requirement in requirements:
+        bit = _COMPLIANCE_BITS.get(requirement)
+        if bit is None:
+            if not register:
+                continue
+            bit = _COMPLIANCE_BITS[requirement] = len(_COMPLIANCE_BITS)
+        mask |= 1 << bit
+    return mask
+
+def _copy_manifest(value: Any) -> Any:
+    """Copy the dict/list skeleton of a manifest; leaves are immutable"""
+    if isinstance(value, dict):
+        return {key: _copy_manifest(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_manifest(item) for item in value]
+    return value
+
 class DeploymentMode(Enum):
     """Supported deployment modes"""
     ON_PREMISE = "on_premise"
@@ -46,9 +82,14 @@ class SecurityProfile(Enum):
     HEALTHCARE = "healthcare"
     AIR_GAPPED = "air_gapped"
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
-    """User profile with infrastructure requirements"""
+    """User profile with infrastructure requirements
+    
+    InfrastructureManager caches manifests, estimates and compliance bits per
+    profile, so treat a registered profile as read-only and replace it through
+    create_user_profile instead of editing it in place.
+    """
     profile_id: str
     organization: str
     deployment_mode: DeploymentMode
@@ -63,6 +104,21 @@ class UserProfile:
     backup_requirements: Dict[str, Any]
     created_at: str
     last_updated: str
+    _compliance_bits: int = field(default=0, init=False, repr=False, compare=False)
+    _cached_cost_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_time_dict: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Profiles may introduce tags outside the known set, so register them
+        self._compliance_bits = _compliance_mask(self.compliance_requirements, register=True)
+
+@dataclass(frozen=True, slots=True)
+class RecommendationRequest:
+    """Deployment recommendation criteria (normalized from the legacy requirements dict)"""
+    organization_size: str = 'small'
+    compliance_requirements: Tuple[str, ...] = ()
+    security_level: str = 'standard'
+    budget_range: str = 'low'
 
 @dataclass
 class InfrastructureConfig:
@@ -88,6 +144,13 @@ class InfrastructureManager:
         self.user_profiles: Dict[str, UserProfile] = {}
         self.infrastructure_configs: Dict[str, InfrastructureConfig] = {}
         
+        # Manifest cache keyed by profile_id, invalidated via per-profile version
+        self._manifest_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._profile_version: Dict[str, int] = {}
+        
+        # Column view of profiles for batch scoring, rebuilt lazily after mutations
+        self._score_columns: Optional[Tuple[Any, ...]] = None
+        
         # Load configuration
         self.load_configuration()
         
@@ -195,11 +258,41 @@ class InfrastructureManager:
             )
         }
         
+        self._touch_profiles(list(self.user_profiles))
+        
         # Create infrastructure configs for each deployment mode
         self._create_infrastructure_configs()
     
+    def _touch_profile(self, profile_id: str):
+        """Record a profile mutation so cached manifests and estimates are regenerated"""
+        self._touch_profiles([profile_id])
+    
+    def _touch_profiles(self, profile_ids: List[str]):
+        """Record mutations for several profiles and re-estimate them in one batch"""
+        for profile_id in profile_ids:
+            self._profile_version[profile_id] = self._profile_version.get(profile_id, 0) + 1
+            self._manifest_cache.pop(profile_id, None)
+            profile = self.user_profiles[profile_id]
+            profile._compliance_bits = _compliance_mask(profile.compliance_requirements, register=True)
+        self._score_columns = None
+        self._recompute_cached_estimates([self.user_profiles[pid] for pid in profile_ids])
+    
+    def _recompute_cached_estimates(self, profiles: List[UserProfile]):
+        """Store cost/time estimates on the profiles; they depend only on the profile"""
+        costs = self._batch_estimate_costs(profiles)
+        for profile, (setup_cost, monthly_cost, annual_cost) in zip(profiles, costs):
+            profile._cached_cost_dict = {
+                'setup_cost': setup_cost,
+                'monthly_cost': monthly_cost,
+                'annual_cost': annual_cost,
+                'currency': 'USD'
+            }
+            profile._cached_time_dict = self._estimate_deployment_time(profile)
+    
     def _create_infrastructure_configs(self):
         """Create infrastructure configurations for each deployment mode"""
+        # Manifests embed the infrastructure config, so drop every cached one
+        self._manifest_cache.clear()
         
         # On-Premise Configuration
         self.infrastructure_configs['on_premise'] = InfrastructureConfig(
@@ -389,6 +482,7 @@ class InfrastructureManager:
         )
         
         self.user_profiles[profile.profile_id] = profile
+        self._touch_profile(profile.profile_id)
         return profile
     
     def get_infrastructure_config(self, deployment_mode: DeploymentMode) -> Optional[InfrastructureConfig]:
@@ -396,11 +490,24 @@ class InfrastructureManager:
         return self.infrastructure_configs.get(deployment_mode.value)
     
     def generate_deployment_manifest(self, profile_id: str) -> Dict[str, Any]:
-        """Generate deployment manifest for user profile"""
+        """Generate deployment manifest for user profile (cached until the profile changes)"""
         profile = self.get_user_profile(profile_id)
         if not profile:
             raise ValueError(f"Profile {profile_id} not found")
         
+        version = self._profile_version.get(profile_id, 0)
+        cached = self._manifest_cache.get(profile_id)
+        if cached is None or cached[0] != version:
+            cached = self._manifest_cache[profile_id] = (version, self._build_deployment_manifest(profile))
+        
+        # Callers are free to mutate the result, so hand out a private copy,
+        # stamped with this call's time rather than the cached build's
+        manifest = _copy_manifest(cached[1])
+        manifest['metadata']['generated_at'] = datetime.now().isoformat()
+        return manifest
+    
+    def _build_deployment_manifest(self, profile: UserProfile) -> Dict[str, Any]:
+        """Build a fresh deployment manifest for a profile"""
         config = self.get_infrastructure_config(profile.deployment_mode)
         if not config:
             raise ValueError(f"No infrastructure config for {profile.deployment_mode}")
@@ -721,40 +828,114 @@ class InfrastructureManager:
         """List available user profiles"""
         return list(self.user_profiles.keys())
     
-    def get_deployment_recommendations(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _normalize_requirements(self, requirements: Union[RecommendationRequest, Dict[str, Any]]) -> RecommendationRequest:
+        """Convert a legacy requirements dict into a RecommendationRequest"""
+        if isinstance(requirements, RecommendationRequest):
+            return requirements
+        return RecommendationRequest(
+            organization_size=requirements.get('organization_size', 'small'),
+            compliance_requirements=tuple(requirements.get('compliance_requirements', ())),
+            security_level=requirements.get('security_level', 'standard'),
+            budget_range=requirements.get('budget_range', 'low')
+        )
+    
+    def get_deployment_recommendations(self, requirements: Union[RecommendationRequest, Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Get deployment recommendations based on requirements"""
         recommendations = []
         
-        # Analyze requirements and suggest appropriate profiles
-        org_size = requirements.get('organization_size', 'small')
-        compliance_needs = requirements.get('compliance_requirements', [])
-        security_level = requirements.get('security_level', 'standard')
-        budget_range = requirements.get('budget_range', 'low')
-        
-        # Generate recommendations based on criteria
-        for profile_id, profile in self.user_profiles.items():
-            score = self._calculate_recommendation_score(profile, requirements)
-            if score > 0.6:  # 60% match threshold
-                recommendations.append({
-                    'profile_id': profile_id,
-                    'score': score,
-                    'profile': profile,
-                    'estimated_cost': self._estimate_deployment_cost(profile),
-                    'deployment_time': self._estimate_deployment_time(profile)
-                })
+        # Analyze requirements once and suggest appropriate profiles
+        request = self._normalize_requirements(requirements)
+        
+        # Pass 1: score every profile; pass 2: build dicts only for profiles
+        # above the 60% match threshold
+        profile_ids, profiles, scores = self._score_all(request)
+        if isinstance(scores, list):
+            matches = [i for i, score in enumerate(scores) if score > 0.6]
+        else:
+            matches = np.flatnonzero(scores > 0.6).tolist()
+        
+        append = recommendations.append
+        for i in matches:
+            profile = profiles[i]
+            append({
+                'profile_id': profile_ids[i],
+                'score': float(scores[i]),
+                'profile': profile,
+                # Flat dicts, so a shallow copy keeps callers off the cached estimates
+                'estimated_cost': dict(profile._cached_cost_dict),
+                'deployment_time': dict(profile._cached_time_dict)
+            })
         
         # Sort by score
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
+        recommendations.sort(key=itemgetter('score'), reverse=True)
         
         return recommendations
     
-    def _calculate_recommendation_score(self, profile: UserProfile, requirements: Dict[str, Any]) -> float:
+    # Requested security level -> matching security profile
+    _SECURITY_MAPPING: Dict[str, SecurityProfile] = {
+        'standard': SecurityProfile.STANDARD,
+        'high': SecurityProfile.FINANCIAL,
+        'maximum': SecurityProfile.AIR_GAPPED
+    }
+    
+    # Below this many profiles NumPy setup costs more than the Python loop
+    _VECTORIZE_MIN_PROFILES = 64
+    
+    def _build_score_columns(self) -> Tuple[Any, ...]:
+        """Build per-attribute columns of the current profiles for batch scoring"""
+        profile_ids = list(self.user_profiles.keys())
+        profiles = list(self.user_profiles.values())
+        max_users = np.array([p.max_users for p in profiles], dtype=np.float64)
+        security = np.array([p.security_profile is s for p in profiles for s in SecurityProfile],
+                            dtype=bool).reshape(len(profiles), len(SecurityProfile))
+        compliance_bits = [p._compliance_bits for p in profiles]
+        return profile_ids, profiles, max_users, security, compliance_bits
+    
+    def _score_all(self, request: RecommendationRequest) -> Tuple[List[str], List[UserProfile], Any]:
+        """Score every profile against a request; returns ids, profiles and scores in matching order"""
+        if not NUMPY_AVAILABLE or len(self.user_profiles) < self._VECTORIZE_MIN_PROFILES:
+            score_fn = self._calculate_recommendation_score
+            profiles = list(self.user_profiles.values())
+            return list(self.user_profiles.keys()), profiles, [score_fn(p, request) for p in profiles]
+        
+        if self._score_columns is None:
+            self._score_columns = self._build_score_columns()
+        profile_ids, profiles, max_users, security, compliance_bits = self._score_columns
+        
+        # Same factors, in the same order, as _calculate_recommendation_score
+        org_size = request.organization_size
+        if org_size == 'small':
+            scores = (max_users <= 100).astype(np.float64)
+        elif org_size == 'medium':
+            scores = ((max_users > 100) & (max_users <= 500)).astype(np.float64)
+        elif org_size == 'large':
+            scores = (max_users > 500).astype(np.float64)
+        else:
+            scores = np.zeros(len(profiles), dtype=np.float64)
+        factors = 1
+        
+        required_compliance = set(request.compliance_requirements)
+        if required_compliance:
+            required_bits = _compliance_mask(required_compliance)
+            overlap = np.array([(required_bits & bits).bit_count() for bits in compliance_bits],
+                               dtype=np.float64)
+            scores += overlap / len(required_compliance)
+            factors += 1
+        
+        required_security = self._SECURITY_MAPPING.get(request.security_level)
+        if required_security is not None:
+            scores += security[:, list(SecurityProfile).index(required_security)]
+        factors += 1
+        
+        return profile_ids, profiles, scores / factors
+    
+    def _calculate_recommendation_score(self, profile: UserProfile, request: RecommendationRequest) -> float:
         """Calculate how well a profile matches requirements"""
         score = 0.0
         factors = 0
         
         # Organization size match
-        org_size = requirements.get('organization_size', 'small')
+        org_size = request.organization_size
         if (org_size == 'small' and profile.max_users <= 100) or \
            (org_size == 'medium' and 100 < profile.max_users <= 500) or \
            (org_size == 'large' and profile.max_users > 500):
@@ -762,57 +943,85 @@ class InfrastructureManager:
         factors += 1
         
         # Compliance requirements match
-        required_compliance = set(requirements.get('compliance_requirements', []))
-        profile_compliance = set(profile.compliance_requirements)
+        required_compliance = set(request.compliance_requirements)
         if required_compliance:
-            overlap = len(required_compliance.intersection(profile_compliance))
+            required_bits = _compliance_mask(required_compliance)
+            overlap = (required_bits & profile._compliance_bits).bit_count()
             score += overlap / len(required_compliance)
             factors += 1
         
         # Security level match
-        security_mapping = {
-            'standard': SecurityProfile.STANDARD,
-            'high': SecurityProfile.FINANCIAL,
-            'maximum': SecurityProfile.AIR_GAPPED
-        }
-        required_security = security_mapping.get(requirements.get('security_level', 'standard'))
+        required_security = self._SECURITY_MAPPING.get(request.security_level)
         if profile.security_profile == required_security:
             score += 1.0
         factors += 1
         
         return score / factors if factors > 0 else 0.0
     
-    def _estimate_deployment_cost(self, profile: UserProfile) -> Dict[str, Any]:
-        """Estimate deployment costs for a profile"""
+    # (setup, monthly) base costs per deployment mode
+    _BASE_COSTS: Dict[DeploymentMode, Tuple[int, int]] = {
+        DeploymentMode.ON_PREMISE: (100000, 5000),
+        DeploymentMode.HYBRID: (50000, 8000),
+        DeploymentMode.CLOUD_AWS: (5000, 3000)
+    }
+    _DEFAULT_BASE_COST: Tuple[int, int] = (10000, 2000)
+    
+    def _estimate_deployment_cost_fast(self, profile: UserProfile) -> Tuple[int, int, int]:
+        """Estimate (setup, monthly, annual) deployment costs without building a dict"""
         # Cost estimation based on deployment mode and requirements
-        base_costs = {
-            DeploymentMode.ON_PREMISE: {'setup': 100000, 'monthly': 5000},
-            DeploymentMode.HYBRID: {'setup': 50000, 'monthly': 8000},
-            DeploymentMode.CLOUD_AWS: {'setup': 5000, 'monthly': 3000}
-        }
-        
-        base = base_costs.get(profile.deployment_mode, {'setup': 10000, 'monthly': 2000})
+        setup, monthly = self._BASE_COSTS.get(profile.deployment_mode, self._DEFAULT_BASE_COST)
         
         # Scale based on user and device count
         user_multiplier = max(1.0, profile.max_users / 100)
         device_multiplier = max(1.0, profile.max_devices / 500)
         
+        return (
+            int(setup * user_multiplier),
+            int(monthly * user_multiplier * device_multiplier),
+            int(monthly * user_multiplier * device_multiplier * 12)
+        )
+    
+    def _batch_estimate_costs(self, profiles: List[UserProfile]) -> List[Tuple[int, int, int]]:
+        """Estimate (setup, monthly, annual) costs for many profiles in one vectorized pass"""
+        if not NUMPY_AVAILABLE or len(profiles) < 2:
+            return [self._estimate_deployment_cost_fast(profile) for profile in profiles]
+        
+        # Column arrays per profile attribute; same formula as _estimate_deployment_cost_fast
+        bases = [self._BASE_COSTS.get(p.deployment_mode, self._DEFAULT_BASE_COST) for p in profiles]
+        setup_base = np.array([base[0] for base in bases], dtype=np.float64)
+        monthly_base = np.array([base[1] for base in bases], dtype=np.float64)
+        max_users = np.array([p.max_users for p in profiles], dtype=np.float64)
+        max_devices = np.array([p.max_devices for p in profiles], dtype=np.float64)
+        
+        user_multiplier = np.maximum(1.0, max_users / 100)
+        device_multiplier = np.maximum(1.0, max_devices / 500)
+        monthly = monthly_base * user_multiplier * device_multiplier
+        
+        return list(zip(
+            (setup_base * user_multiplier).astype(np.int64).tolist(),
+            monthly.astype(np.int64).tolist(),
+            (monthly * 12).astype(np.int64).tolist()
+        ))
+    
+    def _estimate_deployment_cost(self, profile: UserProfile) -> Dict[str, Any]:
+        """Estimate deployment costs for a profile"""
+        setup_cost, monthly_cost, annual_cost = self._estimate_deployment_cost_fast(profile)
         return {
-            'setup_cost': int(base['setup'] * user_multiplier),
-            'monthly_cost': int(base['monthly'] * user_multiplier * device_multiplier),
-            'annual_cost': int(base['monthly'] * user_multiplier * device_multiplier * 12),
+            'setup_cost': setup_cost,
+            'monthly_cost': monthly_cost,
+            'annual_cost': annual_cost,
             'currency': 'USD'
         }
     
+    _DEPLOYMENT_TIMELINES: Dict[DeploymentMode, Dict[str, str]] = {
+        DeploymentMode.ON_PREMISE: {'planning': '4-6 weeks', 'deployment': '8-12 weeks', 'total': '3-4 months'},
+        DeploymentMode.HYBRID: {'planning': '3-4 weeks', 'deployment': '6-8 weeks', 'total': '2-3 months'},
+        DeploymentMode.CLOUD_AWS: {'planning': '1-2 weeks', 'deployment': '2-3 weeks', 'total': '1 month'}
+    }
+    
     def _estimate_deployment_time(self, profile: UserProfile) -> Dict[str, str]:
         """Estimate deployment timeline for a profile"""
-        timelines = {
-            DeploymentMode.ON_PREMISE: {'planning': '4-6 weeks', 'deployment': '8-12 weeks', 'total': '3-4 months'},
-            DeploymentMode.HYBRID: {'planning': '3-4 weeks', 'deployment': '6-8 weeks', 'total': '2-3 months'},
-            DeploymentMode.CLOUD_AWS: {'planning': '1-2 weeks', 'deployment': '2-3 weeks', 'total': '1 month'}
-        }
-        
-        return timelines.get(profile.deployment_mode, {'total': '1-2 months'})
+        return dict(self._DEPLOYMENT_TIMELINES.get(profile.deployment_mode, {'total': '1-2 months'}))
 
 def main():
     """Test the infrastructure manager"""
@@ -19,19 +19,84 @@ Copyright: 2025 CDSI - Compliance Data Systems Insights
 """
 
 import asyncio
+import copy
+import heapq
 import json
 import logging
 import os
+import re
 import subprocess
+import time
+import weakref
 import yaml
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+# Optional orjson import for faster metrics (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional pandas import for vectorized metrics aggregation
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Optional BM25 ranking for commit search
+try:
+    from rank_bm25 import BM25Okapi
+    BM25_AVAILABLE = True
+except ImportError:
+    BM25_AVAILABLE = False
+
+# Optional libgit2 bindings for in-process history queries
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Read-only git subcommands whose output may be memoized
+_CACHEABLE_GIT_COMMANDS = frozenset({'rev-list', 'diff', 'rev-parse', 'log', 'show', 'merge-base'})
+_GIT_CACHE_SIZE = 256
+
+# Metrics are written in batches: after this many updates or seconds
+_METRICS_FLUSH_EVERY = 50
+_METRICS_FLUSH_INTERVAL = 30.0
+
+# Longer pathspec lists are passed to git on stdin (Windows caps command lines at 32K)
+_MAX_PATHSPEC_ARG_CHARS = 30000
+
+# Below this many commits, building a DataFrame costs more than a Python scan
+_VECTORIZE_MIN_COMMITS = 1000
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# "<abbrev hash> type(scope)!: description" lines from git log --oneline
+_CC_RE = re.compile(
+    r'^[0-9a-f]+ (feat|fix|docs|style|refactor|perf|test|chore|ci|build)(?:\([^)]+\))?(!)?:'
+)
+
+# Parsed workflow configs keyed by (path, mtime_ns); prefer libyaml's C loader
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Append-only metrics logs are compacted once they grow past this size
+_METRICS_COMPACT_BYTES = 10 * 1024 * 1024
+
+# Attribution footer appended to every automated commit message
+_COMMIT_FOOTER = "\n\n🤖 Generated with CDSI Git Automation\n\nCo-Authored-By: bdstest <consulting@getcdsi.com>"
+
 class CommitType(Enum):
     """Conventional commit types"""
     FEAT = "feat"  # New feature
@@ -68,6 +133,11 @@ class CommitMetrics:
     branch: str
     is_breaking_change: bool
     scope: Optional[str] = None
+    _ts_epoch: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Parse once at ingest so date-range queries compare floats
+        self._ts_epoch = datetime.fromisoformat(self.timestamp).timestamp()
 
 @dataclass
 class PullRequestMetrics:
@@ -87,6 +157,11 @@ class PullRequestMetrics:
     reviewers: List[str]
     labels: List[str]
     is_hotfix: bool = False
+    _ts_epoch: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Parse once at ingest so date-range queries compare floats
+        self._ts_epoch = datetime.fromisoformat(self.created_at).timestamp()
 
 @dataclass
 class CodeReviewMetrics:
@@ -100,6 +175,137 @@ class CodeReviewMetrics:
     comments_count: int
     suggestions_count: int
 
+def _json_default(value: Any) -> Any:
+    """Serialize enums by value to match orjson output"""
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+def _dump_metric_line(record: Any) -> bytes:
+    """Serialize one metrics dataclass as a JSON line"""
+    if ORJSON_AVAILABLE:
+        # orjson serializes dataclasses and enums natively
+        return orjson.dumps(record) + b'\n'
+    # Skip derived "_" fields, as orjson does
+    data = {key: value for key, value in asdict(record).items() if not key.startswith('_')}
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8') + b'\n'
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _read_if_exists(path: Path) -> Optional[bytes]:
+    """Read a file's bytes, or None if it does not exist (one open, no stat)"""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+def _parse_pr_status(value: Any) -> PRStatus:
+    """Accept enum values as well as legacy 'PRStatus.NAME' strings"""
+    if isinstance(value, PRStatus):
+        return value
+    if value.startswith('PRStatus.'):
+        return PRStatus[value[len('PRStatus.'):]]
+    return PRStatus(value)
+
+def _format_conventional_commit(commit_type: str, description: str, scope: Optional[str] = None,
+                                body: Optional[str] = None, breaking_change: Optional[str] = None) -> str:
+    """Build a conventional commit message: type(scope)!: description, body, footers"""
+    scope_part = f"({scope})" if scope else ""
+    bang = "!" if breaking_change else ""
+    body_part = f"\n\n{body}" if body else ""
+    breaking_part = f"\n\nBREAKING CHANGE: {breaking_change}" if breaking_change else ""
+    return f"{commit_type}{scope_part}{bang}: {description}{body_part}{breaking_part}{_COMMIT_FOOTER}"
+
+async def _run_subprocess(command: List[str], repo_path: Path) -> Tuple[int, str, str]:
+    """Run a command in repo_path without blocking the event loop"""
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=repo_path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    return (process.returncode,
+            stdout.decode('utf-8', 'replace'),
+            stderr.decode('utf-8', 'replace'))
+
+async def _run_quality_check(check_type: str, repo_path: Path) -> Tuple[bool, str]:
+    """Run specific quality check against repo_path"""
+    if check_type == 'lint':
+        # Run Python linting
+        try:
+            returncode, stdout, stderr = await _run_subprocess(
+                ['python3', '-m', 'flake8', 'src/', '--max-line-length=88'], repo_path
+            )
+            return returncode == 0, stdout or stderr
+        except Exception:
+            return True, "Lint check skipped - flake8 not available"
+
+    elif check_type == 'test_coverage':
+        # Run test coverage
+        try:
+            returncode, output, _ = await _run_subprocess(
+                ['python3', '-m', 'pytest', '--cov=src', '--cov-report=term-missing'], repo_path
+            )
+            # Parse coverage from output
+            if 'TOTAL' in output:
+                lines = output.split('\n')
+                for line in lines:
+                    if 'TOTAL' in line:
+                        parts = line.split()
+                        if len(parts) > 3:
+                            return True, parts[3]  # Coverage percentage
+            return True, "85%"  # Default if parsing fails
+        except Exception:
+            return True, "85%"  # Default coverage
+
+    elif check_type == 'security':
+        # Run security scan
+        try:
+            returncode, _, _ = await _run_subprocess(
+                ['python3', '-m', 'bandit', '-r', 'src/', '-f', 'json'], repo_path
+            )
+            return returncode == 0, "Security scan completed"
+        except Exception:
+            return True, "Security scan skipped - bandit not available"
+
+    elif check_type == 'docs':
+        # Check for documentation updates
+        # A single directory scan answers both lookups
+        with os.scandir(repo_path) as entries:
+            names = {entry.name for entry in entries}
+        readme_exists = 'README.md' in names
+        docs_dir_exists = 'docs' in names
+        return readme_exists and docs_dir_exists, f"README: {readme_exists}, docs/: {docs_dir_exists}"
+
+    return True, "Check completed"
+
+def _append_metric_lines(log_file: Path, records: List[Any]) -> int:
+    """Append records to a metrics log as JSON lines and return the log's size"""
+    with open(log_file, 'ab') as f:
+        f.write(b''.join(_dump_metric_line(record) for record in records))
+        return f.tell()
+
+def _flush_pending_metrics(metrics_dir: Path, stores: Dict[str, Tuple[str, str]],
+                           pending: Dict[str, List[Any]]):
+    """Append buffered records left behind by a collected instance or at interpreter exit"""
+    for kind, records in pending.items():
+        if records:
+            pending[kind] = []
+            try:
+                _append_metric_lines(metrics_dir / f"{stores[kind][0]}.jsonl", records)
+            except Exception as e:
+                logger.error(f"Failed to save git metrics: {e}")
+
+def _run_quality_gate_worker(check_type: str, repo_path: str) -> Tuple[bool, str]:
+    """Run one quality check in a pool worker (module-level so it can be pickled)"""
+    return asyncio.run(_run_quality_check(check_type, Path(repo_path)))
+
+
 class GitWorkflowAutomation:
     """
     Comprehensive Git workflow automation for CDSI platform development
@@ -116,25 +322,92 @@ class GitWorkflowAutomation:
         
         # Load configuration
         self.config = self._load_configuration()
+        self._reviewer_profiles = self._build_reviewer_profiles()
+        self._prefix_labels = self._build_prefix_labels()
         
         # Initialize tracking
         self.commit_metrics: List[CommitMetrics] = []
         self.pr_metrics: List[PullRequestMetrics] = []
         self.review_metrics: List[CodeReviewMetrics] = []
         
+        # In-process repository handle (None when pygit2 is unavailable)
+        self._repo = self._open_repository()
+        
+        # Memoized read-only git query results, cleared by mutating commands
+        self._git_cache: Dict[Tuple[Any, ...], Tuple[bool, Any]] = {}
+        
+        # Branch commit counts keyed by (source sha, target sha); immutable per pair
+        self._branch_count_cache: Dict[Tuple[str, str], int] = {}
+        
+        # BM25 index over commit subjects as (HEAD sha, commit lines, index)
+        self._commit_index: Optional[Tuple[str, List[str], Any]] = None
+        
+        # Background pool for quality gates, created on first submit
+        self._gate_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Current branch as (HEAD file mtime_ns, branch name)
+        self._head_cache: Optional[Tuple[int, str]] = None
+        
+        # Column view of commit metrics for aggregation, rebuilt after changes
+        self._commit_df = None
+        
+        # Buffered metrics persistence: records not yet appended to storage
+        self._pending: Dict[str, List[Any]] = {kind: [] for kind in self._METRIC_STORES}
+        self._pending_updates = 0
+        self._last_flush = time.monotonic()
+        # Flushes the buffer if this instance is collected, or at exit; it holds
+        # only the buffer, so it doesn't keep the instance alive
+        self._pending_finalizer = weakref.finalize(
+            self, _flush_pending_metrics, self.metrics_dir.resolve(), self._METRIC_STORES, self._pending
+        )
+        
         # Load existing metrics
         self._load_metrics()
         
         logger.info("Git Workflow Automation initialized")
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Flush buffered metrics and stop the quality gate pool"""
+        self.flush_metrics()
+        if self._gate_pool is not None:
+            self._gate_pool.shutdown(wait=False, cancel_futures=True)
+            self._gate_pool = None
+    
+    def _open_repository(self) -> Optional["pygit2.Repository"]:
+        """Open the repository with pygit2 for subprocess-free queries"""
+        if not PYGIT2_AVAILABLE:
+            return None
+        try:
+            git_dir = pygit2.discover_repository(str(self.repo_path))
+            return pygit2.Repository(git_dir) if git_dir else None
+        except (pygit2.GitError, OSError) as e:
+            logger.warning(f"pygit2 could not open repository, using git CLI: {e}")
+            return None
+    
+    def _resolve_commit(self, revision: str) -> "pygit2.Commit":
+        """Resolve a branch/tag/revision to a commit object"""
+        return self._repo.revparse_single(revision).peel(pygit2.Commit)
+    
     def _load_configuration(self) -> Dict[str, Any]:
         """Load git workflow configuration"""
         try:
-            if self.config_path.exists():
+            # One stat both checks existence and provides the cache key
+            key = (str(self.config_path.absolute()), self.config_path.stat().st_mtime_ns)
+            config = _CONFIG_CACHE.get(key)
+            if config is None:
                 with open(self.config_path, 'r') as f:
-                    return yaml.safe_load(f)
-            else:
-                return self._get_default_config()
+                    config = yaml.load(f, Loader=_YAML_LOADER)
+                _CONFIG_CACHE[key] = config
+            # Copy so callers mutating their config cannot poison the cache
+            return copy.deepcopy(config)
+        except FileNotFoundError:
+            return self._get_default_config()
         except Exception as e:
             logger.error(f"Failed to load git workflow config: {e}")
             return self._get_default_config()
@@ -189,106 +462,187 @@ class GitWorkflowAutomation:
             }
         }
     
+    # Metrics kind -> (attribute and file stem, field identifying a record)
+    _METRIC_STORES = {
+        'commit': ('commit_metrics', 'commit_hash'),
+        'pr': ('pr_metrics', 'pr_number'),
+        'review': ('review_metrics', 'review_id')
+    }
+    
+    def _metric_from_dict(self, kind: str, item: Dict[str, Any]) -> Any:
+        """Rebuild a metrics dataclass from its stored form"""
+        if kind == 'commit':
+            return CommitMetrics(**item)
+        if kind == 'pr':
+            return PullRequestMetrics(**{**item, 'status': _parse_pr_status(item['status'])})
+        return CodeReviewMetrics(**item)
+    
     def _load_metrics(self):
         """Load existing metrics from storage"""
-        try:
-            # Load commit metrics
-            commit_file = self.metrics_dir / "commit_metrics.json"
-            if commit_file.exists():
-                with open(commit_file, 'r') as f:
-                    data = json.load(f)
-                    self.commit_metrics = [CommitMetrics(**item) for item in data]
-            
-            # Load PR metrics
-            pr_file = self.metrics_dir / "pr_metrics.json"
-            if pr_file.exists():
-                with open(pr_file, 'r') as f:
-                    data = json.load(f)
-                    self.pr_metrics = [PullRequestMetrics(**item) for item in data]
-            
-            # Load review metrics
-            review_file = self.metrics_dir / "review_metrics.json"
-            if review_file.exists():
-                with open(review_file, 'r') as f:
-                    data = json.load(f)
-                    self.review_metrics = [CodeReviewMetrics(**item) for item in data]
+        for kind, (name, _) in self._METRIC_STORES.items():
+            try:
+                log_file = self.metrics_dir / f"{name}.jsonl"
+                try:
+                    with open(log_file, 'rb') as f:
+                        records = []
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            try:
+                                records.append(self._metric_from_dict(kind, _load_json(line)))
+                            except Exception as e:
+                                # e.g. a record torn by a crash mid-append
+                                logger.warning(f"Skipping unreadable {name} record: {e}")
+                    setattr(self, name, records)
+                    continue
+                except FileNotFoundError:
+                    pass
+                
+                # Migrate a legacy JSON array file to the append-only log
+                data = _read_if_exists(self.metrics_dir / f"{name}.json")
+                if data is not None:
+                    setattr(self, name, [self._metric_from_dict(kind, item)
+                                         for item in _load_json(data)])
+                    self._compact_metrics(kind)
                     
+            except Exception as e:
+                logger.error(f"Failed to load git metrics: {e}")
+    
+    def _append_metrics(self, kind: str, records: List[Any]):
+        """Append records to a metrics log, compacting it when it grows too large"""
+        name = self._METRIC_STORES[kind][0]
+        try:
+            size = _append_metric_lines(self.metrics_dir / f"{name}.jsonl", records)
+            if size > _METRICS_COMPACT_BYTES:
+                self._compact_metrics(kind)
         except Exception as e:
-            logger.error(f"Failed to load git metrics: {e}")
+            logger.error(f"Failed to save git metrics: {e}")
     
-    def _save_metrics(self):
-        """Save metrics to storage"""
+    def _compact_metrics(self, kind: str):
+        """Rewrite a metrics log keeping only the latest record per key"""
+        name, key = self._METRIC_STORES[kind]
         try:
-            # Save commit metrics
-            with open(self.metrics_dir / "commit_metrics.json", 'w') as f:
-                json.dump([asdict(m) for m in self.commit_metrics], f, indent=2)
-            
-            # Save PR metrics
-            with open(self.metrics_dir / "pr_metrics.json", 'w') as f:
-                json.dump([asdict(m) for m in self.pr_metrics], f, indent=2, default=str)
+            latest = {getattr(record, key): record for record in getattr(self, name)}
+            records = list(latest.values())
+            setattr(self, name, records)
+            if kind == 'commit':
+                self._commit_df = None
             
-            # Save review metrics
-            with open(self.metrics_dir / "review_metrics.json", 'w') as f:
-                json.dump([asdict(m) for m in self.review_metrics], f, indent=2)
-                
+            log_file = self.metrics_dir / f"{name}.jsonl"
+            tmp_file = log_file.with_suffix('.jsonl.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(b''.join(_dump_metric_line(record) for record in records))
+            os.replace(tmp_file, log_file)
         except Exception as e:
-            logger.error(f"Failed to save git metrics: {e}")
+            logger.error(f"Failed to compact git metrics: {e}")
+    
+    def _queue_metric(self, kind: str, record: Any):
+        """Buffer a new record and flush once enough updates or time accumulate"""
+        if kind == 'commit':
+            self._commit_df = None
+        self._pending[kind].append(record)
+        self._pending_updates += 1
+        if (self._pending_updates >= _METRICS_FLUSH_EVERY or
+                time.monotonic() - self._last_flush >= _METRICS_FLUSH_INTERVAL):
+            self.flush_metrics()
+    
+    def flush_metrics(self):
+        """Append any buffered metrics records to storage"""
+        for kind, records in self._pending.items():
+            if records:
+                self._pending[kind] = []
+                self._append_metrics(kind, records)
+        self._pending_updates = 0
+        self._last_flush = time.monotonic()
     
-    def _run_git_command(self, command: List[str]) -> Tuple[bool, str]:
-        """Execute git command and return result"""
+    def _run_git_command(self, command: List[str], cacheable: bool = False,
+                         input_data: Optional[str] = None, raw: bool = False) -> Tuple[bool, Any]:
+        """Execute git command and return result
+        
+        Read-only queries may pass cacheable=True to reuse an earlier successful
+        result; any other git command run through here clears the cache. With
+        raw=True the output is the undecoded stdout bytes.
+        """
+        read_only = command[0] in _CACHEABLE_GIT_COMMANDS
+        key = (raw, *command)
+        if cacheable and read_only:
+            cached = self._git_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        result = self._execute_git_command(command, input_data, raw)
+        
+        if not read_only:
+            self._git_cache.clear()
+        elif cacheable and result[0]:
+            if len(self._git_cache) >= _GIT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._git_cache[next(iter(self._git_cache))]
+            self._git_cache[key] = result
+        
+        return result
+    
+    def _execute_git_command(self, command: List[str], input_data: Optional[str] = None,
+                             raw: bool = False) -> Tuple[bool, Any]:
+        """Run a git subprocess and return (success, output)"""
         try:
             result = subprocess.run(
                 ['git'] + command,
                 cwd=self.repo_path,
+                input=input_data.encode('utf-8') if input_data is not None else None,
                 capture_output=True,
-                text=True,
                 timeout=30
             )
-            return result.returncode == 0, result.stdout.strip() or result.stderr.strip()
+            success = result.returncode == 0
+            if raw:
+                return success, result.stdout
+            # Decode only the stream that is returned
+            output = result.stdout.strip() or result.stderr.strip()
+            return success, output.decode('utf-8', 'replace')
         except subprocess.TimeoutExpired:
             return False, "Git command timed out"
         except Exception as e:
             return False, str(e)
     
+    def _run_git_stream(self, command: List[str]) -> Iterator[str]:
+        """Execute git command and yield stdout lines as they are produced
+        
+        Raises subprocess.CalledProcessError if git exits with an error.
+        """
+        process = subprocess.Popen(
+            ['git'] + command,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1,
+            text=True
+        )
+        try:
+            for line in process.stdout:
+                yield line.rstrip('\n')
+            if process.wait(timeout=30) != 0:
+                raise subprocess.CalledProcessError(process.returncode, command)
+        finally:
+            # Consumer stopped early or the command failed
+            if process.poll() is None:
+                process.terminate()
+            process.stdout.close()
+            process.wait()
+    
     def create_conventional_commit(self, commit_type: CommitType, description: str,
                                  scope: Optional[str] = None, body: Optional[str] = None,
                                  breaking_change: Optional[str] = None,
                                  files: Optional[List[str]] = None) -> Tuple[bool, str]:
         """Create a conventional commit with proper formatting"""
+        commit_message = _format_conventional_commit(
+            commit_type.value, description, scope, body, breaking_change
+        )
         
-        # Format commit message
-        message_parts = []
-        
-        # Header: type(scope): description
-        header = commit_type.value
-        if scope:
-            header += f"({scope})"
-        
-        if breaking_change:
-            header += "!"
-        
-        header += f": {description}"
-        message_parts.append(header)
-        
-        # Body (optional)
-        if body:
-            message_parts.extend(["", body])
-        
-        # Breaking change footer
-        if breaking_change:
-            message_parts.extend(["", f"BREAKING CHANGE: {breaking_change}"])
-        
-        # Attribution footer
-        message_parts.extend(["", "🤖 Generated with CDSI Git Automation", "", "Co-Authored-By: bdstest <consulting@getcdsi.com>"])
-        
-        commit_message = "\n".join(message_parts)
-        
-        # Stage files if provided
+        # Stage files if provided, all in one git call
         if files:
-            for file_path in files:
-                success, output = self._run_git_command(['add', file_path])
-                if not success:
-                    return False, f"Failed to stage {file_path}: {output}"
+            success, output = self._stage_files(files)
+            if not success:
+                return False, output
         
         # Create commit
         success, output = self._run_git_command(['commit', '-m', commit_message])
@@ -296,36 +650,80 @@ class GitWorkflowAutomation:
         if success:
             # Track commit metrics
             self._track_commit_metrics(commit_type, scope, files or [])
+            header = commit_message.partition('\n')[0]
             logger.info(f"Created conventional commit: {header}")
         
         return success, output
     
+    def _stage_files(self, files: List[str]) -> Tuple[bool, str]:
+        """Stage files with a single git add, pinpointing the failing path on error"""
+        if sum(len(f) + 1 for f in files) > _MAX_PATHSPEC_ARG_CHARS:
+            success, output = self._run_git_command(
+                ['add', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                input_data='\0'.join(files)
+            )
+        else:
+            success, output = self._run_git_command(['add', '--'] + files)
+        if success:
+            return True, output
+        
+        # Retry per file only to report which path could not be staged
+        for file_path in files:
+            file_success, file_output = self._run_git_command(['add', '--', file_path])
+            if not file_success:
+                return False, f"Failed to stage {file_path}: {file_output}"
+        return False, f"Failed to stage files: {output}"
+    
+    def _current_branch(self) -> str:
+        """Return the checked-out branch ('' when detached) by reading .git/HEAD"""
+        head_file = self.repo_path / '.git' / 'HEAD'
+        try:
+            # A .git file (worktree/submodule) or a subdirectory path has no HEAD here
+            mtime = head_file.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            success, branch = self._run_git_command(['branch', '--show-current'])
+            return branch if success else 'unknown'
+        
+        if self._head_cache is None or self._head_cache[0] != mtime:
+            head = head_file.read_text().strip()
+            branch = head[len('ref: refs/heads/'):] if head.startswith('ref: refs/heads/') else ''
+            self._head_cache = (mtime, branch)
+        return self._head_cache[1]
+    
     def _track_commit_metrics(self, commit_type: CommitType, scope: Optional[str], files: List[str]):
         """Track metrics for a commit"""
         try:
-            # Get latest commit info
-            success, commit_hash = self._run_git_command(['rev-parse', 'HEAD'])
+            # Get latest commit hash and per-file stats in a single git call.
+            # -z emits NUL-separated "added<TAB>deleted<TAB>path" records that are
+            # independent of locale and of special characters in paths.
+            success, output = self._run_git_command(
+                ['log', '-1', '--numstat', '-z', '--format=format:%H%x00', 'HEAD']
+            )
             if not success:
                 return
             
-            success, branch = self._run_git_command(['branch', '--show-current'])
-            if not success:
-                branch = 'unknown'
+            records = output.split('\0')
+            commit_hash = records[0]
+            branch = self._current_branch()
             
-            # Get commit stats
-            success, stats = self._run_git_command(['show', '--stat', '--format=', commit_hash])
             lines_added = lines_deleted = 0
-            
-            if success and stats:
-                # Parse git stats output
-                for line in stats.split('\n'):
-                    if 'insertion' in line or 'deletion' in line:
-                        parts = line.strip().split()
-                        for i, part in enumerate(parts):
-                            if 'insertion' in part and i > 0:
-                                lines_added = int(parts[i-1])
-                            elif 'deletion' in part and i > 0:
-                                lines_deleted = int(parts[i-1])
+            skip = 0
+            for record in records[1:]:
+                if skip:
+                    # Source and destination paths of a rename
+                    skip -= 1
+                    continue
+                parts = record.lstrip('\n').split('\t', 2)
+                if len(parts) != 3:
+                    continue
+                added, deleted, path = parts
+                if not path:
+                    skip = 2
+                # Binary files report "-" instead of line counts
+                if added != '-':
+                    lines_added += int(added)
+                if deleted != '-':
+                    lines_deleted += int(deleted)
             
             # Create metrics entry
             metrics = CommitMetrics(
@@ -342,7 +740,7 @@ class GitWorkflowAutomation:
             )
             
             self.commit_metrics.append(metrics)
-            self._save_metrics()
+            self._queue_metric('commit', metrics)
             
         except Exception as e:
             logger.error(f"Failed to track commit metrics: {e}")
@@ -401,167 +799,229 @@ class GitWorkflowAutomation:
         )
         
         self.pr_metrics.append(metrics)
-        self._save_metrics()
+        self._queue_metric('pr', metrics)
         
         logger.info(f"Created PR #{pr_number}: {title}")
         
         return True, {'pr_number': pr_number, 'url': f'https://github.com/cdsi/platform/pull/{pr_number}'}
     
+    def _build_reviewer_profiles(self) -> Dict[Tuple[bool, bool], Tuple[str, ...]]:
+        """Precompute reviewer lists keyed by (security change, docs change)"""
+        reviewers = self.config['reviewers']
+        min_reviewers = self.config['pr']['min_reviewers']
+        profiles = {}
+        for security in (False, True):
+            for docs in (False, True):
+                # Always include core team, then specific team members
+                members = list(reviewers['core_team'])
+                if security:
+                    members.extend(reviewers['security_team'])
+                if docs:
+                    members.extend(reviewers['docs_team'])
+                # Remove duplicates (keeping config order) and limit to min_reviewers
+                profiles[(security, docs)] = tuple(dict.fromkeys(members))[:min_reviewers]
+        return profiles
+    
     def _auto_assign_reviewers(self, branch_name: str) -> List[str]:
         """Auto-assign reviewers based on branch name and config"""
-        reviewers = []
-        
-        # Always include core team
-        reviewers.extend(self.config['reviewers']['core_team'])
-        
-        # Add specific team members based on changes
-        if 'security' in branch_name or 'auth' in branch_name:
-            reviewers.extend(self.config['reviewers']['security_team'])
-        
-        if 'docs' in branch_name or 'documentation' in branch_name:
-            reviewers.extend(self.config['reviewers']['docs_team'])
-        
-        # Remove duplicates and limit to min_reviewers
-        reviewers = list(set(reviewers))
-        min_reviewers = self.config['pr']['min_reviewers']
-        
-        return reviewers[:min_reviewers]
+        security = 'security' in branch_name or 'auth' in branch_name
+        docs = 'docs' in branch_name or 'documentation' in branch_name
+        return list(self._reviewer_profiles[(security, docs)])
+    
+    def _build_prefix_labels(self) -> Dict[str, Tuple[str, ...]]:
+        """Map branch prefixes (without the slash) to their PR labels"""
+        branch_config = self.config['branch']
+        label_mapping = self.config['pr']['labels']
+        return {
+            branch_config[f'{kind}_prefix'].rstrip('/'): tuple(label_mapping[kind])
+            for kind in ('feature', 'bugfix', 'hotfix')
+        }
     
     def _auto_assign_labels(self, branch_name: str) -> List[str]:
         """Auto-assign labels based on branch name"""
-        labels = []
-        
-        label_mapping = self.config['pr']['labels']
-        
-        if branch_name.startswith('feature/'):
-            labels.extend(label_mapping['feature'])
-        elif branch_name.startswith('bugfix/'):
-            labels.extend(label_mapping['bugfix'])
-        elif branch_name.startswith('hotfix/'):
-            labels.extend(label_mapping['hotfix'])
-        elif 'docs' in branch_name:
-            labels.extend(label_mapping['docs'])
-        
-        return labels
+        prefix, slash, _ = branch_name.partition('/')
+        labels = self._prefix_labels.get(prefix) if slash else None
+        if labels is not None:
+            return list(labels)
+        if 'docs' in branch_name:
+            return list(self.config['pr']['labels']['docs'])
+        return []
     
     def _count_commits_in_branch(self, branch_name: str) -> int:
         """Count commits in branch compared to main"""
         try:
             main_branch = self.config['branch']['main_branch']
-            success, output = self._run_git_command(['rev-list', '--count', f'{main_branch}..{branch_name}'])
-            return int(output) if success else 0
+            if self._repo is not None:
+                source = str(self._resolve_commit(branch_name).id)
+                target = str(self._resolve_commit(main_branch).id)
+            else:
+                success, output = self._run_git_command(['rev-parse', branch_name, main_branch])
+                if not success:
+                    return 0
+                source, target = output.split()
+            
+            key = (source, target)
+            count = self._branch_count_cache.get(key)
+            if count is None:
+                count = self._count_unique_commits(source, target)
+                if len(self._branch_count_cache) >= _GIT_CACHE_SIZE:
+                    del self._branch_count_cache[next(iter(self._branch_count_cache))]
+                self._branch_count_cache[key] = count
+            return count
         except:
             return 0
     
+    def _count_unique_commits(self, source: str, target: str) -> int:
+        """Count commits reachable from source but not target (rev-list --count target..source)"""
+        if self._repo is not None:
+            # Already merged (or identical): nothing to walk
+            if source == target or self._repo.descendant_of(target, source):
+                return 0
+            # Walk back from source, stopping at history shared with target
+            walker = self._repo.walk(source)
+            walker.hide(target)
+            return sum(1 for _ in walker)
+        
+        success, _ = self._run_git_command(['merge-base', '--is-ancestor', source, target])
+        if success:
+            return 0
+        success, output = self._run_git_command(
+            ['rev-list', '--count', f'{target}..{source}'], raw=True
+        )
+        return int(output) if success else 0
+    
     def _count_files_changed(self, source_branch: str, target_branch: str) -> int:
         """Count files changed between branches"""
         try:
-            success, output = self._run_git_command(['diff', '--name-only', f'{target_branch}..{source_branch}'])
-            return len(output.split('\n')) if success and output else 0
+            if self._repo is not None:
+                diff = self._repo.diff(self._resolve_commit(target_branch),
+                                       self._resolve_commit(source_branch))
+                # Match git diff's default rename detection (a rename is one file)
+                diff.find_similar()
+                return diff.stats.files_changed
+            
+            # Resolve the branches first: a diff between two shas never changes,
+            # so it is safe to cache even after the branches move
+            success, output = self._run_git_command(['rev-parse', target_branch, source_branch])
+            if not success:
+                return 0
+            target, source = output.split()
+            
+            success, output = self._run_git_command(
+                ['diff', '--name-only', '-z', f'{target}..{source}'],
+                cacheable=True, raw=True
+            )
+            # NUL-terminated names: one terminator per file, even with odd filenames
+            return output.count(b'\0') if success else 0
         except:
             return 0
     
     def run_quality_gates(self, branch_name: str = None) -> Dict[str, Any]:
-        """Run quality gates and return results"""
+        """Run quality gates and return results
+        
+        Async callers should await run_quality_gates_async instead. Called from
+        inside a running event loop, this still works by running the gates on a
+        helper thread, but it blocks that loop until they finish.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_quality_gates_async(branch_name))
+        
+        # asyncio.run cannot nest in a running loop, so the gates get their own thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.run_quality_gates_async(branch_name)).result()
+    
+    async def run_quality_gates_async(self, branch_name: str = None) -> Dict[str, Any]:
+        """Run enabled quality gates concurrently and return results"""
+        checks = self._enabled_quality_checks()
+        
+        # Checks are independent subprocesses, so wall time is the slowest one
+        outcomes = await asyncio.gather(
+            *(self._run_quality_check_async(check_type) for check_type in checks),
+            return_exceptions=True
+        )
+        
+        return self._build_quality_results(checks, outcomes)
+    
+    def _enabled_quality_checks(self) -> List[str]:
+        """Quality checks enabled in config, in reporting order"""
+        gate_config = self.config['quality_gates']
+        checks = []
+        if gate_config['lint_check']:
+            checks.append('lint')
+        if gate_config['require_tests']:
+            checks.append('test_coverage')
+        if gate_config['security_scan']:
+            checks.append('security')
+        if gate_config['require_docs']:
+            checks.append('docs')
+        return checks
+    
+    def _build_quality_results(self, checks: List[str], outcomes: List[Any]) -> Dict[str, Any]:
+        """Assemble quality gate results from per-check (success, output) outcomes"""
         results = {
             'passed': True,
             'checks': {},
             'timestamp': datetime.now().isoformat()
         }
         
-        # Lint check
-        if self.config['quality_gates']['lint_check']:
-            success, output = self._run_quality_check('lint')
-            results['checks']['lint'] = {'passed': success, 'output': output}
-            if not success:
-                results['passed'] = False
-        
-        # Test coverage check
-        if self.config['quality_gates']['require_tests']:
-            success, coverage = self._run_quality_check('test_coverage')
-            min_coverage = self.config['quality_gates']['min_test_coverage']
-            passed = success and float(coverage.replace('%', '')) >= min_coverage
-            results['checks']['test_coverage'] = {
-                'passed': passed,
-                'coverage': coverage,
-                'minimum': f"{min_coverage}%"
-            }
+        gate_config = self.config['quality_gates']
+        for check_type, outcome in zip(checks, outcomes):
+            if isinstance(outcome, Exception):
+                success, output = False, str(outcome)
+            else:
+                success, output = outcome
+            
+            if check_type == 'test_coverage':
+                # Test coverage check
+                min_coverage = gate_config['min_test_coverage']
+                passed = success and float(output.replace('%', '')) >= min_coverage
+                results['checks']['test_coverage'] = {
+                    'passed': passed,
+                    'coverage': output,
+                    'minimum': f"{min_coverage}%"
+                }
+            else:
+                passed = success
+                name = 'documentation' if check_type == 'docs' else check_type
+                results['checks'][name] = {'passed': success, 'output': output}
+            
             if not passed:
                 results['passed'] = False
         
-        # Security scan
-        if self.config['quality_gates']['security_scan']:
-            success, output = self._run_quality_check('security')
-            results['checks']['security'] = {'passed': success, 'output': output}
-            if not success:
-                results['passed'] = False
-        
-        # Documentation check
-        if self.config['quality_gates']['require_docs']:
-            success, output = self._run_quality_check('docs')
-            results['checks']['documentation'] = {'passed': success, 'output': output}
-            if not success:
-                results['passed'] = False
-        
         return results
     
-    def _run_quality_check(self, check_type: str) -> Tuple[bool, str]:
+    async def _run_quality_check_async(self, check_type: str) -> Tuple[bool, str]:
         """Run specific quality check"""
-        if check_type == 'lint':
-            # Run Python linting
-            try:
-                result = subprocess.run(
-                    ['python3', '-m', 'flake8', 'src/', '--max-line-length=88'],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                return result.returncode == 0, result.stdout or result.stderr
-            except:
-                return True, "Lint check skipped - flake8 not available"
-        
-        elif check_type == 'test_coverage':
-            # Run test coverage
-            try:
-                result = subprocess.run(
-                    ['python3', '-m', 'pytest', '--cov=src', '--cov-report=term-missing'],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                # Parse coverage from output
-                output = result.stdout
-                if 'TOTAL' in output:
-                    lines = output.split('\n')
-                    for line in lines:
-                        if 'TOTAL' in line:
-                            parts = line.split()
-                            if len(parts) > 3:
-                                return True, parts[3]  # Coverage percentage
-                return True, "85%"  # Default if parsing fails
-            except:
-                return True, "85%"  # Default coverage
-        
-        elif check_type == 'security':
-            # Run security scan
+        return await _run_quality_check(check_type, self.repo_path)
+    
+    def submit_quality_gates(self, branch_name: str = None) -> Dict[str, Future]:
+        """Start enabled quality checks in a background process pool
+        
+        Returns immediately so callers can keep working while the checks run;
+        pass the returned futures to collect_quality_gates for the results.
+        """
+        if self._gate_pool is None:
+            self._gate_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return {
+            check_type: self._gate_pool.submit(_run_quality_gate_worker, check_type, str(self.repo_path))
+            for check_type in self._enabled_quality_checks()
+        }
+    
+    def collect_quality_gates(self, futures: Dict[str, Future], timeout: float = 600) -> Dict[str, Any]:
+        """Wait for submitted quality checks and return results like run_quality_gates"""
+        deadline = time.monotonic() + timeout
+        outcomes = []
+        for check_type, future in futures.items():
             try:
-                result = subprocess.run(
-                    ['python3', '-m', 'bandit', '-r', 'src/', '-f', 'json'],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                return result.returncode == 0, "Security scan completed"
-            except:
-                return True, "Security scan skipped - bandit not available"
-        
-        elif check_type == 'docs':
-            # Check for documentation updates
-            readme_exists = (self.repo_path / 'README.md').exists()
-            docs_dir_exists = (self.repo_path / 'docs').exists()
-            return readme_exists and docs_dir_exists, f"README: {readme_exists}, docs/: {docs_dir_exists}"
-        
-        return True, "Check completed"
+                outcomes.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FuturesTimeoutError:
+                future.cancel()
+                outcomes.append((False, f"{check_type} check timed out"))
+            except Exception as e:
+                outcomes.append(e)
+        return self._build_quality_results(list(futures), outcomes)
     
     def get_development_metrics(self, days: int = 30) -> Dict[str, Any]:
         """Get development metrics for the specified period"""
@@ -569,30 +1029,16 @@ class GitWorkflowAutomation:
         start_date = end_date - timedelta(days=days)
         
         # Filter metrics by date range
-        recent_commits = [
-            c for c in self.commit_metrics
-            if datetime.fromisoformat(c.timestamp) >= start_date
-        ]
+        (total_commits, commit_types, total_lines_added,
+         total_lines_deleted, breaking_changes) = self._summarize_commits(start_date)
         
-        recent_prs = [
-            p for p in self.pr_metrics
-            if datetime.fromisoformat(p.created_at) >= start_date
-        ]
+        start_epoch = start_date.timestamp()
+        recent_prs = [p for p in self.pr_metrics if p._ts_epoch >= start_epoch]
         
         # Calculate metrics
-        total_commits = len(recent_commits)
         total_prs = len(recent_prs)
         merged_prs = [p for p in recent_prs if p.status == PRStatus.MERGED]
         
-        # Commit type breakdown
-        commit_types = {}
-        for commit in recent_commits:
-            commit_types[commit.commit_type] = commit_types.get(commit.commit_type, 0) + 1
-        
-        # Lines of code changes
-        total_lines_added = sum(c.lines_added for c in recent_commits)
-        total_lines_deleted = sum(c.lines_deleted for c in recent_commits)
-        
         # PR metrics
         avg_time_to_merge = 0
         if merged_prs:
@@ -627,41 +1073,123 @@ class GitWorkflowAutomation:
                 'bugs_fixed': commit_types.get('fix', 0)
             },
             'quality': {
-                'breaking_changes': len([c for c in recent_commits if c.is_breaking_change]),
+                'breaking_changes': breaking_changes,
                 'documentation_updates': commit_types.get('docs', 0),
                 'test_updates': commit_types.get('test', 0)
             }
         }
     
+    def _get_commit_df(self) -> "pd.DataFrame":
+        """Build (once) a DataFrame of commit metrics keyed on epoch timestamps"""
+        if self._commit_df is None:
+            commits = self.commit_metrics
+            df = pd.DataFrame({
+                'ts_epoch': [c._ts_epoch for c in commits],
+                'commit_type': [c.commit_type for c in commits],
+                'lines_added': [c.lines_added for c in commits],
+                'lines_deleted': [c.lines_deleted for c in commits],
+                'is_breaking_change': [c.is_breaking_change for c in commits]
+            })
+            self._commit_df = df
+        return self._commit_df
+    
+    def _summarize_commits(self, start_date: datetime) -> Tuple[int, Dict[str, int], int, int, int]:
+        """Return (count, counts by type, lines added, lines deleted, breaking changes) since start_date"""
+        if PANDAS_AVAILABLE and len(self.commit_metrics) >= _VECTORIZE_MIN_COMMITS:
+            df = self._get_commit_df()
+            recent = df[df['ts_epoch'] >= start_date.timestamp()]
+            commit_types = {commit_type: int(count) for commit_type, count
+                            in recent['commit_type'].value_counts(sort=False).items()}
+            return (len(recent), commit_types,
+                    int(recent['lines_added'].sum()),
+                    int(recent['lines_deleted'].sum()),
+                    int(recent['is_breaking_change'].sum()))
+        
+        start_epoch = start_date.timestamp()
+        recent_commits = [c for c in self.commit_metrics if c._ts_epoch >= start_epoch]
+        
+        # Commit type breakdown
+        commit_types = {}
+        for commit in recent_commits:
+            commit_types[commit.commit_type] = commit_types.get(commit.commit_type, 0) + 1
+        
+        # Lines of code changes
+        return (len(recent_commits), commit_types,
+                sum(c.lines_added for c in recent_commits),
+                sum(c.lines_deleted for c in recent_commits),
+                len([c for c in recent_commits if c.is_breaking_change]))
+    
+    def _get_commit_index(self) -> Optional[Tuple[List[str], Any]]:
+        """Build (or reuse) the BM25 index of commit subjects for the current HEAD"""
+        success, head = self._run_git_command(['rev-parse', 'HEAD'])
+        if not success:
+            return None
+        
+        if self._commit_index is None or self._commit_index[0] != head:
+            commits = [line for line in self._run_git_stream(['log', '--format=%h %s']) if line]
+            if not commits:
+                return None
+            index = BM25Okapi([_TOKEN_RE.findall(line.lower()) for line in commits])
+            self._commit_index = (head, commits, index)
+        
+        return self._commit_index[1], self._commit_index[2]
+    
+    def search_commit(self, query: str, top_k: int = 10) -> List[str]:
+        """Return up to top_k "hash subject" lines ranked by BM25 relevance to query"""
+        if not BM25_AVAILABLE:
+            logger.warning("rank_bm25 not available - commit search disabled")
+            return []
+        
+        try:
+            built = self._get_commit_index()
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"Failed to index commits: {e}")
+            return []
+        if built is None:
+            return []
+        
+        commits, index = built
+        query_tokens = _TOKEN_RE.findall(query.lower())
+        scores = index.get_scores(query_tokens)
+        # Filter on the terms rather than the score: a term found in exactly half
+        # the commits has zero IDF, so its hits would otherwise score 0 and vanish
+        wanted = set(query_tokens)
+        hits = [i for i, term_freqs in enumerate(index.doc_freqs) if not wanted.isdisjoint(term_freqs)]
+        best = heapq.nlargest(top_k, hits, key=scores.__getitem__)
+        return [commits[i] for i in best]
+    
     def generate_release_notes(self, from_tag: str = None, to_tag: str = "HEAD") -> str:
         """Generate release notes from commit history"""
         # Get commits between tags
         if from_tag:
-            success, commit_list = self._run_git_command(['log', f'{from_tag}..{to_tag}', '--oneline'])
+            command = ['log', f'{from_tag}..{to_tag}', '--oneline']
         else:
-            success, commit_list = self._run_git_command(['log', '--oneline', '-n', '50'])
-        
-        if not success:
-            return "Failed to generate release notes"
+            command = ['log', '--oneline', '-n', '50']
         
-        # Parse commits and categorize
+        # Parse commits and categorize while git is still producing output
         features = []
         fixes = []
         breaking_changes = []
         other_changes = []
         
-        for line in commit_list.split('\n'):
-            if not line:
-                continue
-            
-            if 'feat' in line:
-                features.append(line)
-            elif 'fix' in line:
-                fixes.append(line)
-            elif 'BREAKING' in line or '!' in line:
-                breaking_changes.append(line)
-            else:
-                other_changes.append(line)
+        try:
+            for line in self._run_git_stream(command):
+                if not line:
+                    continue
+                
+                match = _CC_RE.match(line)
+                if match is None:
+                    other_changes.append(line)
+                elif match.group(2) or 'BREAKING' in line:
+                    breaking_changes.append(line)
+                elif match.group(1) == 'feat':
+                    features.append(line)
+                elif match.group(1) == 'fix':
+                    fixes.append(line)
+                else:
+                    other_changes.append(line)
+        except (OSError, subprocess.SubprocessError):
+            return "Failed to generate release notes"
         
         # Generate markdown release notes
         release_notes = []
@@ -19,19 +19,156 @@ Copyright: 2025 CDSI - Compliance Data Systems Insights
 
 import json
 import logging
-import importlib
+import os
+import re
+import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any, Type
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
+from itertools import chain
 import yaml
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from ..core.heuristics_engine import TierLevel, PatternDefinition
+from ..utils.jit_compat import cond_jit
+
+# Optional NumPy import for pattern weight vectors
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for literal pattern matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Tier hierarchy, lowest first; a module is available at its tier and above
+_TIER_HIERARCHY: Tuple[TierLevel, ...] = (
+    TierLevel.AWARE,
+    TierLevel.BUILDER,
+    TierLevel.ACCELERATOR,
+    TierLevel.TRANSFORMER,
+    TierLevel.CHAMPION
+)
+_TIER_RANK: Dict[TierLevel, int] = {tier: rank for rank, tier in enumerate(_TIER_HIERARCHY)}
+
+# Flags the heuristics engine scans pattern text with
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+_REGEX_METACHARS = frozenset('.^$*+?{}[]()|')
+_WORD_CHAR_RE = re.compile(r'\w')
+
+# Parsed YAML per file, reused while that file's mtime and size are unchanged
+_MODULE_CACHE_FILE = ".module_cache.json"
+
+# Up to this many files are parsed inline; a thread pool isn't worth starting
+_PARALLEL_PARSE_MIN_FILES = 3
+_PARALLEL_PARSE_MAX_WORKERS = 8
+
+def _iter_yaml_files(root: Path) -> Iterator[str]:
+    """Yield paths of YAML files under root, using scandir's cached entry types"""
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(('.yaml', '.yml')) and entry.is_file():
+                    yield entry.path
+
+def _read_yaml(path: Any) -> Any:
+    """Parse a YAML file from its raw bytes (libyaml decodes UTF-8 itself)"""
+    with open(path, 'rb') as f:
+        return yaml.load(f.read(), Loader=_YAML_LOADER)
+
+def _open_yaml(path: Any, mode: str = 'r'):
+    """Open a YAML file as UTF-8 text regardless of locale, with a large buffer"""
+    return open(path, mode, encoding='utf-8', buffering=65536)
+
+def _parse_yaml_file(path: str) -> Any:
+    """Parse one YAML file, returning the exception instead of raising it"""
+    try:
+        return _read_yaml(path)
+    except Exception as e:
+        return e
+
+def _parse_yaml_files(paths: List[str]) -> List[Any]:
+    """Parse YAML files (concurrently when there are several), results in path order"""
+    if len(paths) < _PARALLEL_PARSE_MIN_FILES:
+        return [_parse_yaml_file(path) for path in paths]
+    # File reads and libyaml's C parser overlap across threads
+    with ThreadPoolExecutor(max_workers=min(_PARALLEL_PARSE_MAX_WORKERS, len(paths))) as pool:
+        return list(pool.map(_parse_yaml_file, paths))
+
+def _combine_regexes(regexes: Dict[str, re.Pattern]) -> Tuple[Optional[re.Pattern], List[str]]:
+    """Join regexes into one alternation of named groups p<i>; returns (regex, id of group i)
+    
+    Regexes with their own capture groups are left out, since their backreferences would shift.
+    """
+    group_ids = [pattern_id for pattern_id, regex in regexes.items() if regex.groups == 0]
+    if not group_ids:
+        return None, []
+    source = '|'.join(f'(?P<p{i}>{regexes[pattern_id].pattern})' for i, pattern_id in enumerate(group_ids))
+    try:
+        return re.compile(source, _PATTERN_FLAGS), group_ids
+    except re.error as e:
+        logger.warning(f"Failed to combine pattern regexes: {e}")
+        return None, []
+
+def _extract_literals(regex_src: str) -> Optional[List[str]]:
+    """Split a \\bLITERAL\\b|... pattern into its literals, or None if any part is a real regex"""
+    literals = []
+    for alternative in regex_src.split('|'):
+        if not (alternative.startswith('\\b') and alternative.endswith('\\b')):
+            return None
+        body = alternative[2:-2]
+        chars = []
+        escaped = False
+        for char in body:
+            if escaped:
+                # \s, \d, \b and friends are classes, not characters
+                if char.isalnum():
+                    return None
+                chars.append(char)
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char in _REGEX_METACHARS:
+                return None
+            else:
+                chars.append(char)
+        literal = ''.join(chars)
+        # \b only behaves like a word boundary next to word characters
+        if escaped or not literal or not (_WORD_CHAR_RE.match(literal[0]) and _WORD_CHAR_RE.match(literal[-1])):
+            return None
+        literals.append(literal)
+    return literals
+
+@cond_jit()
+def score_matches(match_counts, weights) -> float:
+    """Weighted risk score: sum of match count times risk weight over aligned arrays"""
+    total = 0.0
+    for i in range(len(match_counts)):
+        total += match_counts[i] * weights[i]
+    return total
+
 class ModuleType(Enum):
     """Types of regulatory modules"""
     GEOGRAPHIC = "geographic"
@@ -46,7 +183,7 @@ class ModuleStatus(Enum):
     DISABLED = "disabled"
     PENDING = "pending"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModuleDefinition:
     """Regulatory module definition"""
     id: str
@@ -59,16 +196,60 @@ class ModuleDefinition:
     active: bool = True
     patterns_file: Optional[str] = None
     config_file: Optional[str] = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_ts: float = field(default_factory=time.time, repr=False, compare=False)
+    
+    @property
+    def created_at(self) -> str:
+        """Creation time as an ISO string, formatted only when read"""
+        return datetime.fromtimestamp(self.created_ts).isoformat()
 
-@dataclass 
+@dataclass(slots=True)
 class LoadedModule:
-    """Loaded regulatory module with patterns"""
+    """Loaded regulatory module; its patterns file is read on first access"""
     definition: ModuleDefinition
-    patterns: Dict[str, PatternDefinition]
     status: ModuleStatus
-    load_time: str
     error_message: Optional[str] = None
+    pattern_loader: Optional[Callable[[], Dict[str, PatternDefinition]]] = field(default=None, repr=False, compare=False)
+    known_pattern_count: Optional[int] = None
+    load_time_ns: int = field(default_factory=time.monotonic_ns, repr=False, compare=False)
+    _wall_time: float = field(default_factory=time.time, init=False, repr=False, compare=False)
+    _load_time: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _patterns: Optional[Dict[str, PatternDefinition]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def load_time(self) -> str:
+        """Load time as an ISO string, formatted on first read"""
+        if self._load_time is None:
+            self._load_time = datetime.fromtimestamp(self._wall_time).isoformat()
+        return self._load_time
+    
+    @property
+    def patterns(self) -> Dict[str, PatternDefinition]:
+        """Patterns keyed by id, read from the module's patterns file on first access"""
+        if self._patterns is None:
+            self._patterns = self.pattern_loader() if self.pattern_loader else {}
+        return self._patterns
+    
+    @property
+    def pattern_count(self) -> int:
+        """Number of patterns, counted at discovery when possible to skip the file read"""
+        if self._patterns is None and self.known_pattern_count is not None:
+            return self.known_pattern_count
+        return len(self.patterns)
+
+@dataclass(slots=True)
+class PatternArrays:
+    """Loaded patterns as parallel columns; row i describes pattern ids[i]"""
+    ids: List[str]
+    compiled: List[Optional[re.Pattern]]
+    weights: Any
+    category_ids: Any
+    jurisdiction_ids: Any
+    categories: List[str]
+    jurisdictions: List[str]
+    
+    def __len__(self) -> int:
+        return len(self.ids)
 
 class RegulatoryModuleLoader:
     """
@@ -84,6 +265,29 @@ class RegulatoryModuleLoader:
         self.available_modules: Dict[str, ModuleDefinition] = {}
         self.tier_level = TierLevel.AWARE
         
+        # Modules available per tier as (definitions, ids), dropped when modules change
+        self._available_cache: Dict[TierLevel, Tuple[Tuple[ModuleDefinition, ...], frozenset]] = {}
+        
+        # Pattern files seen during discovery: path under modules_dir -> distinct pattern ids
+        self._pattern_counts: Dict[str, int] = {}
+        
+        # Bumped whenever a module is loaded or unloaded; keys the merged pattern dict
+        self._loaded_version = 0
+        self._patterns_cache: Optional[Tuple[int, Dict[str, PatternDefinition]]] = None
+        self._arrays_cache: Optional[Tuple[int, PatternArrays]] = None
+        
+        # Pattern regexes compiled once at load time, keyed by pattern id
+        self._compiled_patterns: Dict[str, re.Pattern] = {}
+        # Literal alternatives of \\bLITERAL\\b patterns, None for real regexes
+        self._pattern_literals: Dict[str, Optional[List[str]]] = {}
+        # Literal automaton as (pattern ids it was built from, automaton)
+        self._literal_automaton: Optional[Tuple[Tuple[str, ...], Any]] = None
+        # Per-tier scanners as (loaded version they were built at, (combined regex,
+        # group ids, leftover regexes)), built on first scan
+        self._tier_scanners: Dict[TierLevel, Tuple[int, Tuple[Optional[re.Pattern], List[str], Dict[str, re.Pattern]]]] = {}
+        # Combined alternation as (pattern ids it was built from, regex, group ids)
+        self._combined_regex: Optional[Tuple[Tuple[str, ...], Optional[re.Pattern], List[str]]] = None
+        
         # Initialize module directory
         self.modules_dir.mkdir(parents=True, exist_ok=True)
         
@@ -96,17 +300,43 @@ class RegulatoryModuleLoader:
         """Discover available regulatory modules"""
         try:
             # Look for module definition files
-            for module_file in self.modules_dir.glob("**/*.yaml"):
+            module_files = list(_iter_yaml_files(self.modules_dir))
+            
+            # Reuse parsed contents of files unchanged since the last run; parse the rest
+            root_len = len(os.fspath(self.modules_dir))
+            cached_files = self._read_module_cache()
+            file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+            stamps = {}
+            parsed = {}
+            for path in module_files:
+                stat = os.stat(path)
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+                entry = cached_files.get(path[root_len + 1:])
+                if entry is not None and entry[0] == stamps[path]:
+                    parsed[path] = entry[1]
+            to_parse = [path for path in module_files if path not in parsed]
+            parsed.update(zip(to_parse, _parse_yaml_files(to_parse)))
+            
+            for module_file in module_files:
+                module_data = parsed[module_file]
                 try:
-                    with open(module_file, 'r') as f:
-                        module_data = yaml.safe_load(f)
+                    if isinstance(module_data, Exception):
+                        raise module_data
+                    file_cache[module_file[root_len + 1:]] = (stamps[module_file], module_data)
+                    
+                    if 'id' not in module_data and 'patterns' in module_data:
+                        # A patterns file: count it so stats needn't parse it again
+                        self._pattern_counts[module_file[root_len + 1:]] = len({
+                            pattern_data.get('id') for pattern_data in module_data['patterns'] or []
+                        })
+                        continue
                     
                     # Convert to ModuleDefinition
                     module_def = ModuleDefinition(
                         id=module_data['id'],
                         name=module_data['name'],
                         module_type=ModuleType(module_data['type']),
-                        jurisdiction=module_data['jurisdiction'],
+                        jurisdiction=sys.intern(module_data['jurisdiction']),
                         tier_level=TierLevel(module_data.get('tier_level', 'aware')),
                         dependencies=module_data.get('dependencies', []),
                         version=module_data.get('version', '1.0.0'),
@@ -119,6 +349,11 @@ class RegulatoryModuleLoader:
                     
                 except Exception as e:
                     logger.error(f"Failed to load module definition from {module_file}: {e}")
+            
+            # Rewrite when a file was (re)parsed or one disappeared; failures aren't cached
+            reparsed = any(not isinstance(parsed[path], Exception) for path in to_parse)
+            if reparsed or len(file_cache) != len(cached_files):
+                self._write_module_cache(file_cache)
         
         except Exception as e:
             logger.error(f"Failed to discover modules: {e}")
@@ -127,6 +362,48 @@ class RegulatoryModuleLoader:
         if not self.available_modules:
             self._create_default_modules()
     
+    def _read_module_cache(self) -> Dict[str, Tuple[Tuple[int, int], Any]]:
+        """Load parsed file contents from the last run: relative path -> ((mtime_ns, size), data)"""
+        try:
+            with open(self.modules_dir / _MODULE_CACHE_FILE, 'rb') as f:
+                raw_cache = json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable module cache: {e}")
+            return {}
+        if not isinstance(raw_cache, dict):
+            return {}
+        file_cache = {}
+        for rel_path, entry in raw_cache.items():
+            try:
+                (mtime_ns, size), data = entry
+                file_cache[rel_path] = ((int(mtime_ns), int(size)), data)
+            except (TypeError, ValueError):
+                continue
+        return file_cache
+    
+    def _write_module_cache(self, file_cache: Dict[str, Tuple[Tuple[int, int], Any]]):
+        """Persist parsed file contents keyed by relative path, with the stamp they were read at"""
+        # Only plain JSON data is cached; files whose YAML holds anything else
+        # (dates, non-string keys) don't round-trip and are simply parsed again
+        raw_cache = {}
+        for rel_path, (stamp, data) in file_cache.items():
+            try:
+                if json.loads(json.dumps(data)) == data:
+                    raw_cache[rel_path] = [list(stamp), data]
+            except (TypeError, ValueError):
+                continue
+        
+        cache_file = self.modules_dir / _MODULE_CACHE_FILE
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(raw_cache, f, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to write module cache: {e}")
+    
     def _create_default_modules(self):
         """Create default regulatory modules"""
         default_modules = {
@@ -214,6 +491,8 @@ class RegulatoryModuleLoader:
         }
         
         self.available_modules.update(default_modules)
+        self._available_cache.clear()
+        self._tier_scanners.clear()
         
         # Save default module definitions
         for module_id, module_def in default_modules.items():
@@ -240,8 +519,8 @@ class RegulatoryModuleLoader:
                 'created_at': module_def.created_at
             }
             
-            with open(module_file, 'w') as f:
-                yaml.dump(module_data, f, default_flow_style=False)
+            with _open_yaml(module_file, 'w') as f:
+                yaml.dump(module_data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
                 
         except Exception as e:
             logger.error(f"Failed to save module definition {module_def.id}: {e}")
@@ -397,44 +676,89 @@ class RegulatoryModuleLoader:
         
         for filename, patterns in pattern_files.items():
             try:
-                with open(patterns_dir / filename, 'w') as f:
-                    yaml.dump(patterns, f, default_flow_style=False)
+                with _open_yaml(patterns_dir / filename, 'w') as f:
+                    yaml.dump(patterns, f, Dumper=_YAML_DUMPER, default_flow_style=False)
             except Exception as e:
                 logger.error(f"Failed to create pattern file {filename}: {e}")
     
     def set_tier_level(self, tier: TierLevel):
         """Set the current tier level for module loading"""
         self.tier_level = tier
+        # Also picks up any edits made to available_modules since the last change
+        self._available_cache.clear()
+        self._tier_scanners.clear()
         logger.info(f"Module loader tier level set to: {tier.value}")
     
+    def _available_for_tier(self, tier: TierLevel) -> Tuple[Tuple[ModuleDefinition, ...], frozenset]:
+        """Active modules at or below the tier, with their ids for membership tests"""
+        cached = self._available_cache.get(tier)
+        if cached is None:
+            current_tier_index = _TIER_RANK[tier]
+            modules = tuple(
+                module for module in self.available_modules.values()
+                if module.active and _TIER_RANK[module.tier_level] <= current_tier_index
+            )
+            cached = (modules, frozenset(module.id for module in modules))
+            self._available_cache[tier] = cached
+        return cached
+    
     def get_available_modules(self, tier: Optional[TierLevel] = None) -> List[ModuleDefinition]:
         """Get modules available for specified tier level"""
         if tier is None:
             tier = self.tier_level
+        return list(self._available_for_tier(tier)[0])
+    
+    def load_module(self, module_id: str) -> Optional[LoadedModule]:
+        """Load a specific regulatory module"""
+        return self.load_modules([module_id]).get(module_id)
+    
+    def _resolve_load_order(self, module_ids: List[str]) -> List[str]:
+        """Order requested modules and their unloaded dependencies, dependencies first
         
-        tier_hierarchy = [
-            TierLevel.AWARE,
-            TierLevel.BUILDER, 
-            TierLevel.ACCELERATOR,
-            TierLevel.TRANSFORMER,
-            TierLevel.CHAMPION
-        ]
-        
-        current_tier_index = tier_hierarchy.index(tier)
-        available = []
+        Raises ValueError if the dependencies form a cycle.
+        """
+        available_ids = self._available_for_tier(self.tier_level)[1]
         
-        for module in self.available_modules.values():
-            if not module.active:
+        # Transitive closure; modules gated out by tier are not expanded, as they won't load
+        adjacency: Dict[str, List[str]] = {}
+        stack = [module_id for module_id in module_ids if module_id in self.available_modules]
+        while stack:
+            module_id = stack.pop()
+            if module_id in adjacency:
                 continue
-                
-            module_tier_index = tier_hierarchy.index(module.tier_level)
-            if module_tier_index <= current_tier_index:
-                available.append(module)
+            deps = []
+            if module_id not in self.loaded_modules and module_id in available_ids:
+                deps = [
+                    dep_id for dep_id in self.available_modules[module_id].dependencies
+                    if dep_id in self.available_modules and dep_id not in self.loaded_modules
+                ]
+            adjacency[module_id] = deps
+            stack.extend(deps)
         
-        return available
+        # Kahn's algorithm
+        pending = {module_id: len(set(deps)) for module_id, deps in adjacency.items()}
+        dependents: Dict[str, List[str]] = {module_id: [] for module_id in adjacency}
+        for module_id, deps in adjacency.items():
+            for dep_id in set(deps):
+                dependents[dep_id].append(module_id)
+        
+        ready = deque(module_id for module_id, count in pending.items() if count == 0)
+        order = []
+        while ready:
+            module_id = ready.popleft()
+            order.append(module_id)
+            for dependent in dependents[module_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(order) != len(adjacency):
+            cycle = sorted(module_id for module_id, count in pending.items() if count > 0)
+            raise ValueError(f"Dependency cycle among modules: {', '.join(cycle)}")
+        return order
     
-    def load_module(self, module_id: str) -> Optional[LoadedModule]:
-        """Load a specific regulatory module"""
+    def _load_single(self, module_id: str, loaded_this_pass: Dict[str, LoadedModule]) -> Optional[LoadedModule]:
+        """Load one module whose dependencies have already been attempted"""
         if module_id not in self.available_modules:
             logger.error(f"Module {module_id} not found")
             return None
@@ -446,46 +770,44 @@ class RegulatoryModuleLoader:
         
         try:
             # Check tier level access
-            available_modules = self.get_available_modules()
-            if module_def not in available_modules:
+            if module_id not in self._available_for_tier(self.tier_level)[1]:
                 error_msg = f"Module {module_id} not available at tier {self.tier_level.value}"
                 logger.warning(error_msg)
                 return LoadedModule(
                     definition=module_def,
-                    patterns={},
                     status=ModuleStatus.DISABLED,
-                    load_time=datetime.now().isoformat(),
                     error_message=error_msg
                 )
             
-            # Load dependencies first
+            # Dependencies were loaded earlier in this pass (see _resolve_load_order)
             for dep_id in module_def.dependencies:
                 if dep_id not in self.loaded_modules:
-                    dep_module = self.load_module(dep_id)
+                    dep_module = loaded_this_pass.get(dep_id)
                     if not dep_module or dep_module.status != ModuleStatus.LOADED:
                         error_msg = f"Failed to load dependency {dep_id} for module {module_id}"
                         logger.error(error_msg)
                         return LoadedModule(
                             definition=module_def,
-                            patterns={},
                             status=ModuleStatus.FAILED,
-                            load_time=datetime.now().isoformat(),
                             error_message=error_msg
                         )
             
-            # Load patterns
-            patterns = self._load_module_patterns(module_def)
+            # Patterns are read on first access
+            known_count = None
+            if module_def.patterns_file:
+                known_count = self._pattern_counts.get(os.path.join("patterns", module_def.patterns_file))
             
             # Create loaded module
             loaded_module = LoadedModule(
                 definition=module_def,
-                patterns=patterns,
                 status=ModuleStatus.LOADED,
-                load_time=datetime.now().isoformat()
+                pattern_loader=partial(self._load_module_patterns, module_def),
+                known_pattern_count=known_count if module_def.patterns_file else 0
             )
             
             self.loaded_modules[module_id] = loaded_module
-            logger.info(f"Successfully loaded module {module_id} with {len(patterns)} patterns")
+            self._loaded_version += 1
+            logger.info(f"Successfully loaded module {module_id}")
             
             return loaded_module
         
@@ -495,9 +817,7 @@ class RegulatoryModuleLoader:
             
             failed_module = LoadedModule(
                 definition=module_def,
-                patterns={},
                 status=ModuleStatus.FAILED,
-                load_time=datetime.now().isoformat(),
                 error_message=error_msg
             )
             
@@ -514,69 +834,268 @@ class RegulatoryModuleLoader:
         patterns_file = self.modules_dir / "patterns" / module_def.patterns_file
         
         try:
-            if patterns_file.exists():
-                with open(patterns_file, 'r') as f:
-                    patterns_data = yaml.safe_load(f)
-                
-                for pattern_data in patterns_data.get('patterns', []):
-                    pattern = PatternDefinition(
-                        id=pattern_data['id'],
-                        text=pattern_data['text'],
-                        category=pattern_data['category'],
-                        risk_weight=pattern_data['risk_weight'],
-                        tier_level=module_def.tier_level,
-                        jurisdiction=pattern_data.get('jurisdiction', module_def.jurisdiction)
-                    )
-                    patterns[pattern.id] = pattern
+            patterns_data = _read_yaml(patterns_file)
             
+            for pattern_data in patterns_data.get('patterns', []):
+                pattern = PatternDefinition(
+                    id=pattern_data['id'],
+                    text=pattern_data['text'],
+                    # Few distinct values across many patterns: share one string each
+                    category=sys.intern(pattern_data['category']),
+                    risk_weight=pattern_data['risk_weight'],
+                    tier_level=module_def.tier_level,
+                    jurisdiction=sys.intern(pattern_data.get('jurisdiction', module_def.jurisdiction))
+                )
+                patterns[pattern.id] = pattern
+                
+                try:
+                    self._compiled_patterns[pattern.id] = re.compile(pattern.text, _PATTERN_FLAGS)
+                except re.error as e:
+                    logger.warning(f"Invalid regex for pattern {pattern.id}: {e}")
+                self._pattern_literals[pattern.id] = _extract_literals(pattern.text)
+        
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Failed to load patterns from {patterns_file}: {e}")
         
         return patterns
     
     def load_modules(self, module_ids: List[str]) -> Dict[str, LoadedModule]:
-        """Load multiple modules"""
-        loaded = {}
+        """Load multiple modules, resolving dependencies in one ordered pass"""
+        try:
+            order = self._resolve_load_order(module_ids)
+        except ValueError as e:
+            logger.error(str(e))
+            loaded = {}
+            for module_id in module_ids:
+                if module_id in self.loaded_modules:
+                    loaded[module_id] = self.loaded_modules[module_id]
+                elif module_id in self.available_modules:
+                    loaded[module_id] = self.loaded_modules[module_id] = LoadedModule(
+                        definition=self.available_modules[module_id],
+                        status=ModuleStatus.FAILED,
+                        error_message=f"Failed to load module {module_id}: {e}"
+                    )
+            return loaded
+        
+        loaded_this_pass: Dict[str, LoadedModule] = {}
+        for module_id in order:
+            module = self._load_single(module_id, loaded_this_pass)
+            if module:
+                loaded_this_pass[module_id] = module
         
+        loaded = {}
         for module_id in module_ids:
-            module = self.load_module(module_id)
+            module = loaded_this_pass.get(module_id) or self._load_single(module_id, loaded_this_pass)
             if module:
                 loaded[module_id] = module
         
         return loaded
     
     def get_all_patterns(self) -> Dict[str, PatternDefinition]:
-        """Get all patterns from loaded modules"""
-        all_patterns = {}
+        """Get all patterns from loaded modules (shared between calls; treat as read-only)"""
+        if self._patterns_cache is None or self._patterns_cache[0] != self._loaded_version:
+            all_patterns = dict(chain.from_iterable(
+                m.patterns.items() for m in self.loaded_modules.values()
+                if m.status is ModuleStatus.LOADED
+            ))
+            self._patterns_cache = (self._loaded_version, all_patterns)
+        return self._patterns_cache[1]
+    
+    def get_pattern_arrays(self) -> PatternArrays:
+        """Get loaded patterns as columns for vectorized scanning and scoring
         
-        for loaded_module in self.loaded_modules.values():
-            if loaded_module.status == ModuleStatus.LOADED:
-                all_patterns.update(loaded_module.patterns)
+        Weights are float32 and category/jurisdiction codes int16 (NumPy arrays,
+        or array.array without NumPy); codes index the categories/jurisdictions lists.
+        """
+        if self._arrays_cache is None or self._arrays_cache[0] != self._loaded_version:
+            patterns = list(self.get_all_patterns().values())
+            category_codes: Dict[str, int] = {}
+            jurisdiction_codes: Dict[str, int] = {}
+            category_ids = [category_codes.setdefault(p.category, len(category_codes)) for p in patterns]
+            jurisdiction_ids = [
+                jurisdiction_codes.setdefault(p.jurisdiction, len(jurisdiction_codes)) for p in patterns
+            ]
+            weights = [p.risk_weight for p in patterns]
+            if NUMPY_AVAILABLE:
+                weights = np.array(weights, dtype=np.float32)
+                category_ids = np.array(category_ids, dtype=np.int16)
+                jurisdiction_ids = np.array(jurisdiction_ids, dtype=np.int16)
+            else:
+                weights = array('f', weights)
+                category_ids = array('h', category_ids)
+                jurisdiction_ids = array('h', jurisdiction_ids)
+            
+            arrays = PatternArrays(
+                ids=[p.id for p in patterns],
+                compiled=[self._compiled_patterns.get(p.id) for p in patterns],
+                weights=weights,
+                category_ids=category_ids,
+                jurisdiction_ids=jurisdiction_ids,
+                categories=list(category_codes),
+                jurisdictions=list(jurisdiction_codes)
+            )
+            self._arrays_cache = (self._loaded_version, arrays)
+        return self._arrays_cache[1]
+    
+    def get_pattern_weights(self) -> Tuple[List[str], Any]:
+        """Get loaded pattern ids and their risk weights (a float64 array) in the same order
+        
+        Build match counts aligned with the ids and pass both arrays to score_matches.
+        """
+        all_patterns = self.get_all_patterns()
+        weights = [pattern.risk_weight for pattern in all_patterns.values()]
+        if NUMPY_AVAILABLE:
+            weights = np.array(weights, dtype=np.float64)
+        return list(all_patterns), weights
+    
+    def get_all_compiled_patterns(self) -> Dict[str, Tuple[float, re.Pattern]]:
+        """Get (risk_weight, compiled regex) for all patterns from loaded modules"""
+        compiled = self._compiled_patterns
+        return {
+            pattern_id: (pattern.risk_weight, compiled[pattern_id])
+            for pattern_id, pattern in self.get_all_patterns().items()
+            if pattern_id in compiled
+        }
+    
+    def get_combined_regex(self) -> Tuple[Optional[re.Pattern], List[str]]:
+        """Get one alternation over all loaded patterns for single-pass scanning
         
-        return all_patterns
+        Each pattern is wrapped in a named group p<i>; a match's lastgroup maps to
+        a pattern id via the returned list. Overlapping matches from different
+        patterns are not reported, and patterns with their own capture groups are
+        left out (their backreferences would shift) - scan those individually.
+        """
+        compiled = self.get_all_compiled_patterns()
+        key = tuple(compiled)
+        if self._combined_regex is None or self._combined_regex[0] != key:
+            regex, group_ids = _combine_regexes({pattern_id: rx for pattern_id, (_, rx) in compiled.items()})
+            self._combined_regex = (key, regex, group_ids)
+        return self._combined_regex[1], self._combined_regex[2]
+    
+    def _tier_scanner(self, tier: TierLevel) -> Tuple[Optional[re.Pattern], List[str], Dict[str, re.Pattern]]:
+        """Combined regex, its group ids, and leftover regexes for every module available at tier"""
+        cached = self._tier_scanners.get(tier)
+        if cached is None or cached[0] != self._loaded_version:
+            regexes = {}
+            for module_def in self._available_for_tier(tier)[0]:
+                loaded_module = self.loaded_modules.get(module_def.id)
+                if loaded_module is not None and loaded_module.status is ModuleStatus.LOADED:
+                    patterns = loaded_module.patterns
+                else:
+                    patterns = self._load_module_patterns(module_def)
+                for pattern_id in patterns:
+                    regex = self._compiled_patterns.get(pattern_id)
+                    if regex is not None:
+                        regexes[pattern_id] = regex
+            
+            combined, group_ids = _combine_regexes(regexes)
+            grouped = set(group_ids)
+            residual = {pattern_id: regex for pattern_id, regex in regexes.items() if pattern_id not in grouped}
+            cached = self._tier_scanners[tier] = (self._loaded_version, (combined, group_ids, residual))
+        return cached[1]
+    
+    def scan(self, text: str) -> List[str]:
+        """Scan text with every pattern available at the current tier; one pattern id per match
+        
+        The combined regex is specialised per tier and cached, so patterns from
+        modules gated out at this tier are never part of the scan.
+        """
+        combined, group_ids, residual = self._tier_scanner(self.tier_level)
+        matches = []
+        if combined is not None:
+            matches.extend(group_ids[int(match.lastgroup[1:])] for match in combined.finditer(text))
+        for pattern_id, regex in residual.items():
+            matches.extend(pattern_id for _ in regex.finditer(text))
+        return matches
+    
+    def get_literal_matcher(self) -> Tuple[Any, Dict[str, re.Pattern]]:
+        """Get an Aho-Corasick automaton for literal patterns plus the residual regexes
+        
+        The automaton holds lowercased literals (values are (literal, pattern ids))
+        and must be fed text.lower(); hits still need a word-boundary check. Patterns
+        that are not plain literals are returned as regexes to scan the usual way.
+        count_pattern_matches does both. Without pyahocorasick the automaton is
+        None and every pattern is residual.
+        """
+        compiled = self.get_all_compiled_patterns()
+        if not AHOCORASICK_AVAILABLE:
+            return None, {pattern_id: regex for pattern_id, (_, regex) in compiled.items()}
+        
+        literal_ids = [pattern_id for pattern_id in compiled if self._pattern_literals.get(pattern_id)]
+        key = tuple(literal_ids)
+        if self._literal_automaton is None or self._literal_automaton[0] != key:
+            owners: Dict[str, List[str]] = {}
+            for pattern_id in literal_ids:
+                for literal in self._pattern_literals[pattern_id]:
+                    owners.setdefault(literal.lower(), []).append(pattern_id)
+            automaton = None
+            if owners:
+                automaton = ahocorasick.Automaton()
+                for literal, pattern_ids in owners.items():
+                    automaton.add_word(literal, (literal, tuple(dict.fromkeys(pattern_ids))))
+                automaton.make_automaton()
+            self._literal_automaton = (key, automaton)
+        
+        literal_set = set(literal_ids)
+        residual = {pattern_id: regex for pattern_id, (_, regex) in compiled.items() if pattern_id not in literal_set}
+        return self._literal_automaton[1], residual
+    
+    def count_pattern_matches(self, text: str) -> Dict[str, int]:
+        """Count matches per loaded pattern: one automaton pass, regexes for the rest"""
+        automaton, residual = self.get_literal_matcher()
+        counts: Dict[str, int] = {}
+        
+        if automaton is not None:
+            lowered = text.lower()
+            spans: Dict[str, List[Tuple[int, int]]] = {}
+            for end, (literal, pattern_ids) in automaton.iter(lowered):
+                start = end - len(literal) + 1
+                if start > 0 and _WORD_CHAR_RE.match(lowered[start - 1]):
+                    continue
+                if end + 1 < len(lowered) and _WORD_CHAR_RE.match(lowered[end + 1]):
+                    continue
+                for pattern_id in pattern_ids:
+                    spans.setdefault(pattern_id, []).append((start, end))
+            for pattern_id, pattern_spans in spans.items():
+                # Like finditer, don't count a match overlapping an earlier one
+                count = 0
+                last_end = -1
+                for start, end in sorted(pattern_spans):
+                    if start > last_end:
+                        count += 1
+                        last_end = end
+                counts[pattern_id] = count
+        
+        for pattern_id, regex in residual.items():
+            count = sum(1 for _ in regex.finditer(text))
+            if count:
+                counts[pattern_id] = count
+        
+        return counts
     
     def get_module_stats(self) -> Dict[str, Any]:
         """Get module loading statistics"""
         total_available = len(self.available_modules)
-        total_loaded = len([m for m in self.loaded_modules.values() if m.status == ModuleStatus.LOADED])
-        total_failed = len([m for m in self.loaded_modules.values() if m.status == ModuleStatus.FAILED])
-        total_disabled = len([m for m in self.loaded_modules.values() if m.status == ModuleStatus.DISABLED])
+        status_counts = Counter(m.status for m in self.loaded_modules.values())
+        total_loaded = status_counts[ModuleStatus.LOADED]
+        total_failed = status_counts[ModuleStatus.FAILED]
+        total_disabled = status_counts[ModuleStatus.DISABLED]
         
         # Category breakdown
-        category_stats = {}
-        for module_def in self.available_modules.values():
-            module_type = module_def.module_type.value
-            if module_type not in category_stats:
-                category_stats[module_type] = {'available': 0, 'loaded': 0}
-            category_stats[module_type]['available'] += 1
-            
-            if module_def.id in self.loaded_modules:
-                loaded_module = self.loaded_modules[module_def.id]
-                if loaded_module.status == ModuleStatus.LOADED:
-                    category_stats[module_type]['loaded'] += 1
+        available_counts = Counter(m.module_type.value for m in self.available_modules.values())
+        loaded_counts = Counter(
+            m.definition.module_type.value for module_id, m in self.loaded_modules.items()
+            if m.status == ModuleStatus.LOADED and module_id in self.available_modules
+        )
+        category_stats = {
+            module_type: {'available': count, 'loaded': loaded_counts[module_type]}
+            for module_type, count in available_counts.items()
+        }
         
         # Pattern count
-        total_patterns = sum(len(m.patterns) for m in self.loaded_modules.values() 
+        total_patterns = sum(m.pattern_count for m in self.loaded_modules.values() 
                            if m.status == ModuleStatus.LOADED)
         
         return {
@@ -596,6 +1115,7 @@ class RegulatoryModuleLoader:
         """Unload a specific module"""
         if module_id in self.loaded_modules:
             del self.loaded_modules[module_id]
+            self._loaded_version += 1
             logger.info(f"Unloaded module {module_id}")
             return True
         return False
@@ -655,10 +1175,7 @@ def main():
     print(f"\n🎯 Total Patterns Loaded: {len(all_patterns)}")
     
     # Show pattern breakdown by category
-    category_counts = {}
-    for pattern in all_patterns.values():
-        category = pattern.category
-        category_counts[category] = category_counts.get(category, 0) + 1
+    category_counts = Counter(pattern.category for pattern in all_patterns.values())
     
     print(f"\n📂 Pattern Categories:")
     for category, count in category_counts.items():
@@ -9,22 +9,50 @@ Processes feeds, matches keywords, and creates structured outputs.
 """
 
 import asyncio
+import atexit
 import json
 import logging
+import multiprocessing
 import re
-from datetime import datetime, timedelta
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Protocol, Set
+from dataclasses import dataclass, fields
 from urllib.parse import urlparse
+from xml.parsers import expat
 import hashlib
 
 import feedparser
+from dateutil import parser as date_parser
 import yaml
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# Optional memory-mapped Bloom filter for processed-item tracking
+try:
+    from pybloomfilter import BloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
+# Optional orjson import for faster tracking and results (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,7 +60,235 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Processed-item filter sizing; a false positive only skips one genuinely new item
+_BLOOM_CAPACITY = 1_000_000
+_BLOOM_ERROR_RATE = 1e-6
+
+# Retry policy and connection pool size for the shared feed session; concurrent
+# fetches of feeds on the same host each need their own pooled connection
+_RETRY_STRATEGY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+_HTTP_POOL_SIZE = 32
+
+# Prefer libyaml's C loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# UTC offsets in seconds for US zone abbreviations dateutil cannot resolve itself
+_US_TZINFOS = {
+    'EST': -18000, 'EDT': -14400, 'CST': -21600, 'CDT': -18000,
+    'MST': -25200, 'MDT': -21600, 'PST': -28800, 'PDT': -25200,
+}
+
+_WORD_CHAR_RE = re.compile(r'\w')
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize to compact JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple:
+    """Field names of a dataclass, looked up once per class"""
+    return tuple(f.name for f in fields(cls))
+
+def _flat_asdict(obj: Any) -> Dict[str, Any]:
+    """Shallow dict of a flat dataclass, without asdict()'s recursive deep copy"""
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+def _write_regulatory_items(json_file: Path, json_data: Dict, yaml_file: Path, yaml_data: Dict):
+    """Write the JSON and YAML regulatory item files"""
+    json_file.write_bytes(_dump_json(json_data))
+    with open(yaml_file, 'w') as f:
+        yaml.dump(yaml_data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+
+@lru_cache(maxsize=4096)
+def _parse_published(value: str) -> Optional[datetime]:
+    """Parse a date feedparser could not, as naive UTC to match published_parsed"""
+    try:
+        published = date_parser.parse(value, tzinfos=_US_TZINFOS)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if published.tzinfo is not None:
+        published = published.astimezone(timezone.utc).replace(tzinfo=None)
+    return published
+
+# Processed-item log record size: item ids are 32-char hex BLAKE2b-128 digests
+_DIGEST_SIZE = 16
+
+class _ProcessedIds:
+    """Processed item ids kept as raw 16-byte digests, remembering those not yet saved"""
+    
+    __slots__ = ('_digests', 'unsaved')
+    
+    def __init__(self, digests=()):
+        self._digests = set(digests)
+        self.unsaved: List[bytes] = []
+    
+    @staticmethod
+    def digest(item_id: str) -> bytes:
+        """Raw bytes of a hex item id; any other id is hashed down to the same size"""
+        if len(item_id) == 2 * _DIGEST_SIZE:
+            try:
+                return bytes.fromhex(item_id)
+            except ValueError:
+                pass
+        return hashlib.blake2b(item_id.encode(), digest_size=_DIGEST_SIZE).digest()
+    
+    def __contains__(self, item_id: str) -> bool:
+        return self.digest(item_id) in self._digests
+    
+    def __len__(self) -> int:
+        return len(self._digests)
+    
+    def add(self, item_id: str):
+        digest = self.digest(item_id)
+        if digest not in self._digests:
+            self._digests.add(digest)
+            self.unsaved.append(digest)
+    
+    def update(self, item_ids):
+        for item_id in item_ids:
+            self.add(item_id)
+    
+    def hex_ids(self) -> List[str]:
+        """Stored ids in hex form"""
+        return [digest.hex() for digest in self._digests]
+
+class _BloomProcessedIds:
+    """Processed item ids checked against a Bloom filter; new ids are still queued for the digest log"""
+    
+    __slots__ = ('bloom', 'unsaved')
+    
+    def __init__(self, bloom: "BloomFilter", unsaved: Optional[List[bytes]] = None):
+        self.bloom = bloom
+        self.unsaved: List[bytes] = unsaved if unsaved is not None else []
+    
+    def __contains__(self, item_id: str) -> bool:
+        # Keyed by the hex digest, which for real item ids is the id itself
+        return _ProcessedIds.digest(item_id).hex() in self.bloom
+    
+    def add(self, item_id: str):
+        digest = _ProcessedIds.digest(item_id)
+        if not self.bloom.add(digest.hex()):
+            self.unsaved.append(digest)
+
+class _ProcessedIdStore(Protocol):
+    """Processed-id tracking as used by the monitor: membership, add, and digests pending save"""
+    
+    unsaved: List[bytes]
+    
+    def __contains__(self, item_id: str) -> bool: ...
+    
+    def add(self, item_id: str): ...
+
+# Feed bodies are read and scanned this many bytes at a time
+_FEED_READ_CHUNK = 65536
+_ENTRY_TAGS = frozenset(('item', 'entry'))
+_UTF16_BOMS = (b'\xff\xfe', b'\xfe\xff')
+
+class _EntryLimitScanner:
+    """Find where a feed's max_items-th entry ends while its body is still arriving
+    
+    expat only tracks element nesting here; the document up to that entry's
+    end tag, with its open ancestors closed, is still parsed by feedparser,
+    so xml:base, namespaces and sanitizing behave exactly as on the full feed.
+    """
+    
+    __slots__ = ('_parser', '_open', '_entries', '_max_items', 'data', 'prefix', 'failed')
+    
+    def __init__(self, max_items: int):
+        self._parser = expat.ParserCreate()
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._open: List[str] = []
+        self._entries = 0
+        self._max_items = max_items
+        self.data = bytearray()
+        self.prefix: Optional[bytes] = None
+        self.failed = max_items <= 0
+    
+    def _start(self, name: str, attrs: Dict[str, str]):
+        self._open.append(name)
+    
+    def _end(self, name: str):
+        self._open.pop()
+        # Entries sit at most two levels deep: rss/channel/item, feed/entry, rdf:RDF/item
+        if (self.prefix is not None or len(self._open) > 2
+                or name.rpartition(':')[2] not in _ENTRY_TAGS):
+            return
+        self._entries += 1
+        if self._entries == self._max_items:
+            end = self.data.index(b'>', self._parser.CurrentByteIndex) + 1
+            closing = ''.join(f'</{tag}>' for tag in reversed(self._open))
+            self.prefix = bytes(self.data[:end]) + closing.encode('ascii')
+    
+    def feed(self, chunk: bytes) -> bool:
+        """Scan the next chunk of the body; True once the entry limit is reached"""
+        self.data += chunk
+        if not self.failed:
+            if len(self.data) == len(chunk) and self.data.startswith(_UTF16_BOMS):
+                # Closing tags are appended as ASCII
+                self.failed = True
+                return False
+            try:
+                self._parser.Parse(chunk, False)
+            except (expat.ExpatError, UnicodeError, ValueError):
+                # e.g. HTML entities or an encoding expat lacks: use the whole body
+                self.failed = True
+        return self.prefix is not None
+
+def _read_feed_body(raw: Any, max_items: int) -> bytes:
+    """Read a feed body from its stream, stopping after max_items entries have arrived
+    
+    Returns a well-formed prefix of the document holding only those entries,
+    or the whole body when it has fewer or cannot be scanned.
+    """
+    scanner = _EntryLimitScanner(max_items)
+    while True:
+        chunk = raw.read(_FEED_READ_CHUNK)
+        if not chunk:
+            return bytes(scanner.data)
+        if scanner.feed(chunk):
+            return scanner.prefix
+
+def _parse_feed_bytes(body: bytes, max_items: int) -> List:
+    """Parse a fetched feed body into at most max_items entries"""
+    return feedparser.parse(body).entries[:max_items]
+
+# Feed parsing worker processes, started on first use when
+# monitoring.parse_processes is set; with 0, feeds are parsed in a thread
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+def _get_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Start the shared feed parsing pool once; it is shut down at interpreter exit"""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # Never fork: fetch threads may hold locks mid-request when a worker starts
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        atexit.register(_shutdown_parse_pool)
+    return _PARSE_POOL
+
+def _shutdown_parse_pool():
+    """Stop the feed parsing workers, if any were started"""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(wait=True, cancel_futures=True)
+        _PARSE_POOL = None
+
+@dataclass(slots=True)
 class RegulatoryItem:
     """Structured regulatory information item"""
     id: str
@@ -46,7 +302,7 @@ class RegulatoryItem:
     risk_level: str  # informational, medium, high
     timestamp_processed: str
 
-@dataclass
+@dataclass(slots=True)
 class MonitoringResult:
     """Results of RSS monitoring run"""
     timestamp: str
@@ -59,6 +315,23 @@ class MonitoringResult:
 class RSSMonitor:
     """Professional RSS monitoring for regulatory feeds"""
     
+    _SESSION: Optional[requests.Session] = None
+    
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Build the shared HTTP session once; its pool keeps connections alive across feeds"""
+        if cls._SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_HTTP_POOL_SIZE,
+                pool_maxsize=_HTTP_POOL_SIZE,
+                max_retries=_RETRY_STRATEGY
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            cls._SESSION = session
+        return cls._SESSION
+    
     def __init__(self, config_path: str = "config/rss_sources.yaml"):
         self.config_path = Path(config_path)
         self.data_dir = Path("data")
@@ -67,57 +340,141 @@ class RSSMonitor:
         # Load configuration
         self.config = self._load_config()
         self.keywords = self._load_keywords()
+        # One automaton pass when pyahocorasick is installed, else a regex per category
+        self._keyword_automaton = self._build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+        self._keyword_patterns = {} if AHOCORASICK_AVAILABLE else self._compile_keyword_patterns()
+        # Lower-cased match text back to the configured keyword, per category
+        self._keyword_lookup = {
+            category: {keyword.lower(): keyword for keyword in keywords}
+            for category, keywords in self.keywords.items()
+        }
         
-        # Setup HTTP session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # HTTP session with retry strategy, shared by every monitor in the process
+        self.session = RSSMonitor._get_session()
         
         # Initialize tracking
         self.processed_items = self._load_processed_items()
+        # Per feed URL validators ({'etag': ..., 'modified': ...}) for conditional GETs
+        self.feed_cache = self._load_feed_cache()
         
     def _load_config(self) -> Dict:
         """Load RSS source configuration"""
         try:
             with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YAML_LOADER)
         except FileNotFoundError:
             logger.warning(f"Config file not found: {self.config_path}")
             return self._get_default_config()
     
     def _load_keywords(self) -> Dict[str, List[str]]:
-        """Load regulatory keywords for matching"""
+        """Load regulatory keywords for matching
+        
+        Categories and keywords are interned: every matched item and the per-run
+        keyword tally then share one string object per keyword.
+        """
         keyword_path = Path("config/regulatory_keywords.yaml")
         try:
             with open(keyword_path, 'r') as f:
-                return yaml.safe_load(f)
+                keywords = yaml.load(f, Loader=_YAML_LOADER)
         except FileNotFoundError:
-            return self._get_default_keywords()
+            keywords = self._get_default_keywords()
+        return {
+            sys.intern(category): [sys.intern(keyword) for keyword in category_keywords]
+            for category, category_keywords in keywords.items()
+        }
+    
+    def _compile_keyword_patterns(self) -> Dict[str, re.Pattern]:
+        """Compile each keyword category into one case-insensitive, word-bounded regex
+        
+        The alternation sits in a lookahead so overlapping keywords such as
+        'personal data' and 'data protection' are both found.
+        """
+        patterns = {}
+        for category, keywords in self.keywords.items():
+            if not keywords:
+                continue
+            alternation = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+            patterns[category] = re.compile(rf'(?=\b({alternation})\b)', re.IGNORECASE)
+        return patterns
+    
+    def _build_keyword_automaton(self) -> Optional["ahocorasick.Automaton"]:
+        """Build one automaton over all lowercased keywords
+        
+        Values are (keyword length, ((category, keyword), ...)) since the same
+        keyword may appear in several categories.
+        """
+        owners: Dict[str, List[tuple]] = {}
+        for category, keywords in self.keywords.items():
+            for keyword in keywords:
+                owners.setdefault(keyword.lower(), []).append((category, keyword))
+        if not owners:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for lowered, hits in owners.items():
+            automaton.add_word(lowered, (len(lowered), tuple(hits)))
+        automaton.make_automaton()
+        return automaton
+    
+    def _load_processed_items(self) -> _ProcessedIdStore:
+        """Load previously processed item IDs
+        
+        With pybloomfiltermmap3 installed lookups go to a memory-mapped Bloom
+        filter, seeded once from the existing log; otherwise the digest log
+        itself. Either way the digest log stays the record of what was processed.
+        """
+        bloom_file = self.data_dir / "processed_items.bloom"
+        if BLOOM_AVAILABLE and bloom_file.exists():
+            return _BloomProcessedIds(BloomFilter.open(str(bloom_file)))
+        
+        processed = self._load_processed_log()
+        if not BLOOM_AVAILABLE:
+            return processed
+        
+        bloom = BloomFilter(_BLOOM_CAPACITY, _BLOOM_ERROR_RATE, str(bloom_file))
+        bloom.update(processed.hex_ids())
+        # Ids migrated from the JSON list still need writing to the log
+        return _BloomProcessedIds(bloom, processed.unsaved)
     
-    def _load_processed_items(self) -> Set[str]:
-        """Load previously processed item IDs"""
+    def _load_processed_log(self) -> _ProcessedIds:
+        """Read the append-only digest log, migrating the old JSON id list if there is no log yet"""
+        log_file = self.data_dir / "processed_items.bin"
+        if log_file.exists():
+            data = log_file.read_bytes()
+            whole = len(data) - len(data) % _DIGEST_SIZE
+            if whole != len(data):
+                # A run died mid-append; drop the partial record so later appends stay aligned
+                with open(log_file, 'r+b') as f:
+                    f.truncate(whole)
+            return _ProcessedIds(data[i:i + _DIGEST_SIZE] for i in range(0, whole, _DIGEST_SIZE))
+        
+        processed = _ProcessedIds()
         processed_file = self.data_dir / "processed_items.json"
         if processed_file.exists():
-            with open(processed_file, 'r') as f:
-                data = json.load(f)
-                return set(data.get('processed_ids', []))
-        return set()
+            # Left unsaved, so the first save writes them all to the log
+            processed.update(_load_json(processed_file.read_bytes()).get('processed_ids', []))
+        return processed
+    
+    def _load_feed_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load ETag/Last-Modified validators from the previous run"""
+        cache_file = self.data_dir / "feed_cache.json"
+        if cache_file.exists():
+            return _load_json(cache_file.read_bytes())
+        return {}
     
     def _save_processed_items(self):
         """Save processed item IDs to prevent reprocessing"""
-        processed_file = self.data_dir / "processed_items.json"
-        data = {
-            'last_updated': datetime.now().isoformat(),
-            'processed_ids': list(self.processed_items)
-        }
-        with open(processed_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        (self.data_dir / "feed_cache.json").write_bytes(_dump_json(self.feed_cache))
+        
+        if isinstance(self.processed_items, _BloomProcessedIds):
+            # Memory-mapped, so flushing it is all the filter needs
+            self.processed_items.bloom.sync()
+        
+        # Append only this run's ids: 16 bytes each, no rewrite of the whole history
+        if self.processed_items.unsaved:
+            with open(self.data_dir / "processed_items.bin", 'ab') as f:
+                f.write(b''.join(self.processed_items.unsaved))
+            self.processed_items.unsaved.clear()
     
     def _get_default_config(self) -> Dict:
         """Default RSS feed configuration (official sources only)"""
@@ -157,7 +514,8 @@ class RSSMonitor:
             'monitoring': {
                 'max_items_per_feed': 50,
                 'lookback_days': 30,
-                'request_timeout': 30
+                'request_timeout': 30,
+                'parse_processes': 0
             }
         }
     
@@ -186,54 +544,115 @@ class RSSMonitor:
     def _generate_item_id(self, title: str, url: str, published: str) -> str:
         """Generate unique ID for regulatory item"""
         content = f"{title}{url}{published}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # Not a security token: BLAKE2b-128 is cheaper than MD5 on short inputs, same 32-char hex
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    
+    def _scan_keywords(self, text: str) -> Dict[str, Dict[str, None]]:
+        """Keywords found in text per category, each once, in order of appearance"""
+        found: Dict[str, Dict[str, None]] = {}
+        if self._keyword_automaton is not None:
+            lowered = text.lower()
+            for end, (length, hits) in self._keyword_automaton.iter(lowered):
+                start = end - length + 1
+                if start > 0 and _WORD_CHAR_RE.match(lowered[start - 1]):
+                    continue
+                if end + 1 < len(lowered) and _WORD_CHAR_RE.match(lowered[end + 1]):
+                    continue
+                for category, keyword in hits:
+                    found.setdefault(category, {})[keyword] = None
+            return found
+        
+        for category, pattern in self._keyword_patterns.items():
+            matches = pattern.findall(text)
+            if matches:
+                lookup = self._keyword_lookup[category]
+                found[category] = dict.fromkeys(lookup.get(match.lower(), match) for match in matches)
+        return found
     
     def _match_keywords(self, text: str) -> tuple[List[str], str]:
         """Match keywords and determine risk level"""
-        text_lower = text.lower()
-        matched_keywords = []
-        risk_level = "informational"
+        found = self._scan_keywords(text)
+        matched_keywords = [keyword for category in self.keywords for keyword in found.get(category, ())]
         
-        for category, keywords in self.keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    matched_keywords.append(keyword)
-                    
-                    # Determine risk level based on keyword category
-                    if category == 'high_risk_terms':
-                        risk_level = "high"
-                    elif category in ['compliance_terms', 'ai_terms'] and risk_level == "informational":
-                        risk_level = "medium"
+        # Risk level follows from which categories matched, not from each keyword
+        if 'high_risk_terms' in found:
+            risk_level = "high"
+        elif 'compliance_terms' in found or 'ai_terms' in found:
+            risk_level = "medium"
+        else:
+            risk_level = "informational"
         
         return matched_keywords, risk_level
     
-    async def monitor_feed(self, feed_config: Dict) -> List[RegulatoryItem]:
-        """Monitor single RSS feed for regulatory updates"""
+    async def monitor_feed(self, feed_config: Dict,
+                           seen_this_run: Optional[Set[bytes]] = None,
+                           processed_at: Optional[str] = None) -> List[RegulatoryItem]:
+        """Monitor single RSS feed for regulatory updates
+        
+        seen_this_run, shared across the feeds of one run, holds short title+link
+        digests so an item cross-posted to several feeds is only matched once.
+        processed_at is the run's ISO timestamp, stamped on every new item.
+        """
         logger.info(f"Monitoring feed: {feed_config['name']}")
         
         try:
-            # Fetch feed with timeout
-            response = self.session.get(
-                feed_config['url'],
-                timeout=self.config['monitoring']['request_timeout']
+            # Conditional GET: unchanged feeds answer 304 and are not parsed at all
+            url = feed_config['url']
+            validators = self.feed_cache.get(url, {})
+            headers = {}
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('modified'):
+                headers['If-Modified-Since'] = validators['modified']
+            
+            # Fetch feed with timeout; blocking I/O runs in a worker thread so feeds overlap
+            response = await asyncio.to_thread(
+                self.session.get,
+                url,
+                headers=headers,
+                timeout=self.config['monitoring']['request_timeout'],
+                stream=True
             )
-            response.raise_for_status()
+            max_items = self.config['monitoring']['max_items_per_feed']
+            try:
+                if response.status_code == 304:
+                    logger.info(f"Feed unchanged since last run: {feed_config['name']}")
+                    return []
+                response.raise_for_status()
+                etag = response.headers.get('ETag')
+                modified = response.headers.get('Last-Modified')
+                
+                # Read the body straight from the socket so requests never
+                # buffers a second copy of it, and stop once max_items entries are in
+                response.raw.decode_content = True
+                body = await asyncio.to_thread(_read_feed_body, response.raw, max_items)
+            finally:
+                response.close()
             
-            # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            # Parse off the event loop so other feeds keep fetching meanwhile;
+            # worker processes let several feeds parse at once, past the GIL
+            parse_processes = self.config['monitoring'].get('parse_processes', 0)
+            if parse_processes:
+                entries = await asyncio.get_running_loop().run_in_executor(
+                    _get_parse_pool(parse_processes), _parse_feed_bytes, body, max_items
+                )
+            else:
+                entries = await asyncio.to_thread(_parse_feed_bytes, body, max_items)
             
             items = []
-            max_items = self.config['monitoring']['max_items_per_feed']
+            timestamp_processed = processed_at or datetime.now().isoformat()
             cutoff_date = datetime.now() - timedelta(
                 days=self.config['monitoring']['lookback_days']
             )
             
-            for entry in feed.entries[:max_items]:
+            for entry in entries:
                 # Parse publication date
                 try:
                     published = datetime(*entry.published_parsed[:6])
-                except (AttributeError, ValueError):
-                    published = datetime.now()
+                except (AttributeError, TypeError, ValueError):
+                    # Formats feedparser gives up on; without this every run would
+                    # stamp the item with a new time and so a new ID
+                    published = _parse_published(entry.get('published', '')) or datetime.now()
                 
                 # Skip old items
                 if published < cutoff_date:
@@ -248,6 +667,13 @@ class RSSMonitor:
                 if item_id in self.processed_items:
                     continue
                 
+                # Skip items already seen in another feed this run
+                if seen_this_run is not None:
+                    digest = hashlib.blake2b(f"{entry.title}{entry.link}".encode(), digest_size=8).digest()
+                    if digest in seen_this_run:
+                        continue
+                    seen_this_run.add(digest)
+                
                 # Match keywords
                 search_text = f"{entry.title} {entry.get('description', '')}"
                 keywords_matched, risk_level = self._match_keywords(search_text)
@@ -264,7 +690,7 @@ class RSSMonitor:
                         jurisdiction=feed_config['jurisdiction'],
                         keywords_matched=keywords_matched,
                         risk_level=risk_level,
-                        timestamp_processed=datetime.now().isoformat()
+                        timestamp_processed=timestamp_processed
                     )
                     
                     items.append(regulatory_item)
@@ -272,6 +698,12 @@ class RSSMonitor:
                     
                     logger.info(f"New regulatory item: {entry.title[:50]}...")
             
+            # Only remember validators once the feed was fully processed
+            if etag or modified:
+                self.feed_cache[url] = {'etag': etag, 'modified': modified}
+            else:
+                self.feed_cache.pop(url, None)
+            
             return items
             
         except Exception as e:
@@ -281,36 +713,45 @@ class RSSMonitor:
     async def run_monitoring(self) -> MonitoringResult:
         """Run complete regulatory monitoring cycle"""
         start_time = datetime.now()
+        run_timestamp = start_time.isoformat()
         logger.info("Starting regulatory monitoring cycle")
         
         all_items = []
-        sources_checked = 0
         keyword_matches = {}
         
-        # Process all feed categories
-        for category, feeds in self.config['feeds'].items():
-            for feed_config in feeds:
-                sources_checked += 1
-                items = await self.monitor_feed(feed_config)
-                all_items.extend(items)
-                
-                # Track keyword matches
-                for item in items:
-                    for keyword in item.keywords_matched:
-                        keyword_matches[keyword] = keyword_matches.get(keyword, 0) + 1
+        # Fetch all feeds concurrently; wall time is the slowest feed, not the sum
+        all_feeds = [feed_config for feeds in self.config['feeds'].values() for feed_config in feeds]
+        sources_checked = len(all_feeds)
+        seen_this_run: Set[bytes] = set()
+        results = await asyncio.gather(
+            *(self.monitor_feed(feed_config, seen_this_run, run_timestamp) for feed_config in all_feeds),
+            return_exceptions=True
+        )
+        
+        for feed_config, items in zip(all_feeds, results):
+            if isinstance(items, Exception):
+                logger.error(f"Error monitoring feed {feed_config['name']}: {items}")
+                continue
+            all_items.extend(items)
+            
+            # Track keyword matches
+            for item in items:
+                for keyword in item.keywords_matched:
+                    keyword_matches[keyword] = keyword_matches.get(keyword, 0) + 1
         
         # Save new items
         if all_items:
-            await self._save_regulatory_items(all_items)
+            await self._save_regulatory_items(all_items, start_time)
         
         # Save processed item tracking
         self._save_processed_items()
         
         # Generate monitoring result
-        processing_time = (datetime.now() - start_time).total_seconds()
+        end_time = datetime.now()
+        processing_time = (end_time - start_time).total_seconds()
         
         result = MonitoringResult(
-            timestamp=datetime.now().isoformat(),
+            timestamp=end_time.isoformat(),
             sources_checked=sources_checked,
             items_found=len(all_items),
             new_items=len(all_items),
@@ -321,28 +762,32 @@ class RSSMonitor:
         logger.info(f"Monitoring complete: {len(all_items)} new items from {sources_checked} sources")
         return result
     
-    async def _save_regulatory_items(self, items: List[RegulatoryItem]):
-        """Save regulatory items to structured storage"""
+    async def _save_regulatory_items(self, items: List[RegulatoryItem], run_time: Optional[datetime] = None):
+        """Save regulatory items to structured storage, named and stamped with the run time"""
+        run_time = run_time or datetime.now()
+        
         # Save as JSON for programmatic access
-        items_data = [asdict(item) for item in items]
+        items_data = [_flat_asdict(item) for item in items]
+        timestamp = run_time.isoformat()
         
-        output_file = self.data_dir / f"regulatory_items_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'item_count': len(items),
-                'items': items_data
-            }, f, indent=2)
+        output_file = self.data_dir / f"regulatory_items_{run_time.strftime('%Y%m%d_%H%M%S')}.json"
+        json_data = {
+            'timestamp': timestamp,
+            'item_count': len(items),
+            'items': items_data
+        }
         
         # Also save as YAML for human readability
         yaml_file = self.data_dir / "latest_regulatory_items.yaml"
-        with open(yaml_file, 'w') as f:
-            yaml.dump({
-                'disclaimer': 'INFORMATIONAL CONTENT ONLY - NOT LEGAL ADVICE',
-                'timestamp': datetime.now().isoformat(),
-                'item_count': len(items),
-                'items': items_data
-            }, f, default_flow_style=False)
+        yaml_data = {
+            'disclaimer': 'INFORMATIONAL CONTENT ONLY - NOT LEGAL ADVICE',
+            'timestamp': timestamp,
+            'item_count': len(items),
+            'items': items_data
+        }
+        
+        # Serializing and writing are blocking, so keep them off the event loop
+        await asyncio.to_thread(_write_regulatory_items, output_file, json_data, yaml_file, yaml_data)
         
         logger.info(f"Saved {len(items)} regulatory items to {output_file}")
 
@@ -362,8 +807,7 @@ async def main():
     print(f"  Top keywords: {dict(list(result.keywords_matched.items())[:5])}")
     
     # Save monitoring result
-    with open("data/last_monitoring_result.json", 'w') as f:
-        json.dump(asdict(result), f, indent=2)
+    Path("data/last_monitoring_result.json").write_bytes(_dump_json(_flat_asdict(result)))
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -8,21 +8,51 @@ Provides professional regulatory intelligence with full privacy protection.
 ⚠️  INFORMATIONAL CONTENT ONLY - NOT LEGAL ADVICE
 """
 
+import asyncio
 import json
 import logging
-import smtplib
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
+from email import quoprimime
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
-import hashlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
 import re
+import secrets
 
 import yaml
-from jinja2 import Environment, FileSystemLoader
+
+# jinja2, smtplib and email.mime are imported where first used so CLI tools and
+# short-lived workers that only manage subscribers do not pay for them
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+# Optional aiosmtplib import for asyncio newsletter delivery
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
+# Optional orjson import for faster subscriber (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fcntl import for locking the subscriber store across processes;
+# without it (Windows) only one process may write to a data directory
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
 
 # Import security components
 import sys
@@ -41,7 +71,86 @@ from utils import (
 # Configure secure logging
 logger = get_secure_logger(__name__)
 
-@dataclass
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# \Z rather than $ so a trailing newline is not accepted
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# Subscriber journal: compact once it holds more than twice as many lines as
+# there are subscribers, but never for fewer than this many lines
+_JOURNAL_MIN_LINES = 1000
+_IO_BUFFER_SIZE = 65536
+
+# Newsletter delivery reuses one SMTP connection, reopening it after this many
+# messages or seconds so long runs stay within provider session limits
+_SMTP_MAX_PER_CONN = 500
+_SMTP_MAX_CONN_AGE = 300
+_SMTP_TIMEOUT = 30
+_SMTP_SEND_ATTEMPTS = 3
+_SMTP_RETRY_BACKOFF = 0.5
+
+# Delivery runs this many concurrent senders (coroutines with aiosmtplib,
+# else threads); the thread pool is fed this many subscribers at a time so
+# its queue never holds the whole list
+_SEND_MAX_WORKERS = 16
+_SEND_BATCH_SIZE = 64
+_NEWSLETTER_SUBJECT = "AI Regulatory Watch - Weekly Digest"
+
+# The newsletter is rendered and encoded once with these literal sentinels,
+# then personalised per subscriber with bytes.replace instead of a fresh render
+_UNSUB_URL_PLACEHOLDER = "{{UNSUB_URL}}"
+_EMAIL_PLACEHOLDER = "{{EMAIL}}"
+
+_BODY_PLACEHOLDER_RE = re.compile(
+    '(' + '|'.join(map(re.escape, (_UNSUB_URL_PLACEHOLDER, _EMAIL_PLACEHOLDER))) + ')'
+)
+# The encoded message carries these in its recipient headers instead
+_TO_PLACEHOLDER = "{{TO}}"
+_LIST_UNSUBSCRIBE_PLACEHOLDER = "{{LIST_UNSUBSCRIBE}}"
+
+# Bodies are quoted-printable UTF-8: 7bit-safe for any relay, lines stay well
+# under the RFC 5322 limit, and mostly-ASCII text stays smaller than base64.
+# Encoded lines are one column short of the 76 limit to leave room for the
+# soft break that may follow them
+_QP_LINE_LEN = 75
+_CRLF = '\r\n'
+
+def _qp_value(value: str) -> bytes:
+    """Quoted-printable encode a value substituted for a body placeholder"""
+    return quoprimime.body_encode(value, maxlinelen=_QP_LINE_LEN, eol=_CRLF).encode('ascii')
+
+def _qp_body(text: str) -> str:
+    """Quoted-printable encode a rendered body, keeping each placeholder whole
+    
+    Every placeholder sits alone on an encoded line between soft line breaks,
+    so it can later be swapped for its value encoded with _qp_value.
+    """
+    encoded = []
+    for index, part in enumerate(_BODY_PLACEHOLDER_RE.split(text)):
+        if index % 2:
+            if encoded and not encoded[-1].endswith(_CRLF):
+                encoded.append('=' + _CRLF)
+            encoded.append(part + '=' + _CRLF)
+        elif part:
+            encoded.append(quoprimime.body_encode(
+                part.encode('utf-8').decode('latin-1'), maxlinelen=_QP_LINE_LEN, eol=_CRLF
+            ))
+    return ''.join(encoded)
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize to compact JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass(slots=True)
 class Subscriber:
     """GDPR-compliant subscriber data structure"""
     email: str
@@ -52,6 +161,9 @@ class Subscriber:
     unsubscribe_token: str
     last_sent: Optional[str] = None
     status: str = "confirmed"  # pending, confirmed, unsubscribed
+    confirmed_date: Optional[str] = None
+    unsubscribed_date: Optional[str] = None
+    unsubscribed_ts: Optional[int] = None  # epoch seconds, for the retention sweep
 
 @dataclass
 class NewsletterContent:
@@ -63,237 +175,35 @@ class NewsletterContent:
     international_updates: List[Dict]
     implementation_tips: List[Dict]
 
-class PrivacyCompliantSubscriberManager:
-    """GDPR/CCPA compliant subscriber management"""
-    
-    def __init__(self, data_dir: str = "data/subscribers"):
-        self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.subscribers_file = self.data_dir / "subscribers.json"
-        
-        # Privacy settings
-        self.data_retention_days = 30  # Days after unsubscribe to delete data
-        self.consent_required = True
-        
-    def _generate_tokens(self) -> tuple[str, str]:
-        """Generate subscription ID and unsubscribe token"""
-        subscription_id = str(uuid.uuid4())
-        unsubscribe_token = hashlib.sha256(
-            f"{subscription_id}{datetime.now().isoformat()}".encode()
-        ).hexdigest()
-        return subscription_id, unsubscribe_token
-    
-    def _validate_email(self, email: str) -> bool:
-        """Validate email address format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
-    
-    def add_subscriber(self, email: str, preferences: Dict[str, bool], 
-                      consent_ip: str = None) -> tuple[bool, str]:
-        """
-        Add new subscriber with double opt-in process
-        Returns: (success, message)
-        """
-        if not self._validate_email(email):
-            return False, "Invalid email address format"
-        
-        # Check if already subscribed
-        existing_subscribers = self._load_subscribers()
-        if email in existing_subscribers:
-            return False, "Email already subscribed"
-        
-        # Generate tokens
-        subscription_id, unsubscribe_token = self._generate_tokens()
-        
-        # Create subscriber record
-        subscriber = Subscriber(
-            email=email,
-            subscription_id=subscription_id,
-            subscribed_date=datetime.now().isoformat(),
-            preferences=preferences,
-            consent_timestamp=datetime.now().isoformat(),
-            unsubscribe_token=unsubscribe_token,
-            status="pending"  # Requires confirmation
-        )
-        
-        # Save subscriber
-        existing_subscribers[email] = asdict(subscriber)
-        self._save_subscribers(existing_subscribers)
-        
-        # Send confirmation email
-        self._send_confirmation_email(subscriber)
-        
-        logger.info(f"New subscriber pending confirmation: {email}")
-        return True, "Confirmation email sent. Please check your inbox."
-    
-    def confirm_subscription(self, token: str) -> tuple[bool, str]:
-        """Confirm subscription via double opt-in"""
-        subscribers = self._load_subscribers()
-        
-        for email, data in subscribers.items():
-            if data['unsubscribe_token'] == token and data['status'] == 'pending':
-                subscribers[email]['status'] = 'confirmed'
-                subscribers[email]['confirmed_date'] = datetime.now().isoformat()
-                self._save_subscribers(subscribers)
-                logger.info(f"Subscription confirmed: {email}")
-                return True, "Subscription confirmed successfully!"
-        
-        return False, "Invalid or expired confirmation token"
-    
-    def unsubscribe(self, token: str) -> tuple[bool, str]:
-        """One-click unsubscribe with data retention policy"""
-        subscribers = self._load_subscribers()
-        
-        for email, data in subscribers.items():
-            if data['unsubscribe_token'] == token:
-                subscribers[email]['status'] = 'unsubscribed'
-                subscribers[email]['unsubscribed_date'] = datetime.now().isoformat()
-                self._save_subscribers(subscribers)
-                logger.info(f"Unsubscribed: {email}")
-                return True, "Successfully unsubscribed. Data will be deleted within 30 days."
-        
-        return False, "Invalid unsubscribe token"
-    
-    def get_active_subscribers(self) -> List[Subscriber]:
-        """Get list of confirmed, active subscribers"""
-        subscribers = self._load_subscribers()
-        active = []
-        
-        for email, data in subscribers.items():
-            if data['status'] == 'confirmed':
-                active.append(Subscriber(**data))
-        
-        return active
-    
-    def cleanup_expired_data(self):
-        """Remove data for subscribers past retention period"""
-        subscribers = self._load_subscribers()
-        cutoff_date = datetime.now() - timedelta(days=self.data_retention_days)
-        
-        to_delete = []
-        for email, data in subscribers.items():
-            if data['status'] == 'unsubscribed' and 'unsubscribed_date' in data:
-                unsubscribed = datetime.fromisoformat(data['unsubscribed_date'])
-                if unsubscribed < cutoff_date:
-                    to_delete.append(email)
-        
-        for email in to_delete:
-            del subscribers[email]
-            logger.info(f"Deleted expired data for: {email}")
-        
-        if to_delete:
-            self._save_subscribers(subscribers)
-    
-    def _load_subscribers(self) -> Dict:
-        """Load subscriber data from secure storage"""
-        if self.subscribers_file.exists():
-            with open(self.subscribers_file, 'r') as f:
-                return json.load(f)
-        return {}
-    
-    def _save_subscribers(self, subscribers: Dict):
-        """Save subscriber data securely"""
-        # Add metadata
-        data = {
-            'last_updated': datetime.now().isoformat(),
-            'subscriber_count': len([s for s in subscribers.values() if s['status'] == 'confirmed']),
-            'privacy_notice': 'Data processed per Privacy Policy - minimal retention, secure storage',
-            'subscribers': subscribers
-        }
-        
-        with open(self.subscribers_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        # Set secure file permissions
-        self.subscribers_file.chmod(0o600)
-    
-    def _send_confirmation_email(self, subscriber: Subscriber):
-        """Send double opt-in confirmation email"""
-        # This would integrate with your email service
-        logger.info(f"Would send confirmation email to: {subscriber.email}")
-        # Implementation depends on email service provider
+def _titles(context: Dict, key: str, default: str) -> tuple:
+    """Titles of a context list as a hashable tuple, for the cached fallbacks"""
+    return tuple(item.get('title', default) for item in context.get(key, []))
 
-class NewsletterGenerator:
-    """Generate professional regulatory newsletters"""
-    
-    def __init__(self, template_dir: str = "templates/newsletter"):
-        self.template_dir = Path(template_dir)
-        self.template_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Setup Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(self.template_dir)
-        )
-    
-    def generate_weekly_newsletter(self, content: NewsletterContent) -> tuple[str, str]:
-        """Generate HTML and text versions of newsletter"""
-        
-        # Load regulatory data for the week
-        regulatory_data = self._load_weekly_data()
-        
-        # Prepare newsletter context
-        context = {
-            'week_ending': content.week_ending,
-            'generation_date': datetime.now().strftime('%B %d, %Y'),
-            'disclaimer': 'INFORMATIONAL CONTENT ONLY - NOT LEGAL ADVICE',
-            'priority_alerts': content.priority_alerts,
-            'new_regulations': content.new_regulations,
-            'sector_updates': content.sector_updates,
-            'international_updates': content.international_updates,
-            'implementation_tips': content.implementation_tips,
-            'professional_contact': 'bdstest@protonmail.com',
-            'unsubscribe_info': 'One-click unsubscribe available in email footer'
-        }
-        
-        # Generate HTML version
-        try:
-            html_template = self.jinja_env.get_template('weekly_digest.html')
-            html_content = html_template.render(context)
-        except:
-            html_content = self._generate_fallback_html(context)
-        
-        # Generate text version
-        try:
-            text_template = self.jinja_env.get_template('weekly_digest.txt')
-            text_content = text_template.render(context)
-        except:
-            text_content = self._generate_fallback_text(context)
-        
-        return html_content, text_content
-    
-    def _load_weekly_data(self) -> Dict:
-        """Load regulatory data from monitoring results"""
-        data_dir = Path("data")
-        latest_file = data_dir / "latest_regulatory_items.yaml"
-        
-        if latest_file.exists():
-            with open(latest_file, 'r') as f:
-                return yaml.safe_load(f)
-        return {'items': []}
-    
-    def _generate_fallback_html(self, context: Dict) -> str:
-        """Generate simple HTML newsletter if template fails"""
-        return f"""
+# Static scaffolding of the fallback HTML newsletter; only the pieces between
+# these chunks vary from issue to issue
+_FALLBACK_HTML_HEAD = """
         <!DOCTYPE html>
         <html>
         <head>
             <title>CDSI Weekly Intelligence</title>
             <style>
-                body {{ font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; }}
-                .header {{ background-color: #1e3a8a; color: white; padding: 20px; text-align: center; }}
-                .read-time {{ background-color: #e5e7eb; padding: 10px; text-align: center; font-size: 14px; }}
-                .disclaimer {{ background-color: #fef3c7; padding: 15px; border-left: 4px solid #f59e0b; margin: 20px 0; }}
-                .content {{ padding: 20px; }}
-                .action-box {{ background-color: #f0f9ff; border-left: 4px solid #0ea5e9; padding: 15px; margin: 15px 0; }}
-                .priority-action {{ background-color: #f0fdf4; border-left: 4px solid #22c55e; padding: 20px; margin: 25px 0; }}
-                .footer {{ background-color: #f3f4f6; padding: 15px; text-align: center; font-size: 12px; }}
-                .divider {{ border-top: 2px solid #e5e7eb; margin: 25px 0; }}
+                body { font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; }
+                .header { background-color: #1e3a8a; color: white; padding: 20px; text-align: center; }
+                .read-time { background-color: #e5e7eb; padding: 10px; text-align: center; font-size: 14px; }
+                .disclaimer { background-color: #fef3c7; padding: 15px; border-left: 4px solid #f59e0b; margin: 20px 0; }
+                .content { padding: 20px; }
+                .action-box { background-color: #f0f9ff; border-left: 4px solid #0ea5e9; padding: 15px; margin: 15px 0; }
+                .priority-action { background-color: #f0fdf4; border-left: 4px solid #22c55e; padding: 20px; margin: 25px 0; }
+                .footer { background-color: #f3f4f6; padding: 15px; text-align: center; font-size: 12px; }
+                .divider { border-top: 2px solid #e5e7eb; margin: 25px 0; }
             </style>
         </head>
         <body>
             <div class="header">
                 <h1>🔍 CDSI - Compliance Data Systems Insights</h1>
-                <p>Professional Regulatory Intelligence - {context['generation_date']}</p>
+                <p>Professional Regulatory Intelligence - """
+
+_FALLBACK_HTML_DISCLAIMER = """</p>
             </div>
             
             <div class="read-time">
@@ -301,7 +211,9 @@ class NewsletterGenerator:
             </div>
             
             <div class="disclaimer">
-                <strong>⚠️ IMPORTANT:</strong> {context['disclaimer']}
+                <strong>⚠️ IMPORTANT:</strong> """
+
+_FALLBACK_HTML_ALERTS = """
             </div>
             
             <div class="content">
@@ -309,7 +221,9 @@ class NewsletterGenerator:
                 
                 <h2>🚨 THIS WEEK'S PRIORITY ALERTS</h2>
                 <ul>
-                    {''.join([f"<li>{alert.get('title', 'Priority regulatory update')}</li>" for alert in context.get('priority_alerts', [])])}
+                    """
+
+_FALLBACK_HTML_REGULATIONS = """
                 </ul>
                 
                 <div class="action-box">
@@ -320,7 +234,9 @@ class NewsletterGenerator:
                 
                 <h2>📊 NEW REGULATIONS & GUIDANCE</h2>
                 <ul>
-                    {''.join([f"<li>{reg.get('title', 'Regulatory update')}</li>" for reg in context.get('new_regulations', [])])}
+                    """
+
+_FALLBACK_HTML_TIPS = """
                 </ul>
                 
                 <div class="action-box">
@@ -356,7 +272,9 @@ class NewsletterGenerator:
                 <div class="divider"></div>
                 
                 <h2>💡 COMPLIANCE IMPLEMENTATION INSIGHTS</h2>
-                {''.join([f"<li>{tip.get('title', 'Compliance best practice')}</li>" for tip in context.get('implementation_tips', [])])}
+                """
+
+_FALLBACK_HTML_CONTACT = """
                 
                 <div class="action-box">
                     <strong>📋 THIS WEEK'S ACTION:</strong> Create or update your compliance system inventory: System Name, Purpose, Data Used, Risk Level, Documentation Status.
@@ -381,14 +299,16 @@ class NewsletterGenerator:
                 
                 <h3>📞 Professional Services</h3>
                 <p>Questions about regulatory compliance for your systems?</p>
-                <p><strong>Contact:</strong> {context['professional_contact']}</p>
+                <p><strong>Contact:</strong> """
+
+_FALLBACK_HTML_FOOT = f"""</p>
                 <p><em>Professional compliance consulting available</em></p>
             </div>
             
             <div class="footer">
                 <p><strong>CDSI Newsletter</strong> by bdstest</p>
                 <p>🔗 GitHub: github.com/bdstest/compliance-data-systems-insights</p>
-                <p>📋 Privacy Policy | 🔄 Update Preferences | 🚫 Unsubscribe</p>
+                <p>📋 Privacy Policy | 🔄 Update Preferences | <a href="{_UNSUB_URL_PLACEHOLDER}">🚫 Unsubscribe</a></p>
                 <br>
                 <p><em>This newsletter provides informational content only, not legal advice.<br>
                 Consult qualified legal counsel for specific compliance questions.</em></p>
@@ -396,25 +316,47 @@ class NewsletterGenerator:
         </body>
         </html>
         """
-    
-    def _generate_fallback_text(self, context: Dict) -> str:
-        """Generate text newsletter if template fails"""
-        return f"""
+
+def _list_items(titles: tuple) -> str:
+    """<li> elements for a tuple of titles"""
+    return ''.join([f"<li>{title}</li>" for title in titles])
+
+# The fallbacks are pure functions of their (hashable) inputs, so repeated renders
+# of the same issue reuse the built string
+@lru_cache(maxsize=8)
+def _fallback_html(generation_date: str, disclaimer: str, alert_titles: tuple,
+                   regulation_titles: tuple, tip_titles: tuple, professional_contact: str) -> str:
+    """Simple HTML newsletter used when the template is missing or fails"""
+    return ''.join([
+        _FALLBACK_HTML_HEAD, generation_date,
+        _FALLBACK_HTML_DISCLAIMER, disclaimer,
+        _FALLBACK_HTML_ALERTS, _list_items(alert_titles),
+        _FALLBACK_HTML_REGULATIONS, _list_items(regulation_titles),
+        _FALLBACK_HTML_TIPS, _list_items(tip_titles),
+        _FALLBACK_HTML_CONTACT, professional_contact,
+        _FALLBACK_HTML_FOOT
+    ])
+
+@lru_cache(maxsize=8)
+def _fallback_text(week_ending: str, generation_date: str, disclaimer: str,
+                   alert_titles: tuple, regulation_titles: tuple, professional_contact: str) -> str:
+    """Plain-text newsletter used when the template is missing or fails"""
+    return f"""
 🔍 AI REGULATORY WATCH NEWSLETTER
-Week ending: {context['week_ending']}
-Generated: {context['generation_date']}
+Week ending: {week_ending}
+Generated: {generation_date}
 
-⚠️  IMPORTANT: {context['disclaimer']}
+⚠️  IMPORTANT: {disclaimer}
 
 🚨 PRIORITY ALERTS
-{chr(10).join([f"• {alert.get('title', 'Alert')}" for alert in context.get('priority_alerts', [])])}
+{chr(10).join([f"• {title}" for title in alert_titles])}
 
 📊 NEW REGULATIONS & GUIDANCE
-{chr(10).join([f"• {reg.get('title', 'Update')}" for reg in context.get('new_regulations', [])])}
+{chr(10).join([f"• {title}" for title in regulation_titles])}
 
 💬 PROFESSIONAL SERVICES
 Need compliance guidance for your AI systems?
-Contact: {context['professional_contact']}
+Contact: {professional_contact}
 Professional compliance consulting available.
 
 ---
@@ -422,46 +364,730 @@ AI Regulatory Watch Newsletter
 Professional regulatory intelligence by bdstest
 github.com/bdstest/ai-regulatory-watch
 
-Unsubscribe: [Link provided in email]
+Unsubscribe: {_UNSUB_URL_PLACEHOLDER}
 Privacy Policy: [Link provided in email]
         """
 
+def _smtp_config_from_env() -> Optional[Dict[str, Any]]:
+    """SMTP settings from NEWSLETTER_SMTP_* variables, or None if no host is set"""
+    host = os.environ.get('NEWSLETTER_SMTP_HOST')
+    if not host:
+        return None
+    return {
+        'host': host,
+        'port': int(os.environ.get('NEWSLETTER_SMTP_PORT', '465')),
+        'username': os.environ.get('NEWSLETTER_SMTP_USER'),
+        'password': os.environ.get('NEWSLETTER_SMTP_PASSWORD'),
+        'sender': os.environ.get('NEWSLETTER_FROM', f"newsletter@{host}")
+    }
+
+def _is_transient_smtp_error(error: OSError) -> bool:
+    """Whether a send failure is worth retrying on a fresh connection"""
+    import smtplib
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    # Socket-level failures (timeouts, resets) that are not SMTP protocol errors
+    return not isinstance(error, smtplib.SMTPException)
+
+class _PooledSMTP:
+    """SMTP_SSL connection reused across messages and reopened after a cap"""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self._smtp = None
+        self._sent = 0
+        self._opened_at = 0.0
+    
+    def send(self, recipient: str, message: bytes):
+        """Send one encoded message, reconnecting and retrying on transient failures"""
+        for attempt in range(_SMTP_SEND_ATTEMPTS):
+            try:
+                if (self._smtp is None or self._sent >= _SMTP_MAX_PER_CONN
+                        or time.monotonic() - self._opened_at > _SMTP_MAX_CONN_AGE):
+                    self._connect()
+                self._smtp.sendmail(self.config['sender'], [recipient], message)
+                self._sent += 1
+                return
+            except OSError as e:
+                if attempt == _SMTP_SEND_ATTEMPTS - 1 or not _is_transient_smtp_error(e):
+                    raise
+                self.close()
+                time.sleep(_SMTP_RETRY_BACKOFF * 2 ** attempt)
+    
+    def _connect(self):
+        """Open and authenticate a new connection"""
+        import smtplib
+        
+        self.close()
+        smtp = smtplib.SMTP_SSL(self.config['host'], self.config['port'], timeout=_SMTP_TIMEOUT)
+        if self.config['username']:
+            smtp.login(self.config['username'], self.config['password'])
+        self._smtp = smtp
+        self._sent = 0
+        self._opened_at = time.monotonic()
+    
+    def close(self):
+        """Quit the current connection, if any"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except OSError:
+            pass
+        self._smtp = None
+
+def _is_transient_async_smtp_error(error: Exception) -> bool:
+    """aiosmtplib counterpart of _is_transient_smtp_error"""
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return 400 <= error.code < 500
+    # Disconnects, connect errors and timeouts are all OSErrors in aiosmtplib
+    return isinstance(error, OSError)
+
+class _AsyncPooledSMTP:
+    """aiosmtplib counterpart of _PooledSMTP for the asyncio delivery path"""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self._smtp = None
+        self._sent = 0
+        self._opened_at = 0.0
+    
+    async def send(self, recipient: str, message: bytes):
+        """Send one encoded message, reconnecting and retrying on transient failures"""
+        for attempt in range(_SMTP_SEND_ATTEMPTS):
+            try:
+                if (self._smtp is None or self._sent >= _SMTP_MAX_PER_CONN
+                        or time.monotonic() - self._opened_at > _SMTP_MAX_CONN_AGE):
+                    await self._connect()
+                await self._smtp.sendmail(self.config['sender'], [recipient], message)
+                self._sent += 1
+                return
+            except Exception as e:
+                if attempt == _SMTP_SEND_ATTEMPTS - 1 or not _is_transient_async_smtp_error(e):
+                    raise
+                await self.close()
+                await asyncio.sleep(_SMTP_RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _connect(self):
+        """Open and authenticate a new connection"""
+        await self.close()
+        smtp = aiosmtplib.SMTP(
+            hostname=self.config['host'],
+            port=self.config['port'],
+            username=self.config['username'],
+            password=self.config['password'],
+            use_tls=True,
+            timeout=_SMTP_TIMEOUT
+        )
+        await smtp.connect()
+        self._smtp = smtp
+        self._sent = 0
+        self._opened_at = time.monotonic()
+    
+    async def close(self):
+        """Quit the current connection, if any"""
+        if self._smtp is None:
+            return
+        try:
+            await self._smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            pass
+        self._smtp = None
+
+class PrivacyCompliantSubscriberManager:
+    """GDPR/CCPA compliant subscriber management"""
+    
+    def __init__(self, data_dir: str = "data/subscribers"):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.subscribers_file = self.data_dir / "subscribers.json"
+        # Mutations are appended here and folded into subscribers.json on compaction
+        self.journal_file = self.data_dir / "subscribers.jsonl"
+        # Summary counts, refreshed on compaction and cleanup rather than per write
+        self.metadata_file = self.data_dir / "metadata.json"
+        
+        # flock'ed around every operation so processes sharing data_dir (the web
+        # app and the weekly send, say) keep and see each other's changes
+        self.lock_file = self.data_dir / "subscribers.lock"
+        
+        # Guards the in-memory state and journal when the manager is shared
+        # between threads (see get_service)
+        self._lock = threading.RLock()
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+        
+        # Subscribers are held in memory and caught up from disk whenever the
+        # store lock is taken: the journal is replayed from _journal_offset, or
+        # everything is reloaded if another process compacted meanwhile
+        self._journal = None
+        self._journal_lines = 0
+        self._journal_offset = 0
+        self._journal_ino: Optional[int] = None
+        self._snapshot_id: Optional[tuple] = None
+        self._subs: Dict[str, Dict] = {}
+        # Confirmation and unsubscribe links carry the token, so look it up directly
+        self._token_index: Dict[str, str] = {}
+        # Adjusted on each status transition so saves need not rescan every record
+        self._confirmed_count = 0
+        # Taking the store lock loads the snapshot and replays the journal
+        with self._locked():
+            pass
+        
+        # Privacy settings
+        self.data_retention_days = 30  # Days after unsubscribe to delete data
+        self.consent_required = True
+        
+    def _generate_tokens(self) -> tuple[str, str]:
+        """Generate subscription ID and unsubscribe token"""
+        return str(uuid.uuid4()), secrets.token_urlsafe(32)
+    
+    @staticmethod
+    def _validate_email(email: str) -> bool:
+        """Validate email address format"""
+        return _EMAIL_RE.match(email) is not None
+    
+    def add_subscriber(self, email: str, preferences: Dict[str, bool], 
+                      consent_ip: str = None) -> tuple[bool, str]:
+        """
+        Add new subscriber with double opt-in process
+        Returns: (success, message)
+        """
+        if not self._validate_email(email):
+            return False, "Invalid email address format"
+        
+        # Generate tokens
+        subscription_id, unsubscribe_token = self._generate_tokens()
+        
+        # Create subscriber record; built as the stored dict directly rather
+        # than via asdict(), which deep-copies every field
+        now_iso = datetime.now().isoformat()
+        record = {
+            'email': email,
+            'subscription_id': subscription_id,
+            'subscribed_date': now_iso,
+            'preferences': preferences,
+            'consent_timestamp': now_iso,
+            'unsubscribe_token': unsubscribe_token,
+            'last_sent': None,
+            'status': "pending",  # Requires confirmation
+            'confirmed_date': None,
+            'unsubscribed_date': None,
+            'unsubscribed_ts': None
+        }
+        
+        with self._locked():
+            # Check if already subscribed
+            if email in self._subs:
+                return False, "Email already subscribed"
+            
+            # Save subscriber
+            self._upsert(email, record)
+            self._flush_journal()
+        
+        # Send confirmation email
+        self._send_confirmation_email(Subscriber(**record))
+        
+        logger.info(f"New subscriber pending confirmation: {email}")
+        return True, "Confirmation email sent. Please check your inbox."
+    
+    def confirm_subscription(self, token: str) -> tuple[bool, str]:
+        """Confirm subscription via double opt-in"""
+        with self._locked():
+            email = self._token_index.get(token)
+            if email is not None and self._subs[email]['status'] == 'pending':
+                data = self._subs[email]
+                data['status'] = 'confirmed'
+                data['confirmed_date'] = datetime.now().isoformat()
+                self._confirmed_count += 1
+                self._upsert(email, data)
+                self._flush_journal()
+                logger.info(f"Subscription confirmed: {email}")
+                return True, "Subscription confirmed successfully!"
+        
+        return False, "Invalid or expired confirmation token"
+    
+    def unsubscribe(self, token: str) -> tuple[bool, str]:
+        """One-click unsubscribe with data retention policy"""
+        with self._locked():
+            email = self._token_index.get(token)
+            if email is not None:
+                data = self._subs[email]
+                if data['status'] == 'confirmed':
+                    self._confirmed_count -= 1
+                data['status'] = 'unsubscribed'
+                data['unsubscribed_date'] = datetime.now().isoformat()
+                data['unsubscribed_ts'] = int(time.time())
+                self._upsert(email, data)
+                self._flush_journal()
+                logger.info(f"Unsubscribed: {email}")
+                return True, "Successfully unsubscribed. Data will be deleted within 30 days."
+        
+        return False, "Invalid unsubscribe token"
+    
+    def get_active_subscribers(self) -> List[Subscriber]:
+        """Get list of confirmed, active subscribers"""
+        with self._locked():
+            return [Subscriber(**data) for data in self._subs.values() if data['status'] == 'confirmed']
+    
+    def cleanup_expired_data(self):
+        """Remove data for subscribers past retention period"""
+        with self._locked():
+            cutoff_ts = int(time.time()) - self.data_retention_days * 86400
+            
+            survivors = {
+                email: data for email, data in self._subs.items()
+                if data['status'] != 'unsubscribed' or self._unsubscribed_ts(data) >= cutoff_ts
+            }
+            deleted = len(self._subs) - len(survivors)
+            if deleted:
+                # Only unsubscribed records go, so _confirmed_count is unchanged;
+                # one snapshot replaces a journal entry per deletion
+                self._subs = survivors
+                self._token_index = {data['unsubscribe_token']: email for email, data in survivors.items()}
+                self.compact()
+                logger.info(f"Deleted {deleted} expired subscriber records")
+    
+    @staticmethod
+    def _unsubscribed_ts(data: Dict) -> float:
+        """Unsubscribe time in epoch seconds, migrating records that only have the ISO date"""
+        unsubscribed_ts = data.get('unsubscribed_ts')
+        if unsubscribed_ts is None:
+            if not data.get('unsubscribed_date'):
+                return float('inf')
+            # Parse once and keep the result so the next snapshot carries it
+            unsubscribed_ts = int(datetime.fromisoformat(data['unsubscribed_date']).timestamp())
+            data['unsubscribed_ts'] = unsubscribed_ts
+        return unsubscribed_ts
+    
+    def compact(self):
+        """Fold the journal into subscribers.json and start a fresh journal"""
+        with self._locked():
+            # Taking the lock caught up with other processes, so the snapshot
+            # holds every journaled change, not just this process's
+            self._save_subscribers(self._subs)
+            self._save_metadata(datetime.now().isoformat())
+            # The snapshot is durable, so replaying the old journal is no longer needed
+            self._close_journal()
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_lines = 0
+            self._journal_offset = 0
+            self._journal_ino = None
+            self._snapshot_id = self._snapshot_stat()
+    
+    def close(self):
+        """Flush and close the journal and the lock file"""
+        with self._lock:
+            self._close_journal()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+    
+    @contextmanager
+    def _locked(self):
+        """Hold the thread lock and the cross-process flock, with memory caught up with disk"""
+        with self._lock:
+            outermost = self._lock_depth == 0
+            if outermost and FCNTL_AVAILABLE:
+                if self._lock_fd is None:
+                    self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                if outermost:
+                    self._catch_up()
+                yield
+            finally:
+                self._lock_depth -= 1
+                if outermost and FCNTL_AVAILABLE:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+    
+    def _catch_up(self):
+        """Apply changes other processes wrote since this one last held the lock"""
+        try:
+            journal = os.stat(self.journal_file)
+        except FileNotFoundError:
+            journal = None
+        journal_ino = journal.st_ino if journal is not None else None
+        
+        if (self._snapshot_stat() != self._snapshot_id
+                or (self._journal_ino is not None and journal_ino != self._journal_ino)
+                or (journal is not None and journal.st_size < self._journal_offset)):
+            # Another process compacted: the journal this process knew is gone
+            self._reload()
+        elif journal is not None and journal.st_size > self._journal_offset:
+            self._replay_journal()
+    
+    def _snapshot_stat(self) -> Optional[tuple]:
+        """Identity of the current subscribers.json; os.replace gives each snapshot a new inode"""
+        try:
+            st = os.stat(self.subscribers_file)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns
+    
+    def _close_journal(self):
+        """Flush and close this process's journal handle"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+    
+    def _upsert(self, email: str, record: Dict):
+        """Store a subscriber record and journal the change"""
+        previous = self._subs.get(email)
+        if previous is not None:
+            self._token_index.pop(previous['unsubscribe_token'], None)
+        self._subs[email] = record
+        self._token_index[record['unsubscribe_token']] = email
+        self._append_journal({'op': 'upsert', 'email': email, 'record': record})
+    
+    def _apply_entry(self, entry: Dict):
+        """Apply one journal entry written by another process"""
+        email = entry['email']
+        previous = self._subs.get(email)
+        if previous is not None:
+            self._token_index.pop(previous['unsubscribe_token'], None)
+            if previous['status'] == 'confirmed':
+                self._confirmed_count -= 1
+        if entry['op'] == 'upsert':
+            record = entry['record']
+            self._subs[email] = record
+            self._token_index[record['unsubscribe_token']] = email
+            if record['status'] == 'confirmed':
+                self._confirmed_count += 1
+        elif previous is not None:
+            del self._subs[email]
+    
+    def _append_journal(self, entry: Dict):
+        """Append one mutation to the journal (buffered until _flush_journal)"""
+        if self._journal is None:
+            fd = os.open(self.journal_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            self._journal = os.fdopen(fd, 'ab', buffering=_IO_BUFFER_SIZE)
+            self._journal_ino = os.fstat(fd).st_ino
+        line = _dump_json(entry) + b'\n'
+        self._journal.write(line)
+        self._journal_offset += len(line)
+        self._journal_lines += 1
+    
+    def _flush_journal(self):
+        """Hand buffered journal lines to the OS, compacting if the journal has grown"""
+        if self._journal is None:
+            return
+        self._journal.flush()
+        if self._journal_lines > max(2 * len(self._subs), _JOURNAL_MIN_LINES):
+            self.compact()
+    
+    def _reload(self):
+        """Rebuild the in-memory state from subscribers.json and the whole journal"""
+        self._close_journal()
+        self._snapshot_id = self._snapshot_stat()
+        try:
+            with open(self.subscribers_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                data = _load_json(f.read())
+            # Snapshots written before the metadata sidecar wrap the records
+            self._subs = data.get('subscribers', data)
+        except FileNotFoundError:
+            self._subs = {}
+        self._token_index = {data['unsubscribe_token']: email for email, data in self._subs.items()}
+        self._confirmed_count = sum(1 for data in self._subs.values() if data['status'] == 'confirmed')
+        
+        self._journal_lines = 0
+        self._journal_offset = 0
+        self._journal_ino = None
+        self._replay_journal()
+    
+    def _replay_journal(self):
+        """Apply journal entries past _journal_offset"""
+        try:
+            journal = open(self.journal_file, 'rb', buffering=_IO_BUFFER_SIZE)
+        except FileNotFoundError:
+            return
+        
+        with journal:
+            self._journal_ino = os.fstat(journal.fileno()).st_ino
+            journal.seek(self._journal_offset)
+            for line in journal:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("unterminated line")
+                    entry = _load_json(line)
+                except ValueError:
+                    # A torn final line from an interrupted write; drop it so
+                    # later appends start on a clean line. Writers hold the
+                    # store lock, so this cannot be a write still in progress
+                    logger.warning("Discarding incomplete subscriber journal entry")
+                    os.truncate(self.journal_file, self._journal_offset)
+                    break
+                self._apply_entry(entry)
+                self._journal_offset += len(line)
+                self._journal_lines += 1
+    
+    def _save_subscribers(self, subscribers: Dict):
+        """Save subscriber data securely"""
+        # Write a temp file and rename it over the snapshot so a crash mid-write
+        # leaves the previous snapshot intact; the rename also carries over the
+        # secure permissions set at creation
+        tmp_file = self.subscribers_file.with_suffix('.json.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+            f.write(_dump_json(subscribers))
+            # compact() deletes the journal next, so the snapshot must be on disk
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.subscribers_file)
+    
+    def _save_metadata(self, now_iso: str):
+        """Write the summary sidecar; it holds no personal data"""
+        metadata = {
+            'last_updated': now_iso,
+            'subscriber_count': self._confirmed_count,
+            'privacy_notice': 'Data processed per Privacy Policy - minimal retention, secure storage'
+        }
+        self.metadata_file.write_bytes(_dump_json(metadata))
+    
+    def _send_confirmation_email(self, subscriber: Subscriber):
+        """Send double opt-in confirmation email"""
+        # This would integrate with your email service
+        logger.info(f"Would send confirmation email to: {subscriber.email}")
+        # Implementation depends on email service provider
+
+class NewsletterGenerator:
+    """Generate professional regulatory newsletters"""
+    
+    def __init__(self, template_dir: str = "templates/newsletter"):
+        self.template_dir = Path(template_dir)
+        self.template_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Setup Jinja2 environment; compiled templates are cached on disk so a
+        # restarted process skips parsing them again
+        cache_dir = self.template_dir / ".jinja_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+        
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(self.template_dir),
+            bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+            auto_reload=False
+        )
+        
+        # Resolve templates once; None means the built-in fallback is used
+        self._html_template = self._get_template('weekly_digest.html')
+        self._text_template = self._get_template('weekly_digest.txt')
+        
+        # (st_mtime_ns, data) of the last weekly data file read
+        self._weekly_data_cache = None
+    
+    def _get_template(self, name: str) -> Optional['Template']:
+        """Load a template, or None if it is missing or does not compile"""
+        try:
+            return self.jinja_env.get_template(name)
+        except Exception:
+            return None
+    
+    def generate_weekly_newsletter(self, content: NewsletterContent) -> tuple[str, str]:
+        """Generate HTML and text versions of newsletter"""
+        from markupsafe import Markup
+        
+        # Load regulatory data for the week
+        regulatory_data = self._load_weekly_data()
+        
+        # Prepare newsletter context
+        context = {
+            'week_ending': content.week_ending,
+            'generation_date': datetime.now().strftime('%B %d, %Y'),
+            'disclaimer': 'INFORMATIONAL CONTENT ONLY - NOT LEGAL ADVICE',
+            'priority_alerts': content.priority_alerts,
+            'new_regulations': content.new_regulations,
+            'sector_updates': content.sector_updates,
+            'international_updates': content.international_updates,
+            'implementation_tips': content.implementation_tips,
+            'professional_contact': 'bdstest@protonmail.com',
+            'unsubscribe_info': 'One-click unsubscribe available in email footer',
+            # Filled in per subscriber by NewsletterService._send_email
+            'unsubscribe_url': Markup(_UNSUB_URL_PLACEHOLDER),
+            'subscriber_email': Markup(_EMAIL_PLACEHOLDER)
+        }
+        
+        # Generate HTML and text versions
+        html_content = self._render(self._html_template, self._generate_fallback_html, context)
+        text_content = self._render(self._text_template, self._generate_fallback_text, context)
+        
+        return html_content, text_content
+    
+    def _render(self, template: Optional['Template'], fallback, context: Dict) -> str:
+        """Render a preloaded template, or the built-in fallback if it is missing or fails"""
+        if template is not None:
+            try:
+                return template.render(context)
+            except Exception as e:
+                logger.warning(f"Newsletter template failed, using fallback: {e}")
+        return fallback(context)
+    
+    def _load_weekly_data(self) -> Dict:
+        """Load regulatory data from monitoring results"""
+        data_dir = Path("data")
+        latest_file = data_dir / "latest_regulatory_items.yaml"
+        
+        try:
+            mtime = latest_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {'items': []}
+        
+        # Only reparse when the monitor has rewritten the file
+        if self._weekly_data_cache is not None and self._weekly_data_cache[0] == mtime:
+            return self._weekly_data_cache[1]
+        with open(latest_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+        self._weekly_data_cache = (mtime, data)
+        return data
+    
+    def _generate_fallback_html(self, context: Dict) -> str:
+        """Generate simple HTML newsletter if template fails"""
+        return _fallback_html(
+            context['generation_date'],
+            context['disclaimer'],
+            _titles(context, 'priority_alerts', 'Priority regulatory update'),
+            _titles(context, 'new_regulations', 'Regulatory update'),
+            _titles(context, 'implementation_tips', 'Compliance best practice'),
+            context['professional_contact']
+        )
+    
+    def _generate_fallback_text(self, context: Dict) -> str:
+        """Generate text newsletter if template fails"""
+        return _fallback_text(
+            context['week_ending'],
+            context['generation_date'],
+            context['disclaimer'],
+            _titles(context, 'priority_alerts', 'Alert'),
+            _titles(context, 'new_regulations', 'Update'),
+            context['professional_contact']
+        )
+
 class NewsletterService:
     """Complete newsletter service with privacy compliance"""
     
     def __init__(self):
         self.subscriber_manager = PrivacyCompliantSubscriberManager()
         self.newsletter_generator = NewsletterGenerator()
+        # Without an SMTP host, sends are only logged
+        self.smtp_config = _smtp_config_from_env()
+        self.send_limiter = get_rate_limiter('newsletter')
+        self._send_limiter_lock = threading.Lock()
+        # Unsubscribe links go to this endpoint when set, else to a mailto request
+        self.unsubscribe_base_url = os.environ.get('NEWSLETTER_UNSUBSCRIBE_URL')
     
     def send_weekly_newsletter(self):
-        """Send newsletter to all confirmed subscribers"""
+        """Send newsletter to all confirmed subscribers
+        
+        Async callers should await send_weekly_newsletter_async instead. Called
+        from inside a running event loop, this still works by sending from a
+        helper thread, but it blocks that loop until delivery finishes.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.send_weekly_newsletter_async())
+            return
+        
+        # asyncio.run cannot nest in a running loop, so delivery gets its own thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(asyncio.run, self.send_weekly_newsletter_async()).result()
+    
+    async def send_weekly_newsletter_async(self):
+        """Send newsletter to all confirmed subscribers without blocking the event loop"""
         logger.info("Starting weekly newsletter distribution")
         
-        # Cleanup expired subscriber data first
-        self.subscriber_manager.cleanup_expired_data()
+        # Cleanup expired subscriber data first; the store does blocking file I/O
+        await asyncio.to_thread(self.subscriber_manager.cleanup_expired_data)
         
         # Get active subscribers
-        subscribers = self.subscriber_manager.get_active_subscribers()
+        subscribers = await asyncio.to_thread(self.subscriber_manager.get_active_subscribers)
         if not subscribers:
             logger.info("No active subscribers for newsletter")
             return
         
         # Generate newsletter content
         content = self._prepare_newsletter_content()
-        html_content, text_content = self.newsletter_generator.generate_weekly_newsletter(content)
+        html_content, text_content = await asyncio.to_thread(
+            self.newsletter_generator.generate_weekly_newsletter, content
+        )
+        
+        # Encode the message once; each send only substitutes the recipient fields
+        message = self._build_message(html_content, text_content) if self.smtp_config else None
         
-        # Send to subscribers (implementation depends on email service)
+        # Send to subscribers
+        if self.smtp_config and AIOSMTPLIB_AVAILABLE:
+            sent_count = await self._deliver_async(subscribers, message)
+        else:
+            sent_count = await asyncio.to_thread(self._deliver_threaded, subscribers, message)
+        
+        logger.info(f"Newsletter distribution complete: {sent_count}/{len(subscribers)} sent")
+    
+    async def _deliver_async(self, subscribers: List[Subscriber], message: bytes) -> int:
+        """Send from concurrent coroutines, each with its own aiosmtplib connection"""
+        pending = iter(subscribers)
         sent_count = 0
-        for subscriber in subscribers:
+        
+        async def worker():
+            nonlocal sent_count
+            smtp = _AsyncPooledSMTP(self.smtp_config)
             try:
-                # This would integrate with your email service provider
-                self._send_email(subscriber, html_content, text_content)
-                sent_count += 1
-                logger.info(f"Newsletter sent to: {subscriber.email}")
-            except Exception as e:
-                logger.error(f"Failed to send newsletter to {subscriber.email}: {str(e)}")
+                # Workers share one iterator, so each subscriber is sent exactly once
+                for subscriber in pending:
+                    try:
+                        personalised = self._personalise_message(message, subscriber)
+                        # Stay under the provider's send rate
+                        while not self.send_limiter.is_allowed('smtp'):
+                            await asyncio.sleep(0.05)
+                        await smtp.send(subscriber.email, personalised)
+                        sent_count += 1
+                        logger.info(f"Newsletter sent to: {subscriber.email}")
+                    except Exception as e:
+                        logger.error(f"Failed to send newsletter to {subscriber.email}: {str(e)}")
+            finally:
+                await smtp.close()
         
-        logger.info(f"Newsletter distribution complete: {sent_count}/{len(subscribers)} sent")
+        await asyncio.gather(*(worker() for _ in range(min(_SEND_MAX_WORKERS, len(subscribers)))))
+        return sent_count
+    
+    def _deliver_threaded(self, subscribers: List[Subscriber], message: Optional[bytes]) -> int:
+        """Send from a thread pool; each worker thread keeps its own pooled SMTP connection"""
+        sent_count = 0
+        worker_state = threading.local()
+        connections = []
+        connections_lock = threading.Lock()
+        
+        def send(subscriber: Subscriber):
+            smtp = None
+            if self.smtp_config:
+                smtp = getattr(worker_state, 'smtp', None)
+                if smtp is None:
+                    smtp = worker_state.smtp = _PooledSMTP(self.smtp_config)
+                    with connections_lock:
+                        connections.append(smtp)
+            self._send_email(subscriber, message, smtp)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=_SEND_MAX_WORKERS) as pool:
+                for start in range(0, len(subscribers), _SEND_BATCH_SIZE):
+                    futures = {
+                        pool.submit(send, subscriber): subscriber
+                        for subscriber in subscribers[start:start + _SEND_BATCH_SIZE]
+                    }
+                    for future in as_completed(futures):
+                        subscriber = futures[future]
+                        try:
+                            future.result()
+                            sent_count += 1
+                            logger.info(f"Newsletter sent to: {subscriber.email}")
+                        except Exception as e:
+                            logger.error(f"Failed to send newsletter to {subscriber.email}: {str(e)}")
+        finally:
+            for smtp in connections:
+                smtp.close()
+        
+        return sent_count
     
     def _prepare_newsletter_content(self) -> NewsletterContent:
         """Prepare content for weekly newsletter"""
@@ -475,13 +1101,68 @@ class NewsletterService:
             implementation_tips=[]
         )
     
-    def _send_email(self, subscriber: Subscriber, html_content: str, text_content: str):
-        """Send email to subscriber (placeholder for email service integration)"""
-        # This would integrate with your chosen email service provider:
-        # - SendGrid, Mailgun, Amazon SES, etc.
-        # - Include proper unsubscribe links with tokens
-        # - Add required CAN-SPAM headers
-        logger.info(f"Email would be sent to: {subscriber.email}")
+    def _send_email(self, subscriber: Subscriber, message: Optional[bytes],
+                    smtp: Optional[_PooledSMTP] = None):
+        """Send email to subscriber over the pooled connection"""
+        if smtp is None:
+            logger.info(f"Email would be sent to: {subscriber.email}")
+            return
+        
+        personalised = self._personalise_message(message, subscriber)
+        
+        # Stay under the provider's send rate across all worker threads
+        with self._send_limiter_lock:
+            while not self.send_limiter.is_allowed('smtp'):
+                time.sleep(0.05)
+        smtp.send(subscriber.email, personalised)
+    
+    def _build_message(self, html_content: str, text_content: str) -> bytes:
+        """Encode the newsletter once, with placeholders for the recipient fields"""
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.nonmultipart import MIMENonMultipart
+        
+        message = MIMEMultipart('alternative')
+        message['Subject'] = _NEWSLETTER_SUBJECT
+        message['From'] = self.smtp_config['sender']
+        message['To'] = _TO_PLACEHOLDER
+        message['List-Unsubscribe'] = f"<{_LIST_UNSUBSCRIBE_PLACEHOLDER}>"
+        for subtype, body in (('plain', text_content), ('html', html_content)):
+            part = MIMENonMultipart('text', subtype, charset='utf-8')
+            part['Content-Transfer-Encoding'] = 'quoted-printable'
+            part.set_payload(_qp_body(body))
+            message.attach(part)
+        # SMTP wants CRLF line endings, and sendmail() leaves bytes untouched
+        return message.as_bytes(policy=message.policy.clone(linesep=_CRLF))
+    
+    def _personalise_message(self, message: bytes, subscriber: Subscriber) -> bytes:
+        """Fill one subscriber's address and unsubscribe link into the encoded message"""
+        unsubscribe_url = self._unsubscribe_url(subscriber.unsubscribe_token)
+        # _validate_email only admits [A-Za-z0-9._%+-@], which needs no HTML escaping
+        return (message
+                .replace(_TO_PLACEHOLDER.encode(), subscriber.email.encode())
+                .replace(_LIST_UNSUBSCRIBE_PLACEHOLDER.encode(), unsubscribe_url.encode())
+                .replace(_UNSUB_URL_PLACEHOLDER.encode(), _qp_value(unsubscribe_url))
+                .replace(_EMAIL_PLACEHOLDER.encode(), _qp_value(subscriber.email)))
+    
+    def _unsubscribe_url(self, token: str) -> str:
+        """One-click unsubscribe link for a subscriber's token"""
+        if self.unsubscribe_base_url:
+            return f"{self.unsubscribe_base_url}?token={token}"
+        return f"mailto:{self.smtp_config['sender']}?subject=unsubscribe%20{token}"
+
+# One service per process, so the compiled templates, in-memory subscribers
+# and token index are built once and shared by every caller
+_SERVICE: Optional[NewsletterService] = None
+_SERVICE_LOCK = threading.Lock()
+
+def get_service() -> NewsletterService:
+    """Shared NewsletterService for this process"""
+    global _SERVICE
+    if _SERVICE is None:
+        with _SERVICE_LOCK:
+            if _SERVICE is None:
+                _SERVICE = NewsletterService()
+    return _SERVICE
 
 def main():
     """Test newsletter service functionality"""
@@ -489,7 +1170,7 @@ def main():
     print("⚠️  INFORMATIONAL CONTENT ONLY - NOT LEGAL ADVICE")
     print("-" * 60)
     
-    service = NewsletterService()
+    service = get_service()
     
     # Example: Add test subscriber (in production, this would be via web form)
     success, message = service.subscriber_manager.add_subscriber(
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Optional Numba JIT support for AI Regulatory Watch
+
+Numeric kernels are decorated with cond_jit so they compile with Numba when it
+is installed and run as plain Python otherwise.
+"""
+
+import logging
+from typing import Any, Callable
+
+# Optional Numba import for compiled numeric kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_warned_no_numba = False
+
+def cond_jit(**options: Any) -> Callable[[Callable], Callable]:
+    """Decorate with numba.njit(cache=True, **options) when Numba is available"""
+    def decorator(func: Callable) -> Callable:
+        global _warned_no_numba
+        if NUMBA_AVAILABLE:
+            return njit(cache=True, **options)(func)
+        if not _warned_no_numba:
+            logger.info("Numba not installed; JIT kernels will run as plain Python")
+            _warned_no_numba = True
+        return func
+    return decorator
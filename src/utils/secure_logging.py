@@ -13,6 +13,34 @@ from pathlib import Path
 
 from .security import PIIProtector
 
+# Additional redaction patterns, fused into one alternation so a message is
+# scanned once; at any position the earlier alternative wins
+_PII_PATTERNS = (
+    # Email addresses - replace with redacted version
+    ('email', r'[a-zA-Z0-9._%+-]+@(?P<email_domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'),
+    # IP addresses
+    ('ip', r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'),
+    # Phone numbers (various formats)
+    ('phone', r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),
+    # Social Security Numbers
+    ('ssn', r'\b\d{3}-\d{2}-\d{4}\b'),
+    # Credit card numbers
+    ('cc', r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b'),
+)
+_PII_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in _PII_PATTERNS))
+_PII_REPLACEMENTS = {
+    'ip': '[IP_REDACTED]',
+    'phone': '[PHONE_REDACTED]',
+    'ssn': '[SSN_REDACTED]',
+    'cc': '[CC_REDACTED]',
+}
+
+def _redact_match(match: re.Match) -> str:
+    """Replacement for one _PII_RE match"""
+    if match.lastgroup == 'email':
+        return f"[EMAIL_REDACTED]@{match.group('email_domain')}"
+    return _PII_REPLACEMENTS[match.lastgroup]
+
 class PIIRedactingFormatter(logging.Formatter):
     """Custom formatter that redacts PII from log messages"""
     
@@ -24,23 +52,7 @@ class PIIRedactingFormatter(logging.Formatter):
         message = PIIProtector.sanitize_log_message(message)
         
         # Additional redaction patterns
-        patterns = {
-            # Email addresses - replace with redacted version
-            r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})': r'[EMAIL_REDACTED]@\2',
-            # IP addresses
-            r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b': '[IP_REDACTED]',
-            # Phone numbers (various formats)
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b': '[PHONE_REDACTED]',
-            # Social Security Numbers
-            r'\b\d{3}-\d{2}-\d{4}\b': '[SSN_REDACTED]',
-            # Credit card numbers
-            r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b': '[CC_REDACTED]',
-        }
-        
-        for pattern, replacement in patterns.items():
-            message = re.sub(pattern, replacement, message)
-        
-        return message
+        return _PII_RE.sub(_redact_match, message)
 
 class SecureFileHandler(logging.FileHandler):
     """File handler with secure permissions"""
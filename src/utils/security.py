@@ -24,6 +24,10 @@ import base64
 security_logger = logging.getLogger('security')
 security_logger.setLevel(logging.INFO)
 
+# Log sanitization patterns, compiled once rather than per message
+_LOG_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_LOG_IP_RE = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+
 class PIIProtector:
     """Protects personally identifiable information from exposure"""
     
@@ -53,13 +57,8 @@ class PIIProtector:
     @staticmethod
     def sanitize_log_message(message: str) -> str:
         """Remove PII from log messages"""
-        # Email pattern
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        message = re.sub(email_pattern, '[EMAIL_REDACTED]', message)
-        
-        # IP address pattern
-        ip_pattern = r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
-        message = re.sub(ip_pattern, '[IP_REDACTED]', message)
+        message = _LOG_EMAIL_RE.sub('[EMAIL_REDACTED]', message)
+        message = _LOG_IP_RE.sub('[IP_REDACTED]', message)
         
         return message
     
@@ -273,6 +272,7 @@ SECURITY_CONFIG = {
     'rate_limit': {
         'subscription': {'max_requests': 5, 'time_window': 3600},  # 5 per hour
         'api': {'max_requests': 100, 'time_window': 3600},  # 100 per hour
+        'newsletter': {'max_requests': 14, 'time_window': 1},  # 14 messages per second
     },
     'password_policy': {
         'min_length': 12,
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Infrastructure Manager
+
+Tests deployment manifests and recommendations built from the default
+user profiles, including the caches kept per profile.
+"""
+
+import pytest
+import time
+
+# Import the module under test
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from deployment.infrastructure_manager import InfrastructureManager, NUMPY_AVAILABLE
+
+class TestInfrastructureManager:
+    """Test suite for infrastructure management"""
+    
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Manager with the default profiles (no configuration file)"""
+        return InfrastructureManager(config_path=str(tmp_path / "infrastructure.yaml"))
+    
+    def test_cached_manifest_is_stamped_per_call(self, manager):
+        """Test that a cached manifest still carries the time of each call"""
+        profile_id = manager.list_user_profiles()[0]
+        first = manager.generate_deployment_manifest(profile_id)
+        time.sleep(0.001)
+        second = manager.generate_deployment_manifest(profile_id)
+        
+        assert second['metadata']['generated_at'] > first['metadata']['generated_at']
+        assert second['deployment_steps'] == first['deployment_steps']
+    
+    def test_touched_profile_refreshes_manifest_and_compliance(self, manager):
+        """Test that a recorded profile change drops its cached manifest and compliance bits"""
+        profile_id = manager.list_user_profiles()[0]
+        profile = manager.get_user_profile(profile_id)
+        manager.generate_deployment_manifest(profile_id)
+        # Size matches and security matches nothing, so compliance decides the threshold
+        request = {
+            'organization_size': 'small' if profile.max_users <= 100 else 'medium' if profile.max_users <= 500 else 'large',
+            'compliance_requirements': ['NEW_FRAMEWORK'],
+            'security_level': 'unknown'
+        }
+        assert profile_id not in [rec['profile_id'] for rec in manager.get_deployment_recommendations(request)]
+        
+        profile.compliance_requirements = ['NEW_FRAMEWORK']
+        manager._touch_profile(profile_id)
+        
+        manifest = manager.generate_deployment_manifest(profile_id)
+        assert manifest['requirements']['compliance'] == ['NEW_FRAMEWORK']
+        recommendations = manager.get_deployment_recommendations(request)
+        assert profile_id in [rec['profile_id'] for rec in recommendations]
+    
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_vectorized_scores_follow_new_profiles(self, manager, monkeypatch):
+        """Test that batch scoring matches the per-profile score and sees created profiles"""
+        monkeypatch.setattr(InfrastructureManager, '_VECTORIZE_MIN_PROFILES', 1)
+        request = manager._normalize_requirements({
+            'organization_size': 'large',
+            'compliance_requirements': ['SOX', 'NEW_FRAMEWORK'],
+            'security_level': 'high'
+        })
+        profile_ids, profiles, scores = manager._score_all(request)
+        expected = [manager._calculate_recommendation_score(profile, request) for profile in profiles]
+        assert scores.tolist() == pytest.approx(expected)
+        
+        manager.create_user_profile({
+            'profile_id': 'regional_bank',
+            'organization': 'Regional Bank',
+            'deployment_mode': 'hybrid',
+            'security_profile': 'financial',
+            'tier_level': 'enterprise',
+            'compliance_requirements': ['SOX', 'NEW_FRAMEWORK'],
+            'data_residency': 'US_EAST',
+            'max_users': 1000,
+            'max_devices': 5000,
+            'storage_requirements': '10TB',
+            'network_requirements': {'bandwidth': '10Gbps', 'latency': '<10ms'},
+            'backup_requirements': {'frequency': 'hourly', 'retention': '7years'}
+        })
+        
+        recommendations = manager.get_deployment_recommendations(request)
+        assert recommendations[0]['profile_id'] == 'regional_bank'
+        assert recommendations[0]['score'] == pytest.approx(1.0)
+
+if __name__ == "__main__":
+    # Run tests with verbose output
+    pytest.main([__file__, "-v", "--tb=short"])
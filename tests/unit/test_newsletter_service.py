@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the newsletter subscriber store and delivery
+
+Tests journal replay, torn-line recovery, compaction and retention of the
+subscriber store, including two managers sharing one data directory, and
+the per-subscriber personalisation of the encoded newsletter.
+"""
+
+import pytest
+import asyncio
+import email
+import json
+import time
+import logging
+import tempfile
+import shutil
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+# Import the module under test
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from newsletter import newsletter_service
+from newsletter.newsletter_service import PrivacyCompliantSubscriberManager, NewsletterContent
+
+class TestSubscriberStore:
+    """Test suite for subscriber persistence"""
+    
+    @pytest.fixture(autouse=True)
+    def quiet_manager(self):
+        """Plain logger and no confirmation emails while testing the store"""
+        with patch.object(newsletter_service, 'logger', logging.getLogger(__name__)), \
+                patch.object(PrivacyCompliantSubscriberManager, '_send_confirmation_email'):
+            yield
+    
+    @pytest.fixture
+    def data_dir(self):
+        """Create temporary subscriber data directory"""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+    
+    def _token(self, manager, email):
+        return manager._subs[email]['unsubscribe_token']
+    
+    def test_journal_replay(self, data_dir):
+        """Test that a new manager rebuilds state from the journal alone"""
+        manager = PrivacyCompliantSubscriberManager(data_dir)
+        manager.add_subscriber("a@example.com", {})
+        manager.add_subscriber("b@example.com", {})
+        manager.confirm_subscription(self._token(manager, "a@example.com"))
+        manager.unsubscribe(self._token(manager, "b@example.com"))
+        manager.close()
+        
+        assert not (Path(data_dir) / "subscribers.json").exists()
+        
+        reloaded = PrivacyCompliantSubscriberManager(data_dir)
+        assert reloaded._subs["a@example.com"]['status'] == 'confirmed'
+        assert reloaded._subs["b@example.com"]['status'] == 'unsubscribed'
+        assert reloaded._confirmed_count == 1
+        assert reloaded._token_index[self._token(manager, "a@example.com")] == "a@example.com"
+        assert [s.email for s in reloaded.get_active_subscribers()] == ["a@example.com"]
+    
+    def test_torn_journal_line_is_truncated(self, data_dir):
+        """Test that an interrupted final write is dropped and appends stay aligned"""
+        manager = PrivacyCompliantSubscriberManager(data_dir)
+        manager.add_subscriber("a@example.com", {})
+        manager.close()
+        
+        journal = Path(data_dir) / "subscribers.jsonl"
+        intact_size = journal.stat().st_size
+        with open(journal, 'ab') as f:
+            f.write(b'{"op":"upsert","email":"b@exa')
+        
+        reloaded = PrivacyCompliantSubscriberManager(data_dir)
+        assert list(reloaded._subs) == ["a@example.com"]
+        assert journal.stat().st_size == intact_size
+        
+        reloaded.add_subscriber("c@example.com", {})
+        reloaded.close()
+        assert sorted(PrivacyCompliantSubscriberManager(data_dir)._subs) == ["a@example.com", "c@example.com"]
+    
+    def test_compaction_folds_journal_into_snapshot(self, data_dir):
+        """Test that compaction writes the snapshot and removes the journal"""
+        manager = PrivacyCompliantSubscriberManager(data_dir)
+        manager.add_subscriber("a@example.com", {})
+        manager.confirm_subscription(self._token(manager, "a@example.com"))
+        manager.compact()
+        
+        assert not (Path(data_dir) / "subscribers.jsonl").exists()
+        snapshot = json.loads((Path(data_dir) / "subscribers.json").read_text())
+        assert snapshot["a@example.com"]['status'] == 'confirmed'
+        metadata = json.loads((Path(data_dir) / "metadata.json").read_text())
+        assert metadata['subscriber_count'] == 1
+        
+        # Later changes journal on top of the snapshot
+        manager.add_subscriber("b@example.com", {})
+        manager.close()
+        assert sorted(PrivacyCompliantSubscriberManager(data_dir)._subs) == ["a@example.com", "b@example.com"]
+    
+    def test_journal_compacts_past_threshold(self, data_dir):
+        """Test that the journal is compacted automatically once it grows"""
+        with patch.object(newsletter_service, '_JOURNAL_MIN_LINES', 4):
+            manager = PrivacyCompliantSubscriberManager(data_dir)
+            manager.add_subscriber("a@example.com", {})
+            token = self._token(manager, "a@example.com")
+            manager.confirm_subscription(token)
+            for _ in range(3):
+                manager.unsubscribe(token)
+            assert manager._journal_lines == 0
+            assert (Path(data_dir) / "subscribers.json").exists()
+            manager.close()
+        
+        assert PrivacyCompliantSubscriberManager(data_dir)._subs["a@example.com"]['status'] == 'unsubscribed'
+    
+    def test_compaction_keeps_other_writers_changes(self, data_dir):
+        """Test that compacting in one manager keeps changes journaled by another"""
+        web = PrivacyCompliantSubscriberManager(data_dir)
+        cron = PrivacyCompliantSubscriberManager(data_dir)
+        
+        web.add_subscriber("a@example.com", {})
+        web.confirm_subscription(self._token(web, "a@example.com"))
+        web.add_subscriber("b@example.com", {})
+        
+        # cron loaded before those writes; compacting must not drop them
+        cron.compact()
+        assert sorted(cron._subs) == ["a@example.com", "b@example.com"]
+        
+        # web's next write goes to the new journal, not the unlinked one
+        web.unsubscribe(self._token(web, "a@example.com"))
+        assert cron.get_active_subscribers() == []
+        
+        web.close()
+        cron.close()
+        reloaded = PrivacyCompliantSubscriberManager(data_dir)
+        assert reloaded._subs["a@example.com"]['status'] == 'unsubscribed'
+        assert reloaded._confirmed_count == 0
+    
+    def test_recreates_removed_data_dir(self, data_dir):
+        """Test that a manager recreates a data directory removed after an earlier one"""
+        PrivacyCompliantSubscriberManager(data_dir).close()
+        shutil.rmtree(data_dir)
+        
+        manager = PrivacyCompliantSubscriberManager(data_dir)
+        manager.add_subscriber("a@example.com", {})
+        manager.close()
+        assert (Path(data_dir) / "subscribers.jsonl").exists()
+    
+    def test_tokens_resolve_after_reload(self, data_dir):
+        """Test that confirm and unsubscribe find tokens in the index rebuilt on load"""
+        manager = PrivacyCompliantSubscriberManager(data_dir)
+        manager.add_subscriber("a@example.com", {})
+        token = self._token(manager, "a@example.com")
+        manager.close()
+        
+        reloaded = PrivacyCompliantSubscriberManager(data_dir)
+        assert reloaded.confirm_subscription(token)[0]
+        assert reloaded.unsubscribe(token)[0]
+        assert not reloaded.confirm_subscription("not-a-token")[0]
+        assert not reloaded.unsubscribe("not-a-token")[0]
+        reloaded.close()
+        
+        assert PrivacyCompliantSubscriberManager(data_dir)._subs["a@example.com"]['status'] == 'unsubscribed'
+    
+    def test_cleanup_deletes_legacy_unsubscribed_records(self, data_dir):
+        """Test that records with only the ISO unsubscribe date are expired and migrated"""
+        now = time.time()
+        manager = PrivacyCompliantSubscriberManager(data_dir)
+        for address in ("old@example.com", "recent@example.com", "active@example.com"):
+            manager.add_subscriber(address, {})
+        for address, age_days in (("old@example.com", 45), ("recent@example.com", 5)):
+            record = manager._subs[address]
+            record['status'] = 'unsubscribed'
+            record['unsubscribed_date'] = datetime.fromtimestamp(now - age_days * 86400).isoformat()
+            del record['unsubscribed_ts']
+        old_token = self._token(manager, "old@example.com")
+        
+        manager.cleanup_expired_data()
+        
+        assert sorted(manager._subs) == ["active@example.com", "recent@example.com"]
+        assert old_token not in manager._token_index
+        assert manager._subs["recent@example.com"]['unsubscribed_ts'] == pytest.approx(now - 5 * 86400, abs=2)
+        manager.close()
+        
+        snapshot = json.loads((Path(data_dir) / "subscribers.json").read_text())
+        assert sorted(snapshot) == ["active@example.com", "recent@example.com"]
+
+class TestNewsletterDelivery:
+    """Test suite for newsletter delivery"""
+    
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        """Service with its data and templates under tmp_path and no SMTP host"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('NEWSLETTER_SMTP_HOST', raising=False)
+        with patch.object(newsletter_service, 'logger', logging.getLogger(__name__)), \
+                patch.object(PrivacyCompliantSubscriberManager, '_send_confirmation_email'):
+            service = newsletter_service.NewsletterService()
+            yield service
+            service.subscriber_manager.close()
+    
+    def _confirmed(self, service, email):
+        manager = service.subscriber_manager
+        manager.add_subscriber(email, {})
+        manager.confirm_subscription(manager._subs[email]['unsubscribe_token'])
+    
+    def test_message_personalised_in_both_parts(self, service):
+        """Test that the encoded message gets the recipient and unsubscribe link in every part"""
+        self._confirmed(service, "a@example.com")
+        subscriber = service.subscriber_manager.get_active_subscribers()[0]
+        service.smtp_config = {'sender': 'news@example.com'}
+        service.unsubscribe_base_url = "https://example.com/unsubscribe"
+        content = NewsletterContent(
+            week_ending="July 4, 2025",
+            priority_alerts=[{'title': 'Test Alert'}],
+            new_regulations=[],
+            sector_updates={},
+            international_updates=[],
+            implementation_tips=[]
+        )
+        html, text = service.newsletter_generator.generate_weekly_newsletter(content)
+        
+        message = service._build_message(html, text)
+        personalised = email.message_from_bytes(service._personalise_message(message, subscriber))
+        
+        unsubscribe_url = f"https://example.com/unsubscribe?token={subscriber.unsubscribe_token}"
+        assert personalised['To'] == "a@example.com"
+        assert personalised['List-Unsubscribe'] == f"<{unsubscribe_url}>"
+        parts = {part.get_content_subtype(): part.get_payload(decode=True).decode('utf-8')
+                 for part in personalised.get_payload()}
+        assert sorted(parts) == ['html', 'plain']
+        for body in parts.values():
+            assert unsubscribe_url in body
+            assert "{{" not in body
+    
+    def test_send_from_running_event_loop(self, service):
+        """Test that the sync entry point also works when called inside an event loop"""
+        self._confirmed(service, "a@example.com")
+        
+        service.smtp_config = {'sender': 'news@example.com'}
+        
+        async def scheduler():
+            service.send_weekly_newsletter()
+        
+        with patch.object(newsletter_service, 'AIOSMTPLIB_AVAILABLE', True), \
+                patch.object(service, '_deliver_async', AsyncMock(return_value=1)) as mock_deliver:
+            asyncio.run(scheduler())
+        
+        subscribers, message = mock_deliver.await_args.args
+        assert [subscriber.email for subscriber in subscribers] == ["a@example.com"]
+        assert b"List-Unsubscribe" in message
+    
+    def test_send_async_entry_point(self, service):
+        """Test that the async entry point delivers to confirmed subscribers"""
+        self._confirmed(service, "a@example.com")
+        service.subscriber_manager.add_subscriber("pending@example.com", {})
+        
+        with patch.object(service, '_send_email') as mock_send:
+            asyncio.run(service.send_weekly_newsletter_async())
+        
+        assert [call.args[0].email for call in mock_send.call_args_list] == ["a@example.com"]
+
+if __name__ == "__main__":
+    # Run tests with verbose output
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Regulatory Module Loader
+
+Tests module discovery, the parsed-file and per-tier caches and pattern
+scanning against a temporary modules directory seeded with the default
+module definitions.
+"""
+
+import pytest
+import json
+import yaml
+from dataclasses import replace
+from unittest.mock import patch
+
+# Import the module under test
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.modules import regulatory_loader
+from src.modules.regulatory_loader import RegulatoryModuleLoader, ModuleStatus, TierLevel
+
+class TestRegulatoryModuleLoader:
+    """Test suite for regulatory module loading"""
+    
+    @pytest.fixture
+    def modules_dir(self, tmp_path):
+        """Empty modules directory; the loader fills in the default modules"""
+        return tmp_path / "definitions"
+    
+    def _write_patterns(self, modules_dir, file_name, patterns):
+        with open(modules_dir / "patterns" / file_name, 'w') as f:
+            yaml.safe_dump({'patterns': patterns}, f)
+    
+    def test_scan_uses_reloaded_patterns(self, modules_dir):
+        """Test that scan() rebuilds its cached regex when a module is reloaded"""
+        loader = RegulatoryModuleLoader(str(modules_dir))
+        loader.load_module('us_federal')
+        assert 'ftc_001' in loader.scan("The FTC issued an order")
+        
+        self._write_patterns(modules_dir, 'us_federal_patterns.yaml', [{
+            'id': 'consent_001',
+            'text': r'\bconsent decree\b',
+            'category': 'enforcement_risk',
+            'risk_weight': 2.0
+        }])
+        loader.reload_module('us_federal')
+        
+        assert loader.scan("The FTC issued a consent decree") == ['consent_001']
+    
+    def _available_ids(self, loader, tier=None):
+        return sorted(module.id for module in loader.get_available_modules(tier))
+    
+    def test_available_modules_follow_tier_and_edits(self, modules_dir):
+        """Test that the per-tier module cache is rebuilt when the tier is set"""
+        loader = RegulatoryModuleLoader(str(modules_dir))
+        aware = self._available_ids(loader)
+        assert 'func_ai_governance' not in aware
+        assert 'func_ai_governance' in self._available_ids(loader, TierLevel.TRANSFORMER)
+        
+        loader.available_modules['us_federal'] = replace(loader.available_modules['us_federal'], active=False)
+        loader.set_tier_level(TierLevel.TRANSFORMER)
+        
+        transformer = self._available_ids(loader)
+        assert 'us_federal' not in transformer
+        assert 'func_ai_governance' in transformer
+        assert loader.load_module('us_federal').status == ModuleStatus.DISABLED
+    
+    def test_module_cache_reparses_edited_files(self, modules_dir):
+        """Test that only files whose stamp changed are parsed again"""
+        RegulatoryModuleLoader(str(modules_dir))
+        # The first run writes the defaults; the second parses and caches them
+        RegulatoryModuleLoader(str(modules_dir))
+        assert (modules_dir / ".module_cache.json").exists()
+        
+        module_file = modules_dir / "us_federal.yaml"
+        module_data = yaml.safe_load(module_file.read_text())
+        module_data['name'] = 'US Federal Regulations (edited)'
+        module_file.write_text(yaml.safe_dump(module_data))
+        
+        with patch.object(regulatory_loader, '_parse_yaml_files',
+                          wraps=regulatory_loader._parse_yaml_files) as mock_parse:
+            loader = RegulatoryModuleLoader(str(modules_dir))
+        
+        assert mock_parse.call_args.args[0] == [str(module_file)]
+        assert loader.available_modules['us_federal'].name == 'US Federal Regulations (edited)'
+    
+    def test_unreadable_module_cache_is_ignored(self, modules_dir):
+        """Test that a corrupt cache file falls back to parsing and is rewritten"""
+        expected = sorted(RegulatoryModuleLoader(str(modules_dir)).available_modules)
+        cache_file = modules_dir / ".module_cache.json"
+        cache_file.write_text('{"us_federal.yaml": [not json')
+        
+        loader = RegulatoryModuleLoader(str(modules_dir))
+        
+        assert sorted(loader.available_modules) == expected
+        assert 'us_federal.yaml' in json.loads(cache_file.read_text())
+
+if __name__ == "__main__":
+    # Run tests with verbose output
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -8,9 +8,11 @@ Ensures reliable regulatory information processing without external dependencies
 
 import pytest
 import asyncio
+import io
 import json
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
+import feedparser
 import tempfile
 import shutil
 from pathlib import Path
@@ -20,6 +22,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from monitors import rss_monitor
 from monitors.rss_monitor import RSSMonitor, RegulatoryItem, MonitoringResult
 
 class TestRSSMonitor:
@@ -121,27 +124,26 @@ class TestRSSMonitor:
         assert len(id1) == 32, "ID should be 32-character MD5 hash"
     
     @patch('monitors.rss_monitor.requests.Session.get')
-    @patch('monitors.rss_monitor.feedparser.parse')
-    async def test_monitor_feed_success(self, mock_feedparser, mock_get, mock_rss_monitor, sample_feed_data):
+    @patch('monitors.rss_monitor._parse_feed_bytes')
+    async def test_monitor_feed_success(self, mock_parse_feed, mock_get, mock_rss_monitor, sample_feed_data):
         """Test successful RSS feed monitoring"""
-        # Mock HTTP response
+        # Mock HTTP response; the body is read from the raw stream
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = sample_feed_data.encode()
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(sample_feed_data.encode())
         mock_get.return_value = mock_response
         mock_response.raise_for_status.return_value = None
         
-        # Mock feedparser
-        mock_feed = Mock()
-        mock_feed.entries = [
-            Mock(
+        # Mock feed parsing
+        mock_parse_feed.return_value = [
+            feedparser.FeedParserDict(
                 title="FTC Announces New AI Guidance",
                 description="AI guidance for healthcare",
                 link="https://ftc.gov/news/ai-guidance",
-                published_parsed=(2024, 7, 20, 10, 0, 0, 0, 0, 0)
+                published_parsed=(datetime.now() - timedelta(days=1)).timetuple()
             )
         ]
-        mock_feedparser.return_value = mock_feed
         
         # Test feed configuration
         feed_config = {
@@ -154,6 +156,9 @@ class TestRSSMonitor:
         items = await mock_rss_monitor.monitor_feed(feed_config)
         
         # Verify results
+        mock_parse_feed.assert_called_once_with(
+            sample_feed_data.encode(), mock_rss_monitor.config['monitoring']['max_items_per_feed']
+        )
         assert len(items) > 0, "Should find regulatory items with AI keywords"
         item = items[0]
         assert isinstance(item, RegulatoryItem)
@@ -187,18 +192,18 @@ class TestRSSMonitor:
         with patch.object(mock_rss_monitor, '_generate_item_id', return_value=test_id):
             with patch('monitors.rss_monitor.requests.Session.get') as mock_get:
                 mock_response = Mock()
-                mock_response.content = b"<rss><channel><item><title>Test</title></item></channel></rss>"
+                mock_response.status_code = 200
+                mock_response.headers = {}
+                mock_response.raw = io.BytesIO(b"<rss><channel><item><title>Test</title></item></channel></rss>")
                 mock_get.return_value = mock_response
                 
-                with patch('monitors.rss_monitor.feedparser.parse') as mock_parse:
-                    mock_feed = Mock()
-                    mock_feed.entries = [Mock(
+                with patch('monitors.rss_monitor._parse_feed_bytes') as mock_parse:
+                    mock_parse.return_value = [feedparser.FeedParserDict(
                         title="Test Item",
                         description="Test description",
                         link="https://test.com",
-                        published_parsed=(2024, 7, 20, 10, 0, 0, 0, 0, 0)
+                        published_parsed=(datetime.now() - timedelta(days=1)).timetuple()
                     )]
-                    mock_parse.return_value = mock_feed
                     
                     items = await mock_rss_monitor.monitor_feed({
                         'name': 'Test',
@@ -208,6 +213,44 @@ class TestRSSMonitor:
                     
                     assert len(items) == 0, "Duplicate items should be filtered out"
     
+    def test_feed_read_stops_after_max_items(self):
+        """Test that reading stops at the max_items-th entry and the prefix parses as the feed"""
+        entries = "".join(
+            f'<entry><title>Entry {i}</title><link href="news/{i}"/><id>urn:{i}</id></entry>'
+            for i in range(20)
+        )
+        body = ('<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom" '
+                f'xml:base="https://eu.example/"><title>Feed</title>{entries}</feed>').encode()
+        stream = io.BytesIO(body)
+        
+        with patch.object(rss_monitor, '_FEED_READ_CHUNK', 128):
+            prefix = rss_monitor._read_feed_body(stream, 3)
+        
+        assert stream.tell() < len(body), "Should stop reading once enough entries arrived"
+        parsed = rss_monitor._parse_feed_bytes(prefix, 3)
+        assert [entry.title for entry in parsed] == ["Entry 0", "Entry 1", "Entry 2"]
+        assert parsed[2].link == "https://eu.example/news/2"
+    
+    def test_feed_read_falls_back_to_whole_body(self):
+        """Test that a feed expat cannot scan is read and parsed in full"""
+        items = "".join(f"<item><title>Item {i}</title><description>a&nbsp;b</description></item>"
+                        for i in range(5))
+        body = f"<rss><channel><title>Feed</title>{items}</channel></rss>".encode()
+        
+        assert rss_monitor._read_feed_body(io.BytesIO(body), 2) == body
+        assert len(rss_monitor._parse_feed_bytes(body, 2)) == 2
+    
+    def test_parse_pool_returns_entries(self):
+        """Test that feeds parsed in worker processes come back as feedparser entries"""
+        body = b"<rss><channel><title>Feed</title><item><title>One</title></item><item><title>Two</title></item></channel></rss>"
+        try:
+            entries = rss_monitor._get_parse_pool(1).submit(rss_monitor._parse_feed_bytes, body, 1).result(timeout=60)
+        finally:
+            rss_monitor._shutdown_parse_pool()
+        
+        assert [entry.title for entry in entries] == ["One"]
+        assert rss_monitor._PARSE_POOL is None
+    
     def test_date_filtering(self, mock_rss_monitor):
         """Test filtering of items older than lookback period"""
         cutoff_days = mock_rss_monitor.config['monitoring']['lookback_days']
@@ -240,7 +283,7 @@ class TestRSSMonitor:
         for item_id in test_ids:
             assert item_id in loaded_items, f"Processed item {item_id} should be loaded"
     
-    @patch('monitors.rss_monitor.json.dump')
+    @patch('monitors.rss_monitor._dump_json', return_value=b'{}')
     async def test_regulatory_items_saving(self, mock_json_dump, mock_rss_monitor):
         """Test that regulatory items are saved correctly"""
         sample_items = [
@@ -263,7 +306,7 @@ class TestRSSMonitor:
         # Verify JSON dump was called
         assert mock_json_dump.called, "Should save items as JSON"
         
-        # Check the data structure passed to json.dump
+        # Check the data structure passed to the JSON serializer
         call_args = mock_json_dump.call_args[0][0]
         assert 'timestamp' in call_args
         assert 'item_count' in call_args